@@ -12,6 +12,7 @@ Key Components:
 - CoderAgent: Autonomous code generation with WorktreeManager integration
 - PlannerAgent: Task decomposition with God Mode Impact Analysis
 - SessionOrchestrator: Session lifecycle management
+- LLMCache: Response cache for deterministic model calls
 
 Example usage:
     from agents import CoderAgent, PlannerAgent, AgentContext, AgentConfig
@@ -33,6 +34,9 @@ Example usage:
     state = await coder.run()
 """
 
+import importlib
+from typing import Any
+
 from .base import (
     AgentCallback,
     AgentConfig,
@@ -45,32 +49,55 @@ from .base import (
     BaseAgent,
     ErrorSeverity,
 )
-from .coder import (
-    CodeGenerationResult,
-    CoderAgent,
-    DiffChunker,
-    FileChange,
-    WorktreeIntegration,
-    count_affected_files,
-    run_autonomous_agent,
-    validate_diff_size,
-)
-from .planner import (
-    ExecutionPlan,
-    PlannedTask,
-    PlannerAgent,
-    TaskPriority,
-    TaskType,
-    run_followup_planner,
-)
-from .session import (
-    ConversationMessage,
-    SessionData,
-    SessionOrchestrator,
-    SessionStore,
-    post_session_processing,
-    run_agent_session,
-)
+
+# Heavier submodules are imported on first attribute access (PEP 562) so
+# that importing the base types does not pull in coder/planner/session.
+_LAZY_IMPORTS: dict[str, str] = {
+    # Cache
+    "CacheBackend": ".cache",
+    "LLMCache": ".cache",
+    "MemoryBackend": ".cache",
+    # Coder
+    "CodeGenerationResult": ".coder",
+    "CoderAgent": ".coder",
+    "DiffChunker": ".coder",
+    "FileChange": ".coder",
+    "FileChangeStore": ".coder",
+    "WorktreeIntegration": ".coder",
+    "count_affected_files": ".coder",
+    "run_autonomous_agent": ".coder",
+    "validate_diff_size": ".coder",
+    # Planner
+    "ExecutionPlan": ".planner",
+    "PlannedTask": ".planner",
+    "PlannerAgent": ".planner",
+    "TaskPriority": ".planner",
+    "TaskType": ".planner",
+    "run_followup_planner": ".planner",
+    # Session
+    "AsyncSessionWriter": ".async_writer",
+    "ConversationMessage": ".session",
+    "SessionData": ".session",
+    "SessionOrchestrator": ".session",
+    "SessionStore": ".session",
+    "post_session_processing": ".session",
+    "run_agent_session": ".session",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     # Base
@@ -84,11 +111,16 @@ __all__ = [
     "AgentStatus",
     "BaseAgent",
     "ErrorSeverity",
+    # Cache
+    "CacheBackend",
+    "LLMCache",
+    "MemoryBackend",
     # Coder
     "CodeGenerationResult",
     "CoderAgent",
     "DiffChunker",
     "FileChange",
+    "FileChangeStore",
     "WorktreeIntegration",
     "count_affected_files",
     "run_autonomous_agent",
@@ -101,6 +133,7 @@ __all__ = [
     "TaskType",
     "run_followup_planner",
     # Session
+    "AsyncSessionWriter",
     "ConversationMessage",
     "SessionData",
     "SessionOrchestrator",
@@ -0,0 +1,101 @@
+"""
+Coalescing background writer for session persistence.
+
+Part of Claude God Code - Autonomous Excellence
+
+Chatty sessions mutate their state on every message. Writing each mutation
+straight to disk re-serializes the whole session every time; this module
+instead remembers only the latest state per session and writes it once per
+flush interval from a background task.
+"""
+
+import asyncio
+import inspect
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Seconds to keep collecting saves before a background flush
+FLUSH_INTERVAL_SECONDS = 0.1
+
+
+class AsyncSessionWriter:
+    """Coalesces scheduled saves per key and writes the latest one in the background."""
+
+    def __init__(
+        self,
+        write: Callable[[Any], Optional[Awaitable[None]]],
+        interval: float = FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        """Initialize writer around a write function.
+
+        The function may return an awaitable, which flush() waits on.
+        """
+        self._write = write
+        self.interval = interval
+        self._pending: dict[str, Any] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def schedule(self, key: str, item: Any) -> None:
+        """Queue item for writing, replacing any unwritten item for key.
+
+        Without a running event loop the item is written immediately.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._pending.pop(key, None)
+            self._write(item)
+            return
+
+        self._pending[key] = item
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._flush_later())
+
+    def discard(self, key: str) -> None:
+        """Forget any unwritten item for key."""
+        self._pending.pop(key, None)
+
+    def has_pending(self, key: Optional[str] = None) -> bool:
+        """Check whether anything (or anything for key) is waiting to be written."""
+        if key is None:
+            return bool(self._pending)
+        return key in self._pending
+
+    async def flush(self, key: Optional[str] = None) -> None:
+        """Write pending items now, either all of them or only the one for key."""
+        if key is None:
+            pending, self._pending = self._pending, {}
+            for item_key, item in pending.items():
+                await self._write_logged(item_key, item)
+        elif key in self._pending:
+            await self._write_logged(key, self._pending.pop(key))
+
+    async def close(self) -> None:
+        """Write everything pending and stop the background task."""
+        await self.flush()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    async def _flush_later(self) -> None:
+        """Wait one interval, then write until nothing is left pending.
+
+        Items scheduled while a write is in flight see this task still running
+        and do not start another, so they are picked up by the next round.
+        """
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush()
+            if not self._pending:
+                return
+
+    async def _write_logged(self, key: str, item: Any) -> None:
+        """Write one item, logging instead of raising on failure."""
+        try:
+            result = self._write(item)
+            if inspect.isawaitable(result):
+                await result
+        except Exception:
+            logger.exception(f"Background write failed for {key}")
@@ -8,15 +8,54 @@ in the system. It provides a unified interface for agent behavior, error
 handling, and state management.
 """
 
+import asyncio
+import contextlib
+import inspect
+import json
+import logging
+import sys
+import time
+import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Optional, Protocol
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+    runtime_checkable,
+)
 
 if TYPE_CHECKING:
     from skills import Skill, SkillRegistry
 
+    from .cache import LLMCache
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Capacity of the background notification queue; events beyond it are dropped
+EVENT_QUEUE_SIZE = 1024
+# Maximum events delivered per wake-up of the notification drain task
+EVENT_BATCH_SIZE = 64
+# Default number of most recent errors kept on an AgentState
+MAX_ERRORS_RETAINED = 100
+
 
 class AgentPhase(Enum):
     """Phases an agent can be in during execution."""
@@ -50,14 +89,63 @@ class ErrorSeverity(Enum):
     FATAL = "fatal"
 
 
-@dataclass
+# Precomputed member -> value table so serialization skips the Enum
+# ``.value`` descriptor on every progress/error callback.
+_ENUM_VALUES: dict[Enum, str] = {
+    member: member.value
+    for enum_cls in (AgentPhase, AgentStatus, ErrorSeverity)
+    for member in enum_cls
+}
+
+# Shared placeholder for AgentState containers that have not been written yet
+_EMPTY: tuple[()] = ()
+
+# Default phase transition messages for every (old, new) phase pair
+_TRANSITION_MESSAGES: dict[tuple[AgentPhase, AgentPhase], str] = {
+    (old, new): f"Transitioned from {old.value} to {new.value}"
+    for old in AgentPhase
+    for new in AgentPhase
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Encode values that have no native JSON representation."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, Path):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to JSON bytes, compact unless indented, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_json_default, option=option)
+    if indent:
+        return json.dumps(obj, default=_json_default, indent=2).encode("utf-8")
+    return json.dumps(obj, default=_json_default, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@dataclass(slots=True)
 class AgentError:
     """Represents an error that occurred during agent execution."""
 
     message: str
     severity: ErrorSeverity
     phase: AgentPhase
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: int = field(default_factory=time.time_ns)  # Wall clock, ns since epoch
     exception: Optional[Exception] = None
     context: dict[str, Any] = field(default_factory=dict)
 
@@ -69,16 +157,23 @@ class AgentError:
         """Convert to dictionary for serialization."""
         return {
             "message": self.message,
-            "severity": self.severity.value,
-            "phase": self.phase.value,
-            "timestamp": self.timestamp.isoformat(),
+            "severity": _ENUM_VALUES[self.severity],
+            "phase": _ENUM_VALUES[self.phase],
+            "timestamp": datetime.fromtimestamp(self.timestamp / 1_000_000_000).isoformat(),
             "context": self.context,
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes."""
+        return json_dumps(self.to_dict())
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
-    """Configuration for agent behavior."""
+    """Configuration for agent behavior.
+
+    Frozen so instances are hashable and safe to share between agents.
+    """
 
     # Model settings
     model: str = "claude-sonnet-4-20250514"
@@ -96,6 +191,7 @@ class AgentConfig:
     auto_continue_max: int = 10
 
     # Safety settings
+    max_errors_retained: int = MAX_ERRORS_RETAINED
     require_impact_analysis: bool = True
     max_files_per_change: int = 20
     max_diff_lines: int = 5000
@@ -109,25 +205,36 @@ class AgentConfig:
     cleanup_on_success: bool = False
     cleanup_on_failure: bool = False
 
+    # Response cache for deterministic (temperature 0) model calls
+    llm_cache: Optional["LLMCache"] = field(default=None, compare=False)
+
     def validate(self) -> list[str]:
         """Validate configuration and return list of issues."""
-        issues = []
+        return list(_validate_config(self))
 
-        if self.max_iterations < 1:
-            issues.append("max_iterations must be at least 1")
-        if self.max_retries < 0:
-            issues.append("max_retries cannot be negative")
-        if self.timeout_seconds <= 0:
-            issues.append("timeout_seconds must be positive")
-        if self.max_files_per_change < 1:
-            issues.append("max_files_per_change must be at least 1")
-        if not 0 <= self.temperature <= 2:
-            issues.append("temperature must be between 0 and 2")
 
-        return issues
+@lru_cache(maxsize=128)
+def _validate_config(config: AgentConfig) -> tuple[str, ...]:
+    """Validate a configuration once per distinct set of values."""
+    issues = []
 
+    if config.max_iterations < 1:
+        issues.append("max_iterations must be at least 1")
+    if config.max_retries < 0:
+        issues.append("max_retries cannot be negative")
+    if config.timeout_seconds <= 0:
+        issues.append("timeout_seconds must be positive")
+    if config.max_files_per_change < 1:
+        issues.append("max_files_per_change must be at least 1")
+    if config.max_errors_retained < 1:
+        issues.append("max_errors_retained must be at least 1")
+    if not 0 <= config.temperature <= 2:
+        issues.append("temperature must be between 0 and 2")
 
-@dataclass
+    return tuple(issues)
+
+
+@dataclass(slots=True)
 class AgentMetrics:
     """Metrics collected during agent execution."""
 
@@ -140,15 +247,20 @@ class AgentMetrics:
     errors_encountered: int = 0
     retries_performed: int = 0
 
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    # Monotonic clock readings (time.monotonic_ns), immune to wall-clock jumps
+    start_time: Optional[int] = None
+    end_time: Optional[int] = None
+
+    def get_duration_ns(self) -> int:
+        """Get total execution duration in nanoseconds."""
+        if self.start_time is None:
+            return 0
+        end = self.end_time or time.monotonic_ns()
+        return end - self.start_time
 
     def get_duration_seconds(self) -> float:
         """Get total execution duration in seconds."""
-        if self.start_time is None:
-            return 0.0
-        end = self.end_time or datetime.now()
-        return (end - self.start_time).total_seconds()
+        return self.get_duration_ns() / 1_000_000_000
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -164,8 +276,12 @@ class AgentMetrics:
             "duration_seconds": self.get_duration_seconds(),
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes."""
+        return json_dumps(self.to_dict())
+
 
-@dataclass
+@dataclass(slots=True)
 class AgentState:
     """Current state of an agent during execution."""
 
@@ -175,12 +291,17 @@ class AgentState:
     # Execution tracking
     current_iteration: int = 0
     current_task: Optional[str] = None
-    pending_tasks: list[str] = field(default_factory=list)
-    completed_tasks: list[str] = field(default_factory=list)
-
-    # Error tracking
-    errors: list[AgentError] = field(default_factory=list)
+    # Insertion-ordered sets: O(1) membership and removal, stable order.
+    # Task and error containers start as the shared _EMPTY tuple and are
+    # only allocated on first write, so short-lived agents skip them.
+    pending_tasks: Union[dict[str, None], tuple[()]] = _EMPTY
+    completed_tasks: Union[dict[str, None], tuple[()]] = _EMPTY
+
+    # Error tracking: only the most recent max_errors are kept
+    errors: Union[deque[AgentError], tuple[()]] = _EMPTY
+    max_errors: int = MAX_ERRORS_RETAINED
     last_error: Optional[AgentError] = None
+    _has_fatal: bool = field(default=False, init=False, repr=False, compare=False)
 
     # Results
     result: Optional[str] = None
@@ -191,20 +312,24 @@ class AgentState:
 
     def add_error(self, error: AgentError) -> None:
         """Add an error to the state."""
+        if self.errors is _EMPTY:
+            self.errors = deque(maxlen=self.max_errors)
         self.errors.append(error)
         self.last_error = error
         self.metrics.errors_encountered += 1
 
         if error.severity == ErrorSeverity.FATAL:
+            self._has_fatal = True
             self.status = AgentStatus.FAILED
             self.phase = AgentPhase.FAILED
 
     def complete_task(self, task: str) -> None:
         """Mark a task as completed."""
-        if task in self.pending_tasks:
-            self.pending_tasks.remove(task)
-        if task not in self.completed_tasks:
-            self.completed_tasks.append(task)
+        if self.pending_tasks:
+            self.pending_tasks.pop(task, None)
+        if self.completed_tasks is _EMPTY:
+            self.completed_tasks = {}
+        self.completed_tasks.setdefault(task, None)
         self.current_task = None
 
     def is_running(self) -> bool:
@@ -217,23 +342,28 @@ class AgentState:
 
     def has_fatal_error(self) -> bool:
         """Check if a fatal error has occurred."""
-        return any(e.severity == ErrorSeverity.FATAL for e in self.errors)
+        return self._has_fatal
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
-            "status": self.status.value,
-            "phase": self.phase.value,
+            "status": _ENUM_VALUES[self.status],
+            "phase": _ENUM_VALUES[self.phase],
             "current_iteration": self.current_iteration,
             "current_task": self.current_task,
-            "pending_tasks": self.pending_tasks,
-            "completed_tasks": self.completed_tasks,
+            "pending_tasks": list(self.pending_tasks),
+            "completed_tasks": list(self.completed_tasks),
             "errors": [e.to_dict() for e in self.errors],
             "result": self.result,
             "metrics": self.metrics.to_dict(),
         }
 
+    def to_json(self) -> bytes:
+        """Serialize to JSON bytes."""
+        return json_dumps(self.to_dict())
+
 
+@runtime_checkable
 class AgentCallback(Protocol):
     """Protocol for agent callbacks."""
 
@@ -248,7 +378,11 @@ class AgentCallback(Protocol):
         ...
 
 
-@dataclass
+def _noop_callback(*args: Any, **kwargs: Any) -> None:
+    """Default callback that ignores every notification."""
+
+
+@dataclass(slots=True)
 class AgentContext:
     """Context provided to agents for execution."""
 
@@ -265,8 +399,8 @@ class AgentContext:
     config: AgentConfig = field(default_factory=AgentConfig)
 
     # Callbacks
-    on_progress: Optional[AgentCallback] = None
-    on_error: Optional[AgentCallback] = None
+    on_progress: AgentCallback = _noop_callback
+    on_error: AgentCallback = _noop_callback
 
     # Session data
     session_id: Optional[str] = None
@@ -275,9 +409,96 @@ class AgentContext:
     # Memory context
     memory_context: dict[str, Any] = field(default_factory=dict)
 
+    # Resolved working directory; update through set_worktree()
+    _cwd: Path = field(init=False, repr=False, compare=False)
+
+    # Background notification dispatch (see start_event_dispatch)
+    _event_queue: Optional[asyncio.Queue] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _drain_task: Optional["asyncio.Task[None]"] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Resolve the working directory once and normalize callbacks."""
+        self._cwd = self.worktree_path or self.repo_root
+        if self.on_progress is None:
+            self.on_progress = _noop_callback
+        if self.on_error is None:
+            self.on_error = _noop_callback
+
     def get_working_directory(self) -> Path:
         """Get the directory where agent should work."""
-        return self.worktree_path or self.repo_root
+        return self._cwd
+
+    def set_worktree(self, worktree_path: Optional[Path]) -> None:
+        """Set the worktree path and refresh the working directory."""
+        self.worktree_path = worktree_path
+        self._cwd = worktree_path or self.repo_root
+
+    def start_event_dispatch(self, maxsize: int = EVENT_QUEUE_SIZE) -> None:
+        """Deliver callbacks from a background task instead of inline.
+
+        Must be called from a running event loop. While active, notifications
+        are queued and never block the agent; if the queue is full the event
+        is dropped. Callbacks may be coroutine functions.
+        """
+        if self._drain_task is not None:
+            return
+
+        self._event_queue = asyncio.Queue(maxsize=maxsize)
+        self._drain_task = asyncio.get_running_loop().create_task(self._drain_events())
+
+    async def stop_event_dispatch(self) -> None:
+        """Flush queued events and return to inline callback delivery."""
+        if self._drain_task is None or self._event_queue is None:
+            return
+
+        await self._event_queue.join()
+        self._drain_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._drain_task
+
+        self._event_queue = None
+        self._drain_task = None
+
+    async def _drain_events(self) -> None:
+        """Deliver queued events in batches until cancelled."""
+        queue = self._event_queue
+        assert queue is not None
+
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < EVENT_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for callback, args in batch:
+                try:
+                    result = callback(*args)
+                    if inspect.isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception("Agent callback failed")
+                finally:
+                    queue.task_done()
+
+    def _dispatch(
+        self,
+        callback: AgentCallback,
+        args: tuple[str, AgentPhase, str, Optional[dict[str, Any]]],
+    ) -> None:
+        """Invoke a callback inline, or enqueue it when dispatch is active."""
+        if self._event_queue is None:
+            callback(*args)
+            return
+        if callback is _noop_callback:
+            return
+
+        try:
+            self._event_queue.put_nowait((callback, args))
+        except asyncio.QueueFull:
+            logger.warning(f"Agent event queue full, dropping event: {args[2]}")
 
     def notify_progress(
         self,
@@ -286,9 +507,8 @@ class AgentContext:
         message: str,
         data: Optional[dict[str, Any]] = None,
     ) -> None:
-        """Notify progress if callback is set."""
-        if self.on_progress:
-            self.on_progress(agent_id, phase, message, data)
+        """Notify the progress callback."""
+        self._dispatch(self.on_progress, (agent_id, phase, message, data))
 
     def notify_error(
         self,
@@ -297,22 +517,27 @@ class AgentContext:
         message: str,
         data: Optional[dict[str, Any]] = None,
     ) -> None:
-        """Notify error if callback is set."""
-        if self.on_error:
-            self.on_error(agent_id, phase, message, data)
+        """Notify the error callback."""
+        self._dispatch(self.on_error, (agent_id, phase, message, data))
 
 
 class BaseAgent:
     """Base class for all agents in Claude God Code."""
 
     _skill_registry: Optional["SkillRegistry"] = None
+    _id_prefix: str = sys.intern("BaseAgent_")
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._id_prefix = sys.intern(f"{cls.__name__}_")
 
     def __init__(self, context: AgentContext) -> None:
         """Initialize agent with context."""
         self.context = context
-        self.state = AgentState()
-        self._agent_id = f"{self.__class__.__name__}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.state = AgentState(max_errors=context.config.max_errors_retained)
+        self._agent_id = self._id_prefix + uuid.uuid4().hex[:12]
         self._loaded_skills: list["Skill"] = []
+        self._cancel_event = asyncio.Event()
 
     @classmethod
     def get_skill_registry(cls) -> "SkillRegistry":
@@ -377,7 +602,12 @@ class BaseAgent:
         """Get unique agent identifier."""
         return self._agent_id
 
-    def _transition_phase(self, new_phase: AgentPhase, message: str = "") -> None:
+    def _transition_phase(
+        self,
+        new_phase: AgentPhase,
+        message: str = "",
+        data: Optional[dict[str, Any]] = None,
+    ) -> None:
         """Transition to a new phase."""
         old_phase = self.state.phase
         self.state.phase = new_phase
@@ -385,7 +615,8 @@ class BaseAgent:
         self.context.notify_progress(
             self.agent_id,
             new_phase,
-            message or f"Transitioned from {old_phase.value} to {new_phase.value}",
+            message or _TRANSITION_MESSAGES[(old_phase, new_phase)],
+            data,
         )
 
     def _record_error(
@@ -405,24 +636,80 @@ class BaseAgent:
         )
         self.state.add_error(error)
 
-        self.context.notify_error(
-            self.agent_id,
-            self.state.phase,
-            message,
-            {"severity": severity.value, "context": context},
-        )
+        # Only build the callback payload when someone is listening
+        if self.context.on_error is not _noop_callback:
+            self.context.notify_error(
+                self.agent_id,
+                self.state.phase,
+                message,
+                {"severity": _ENUM_VALUES[severity], "context": context},
+            )
 
         return error
 
+    async def _cached_llm_call(
+        self,
+        messages: list[dict[str, Any]],
+        call: Callable[[], Awaitable[Any]],
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> Any:
+        """Run a model call, reusing a cached response when deterministic."""
+        config = self.context.config
+        cache = config.llm_cache
+        if cache is None or not cache.is_cacheable(config.temperature):
+            return await call()
+
+        key = cache.cache_key(
+            config.model,
+            messages,
+            config.temperature,
+            config.max_tokens,
+            tools,
+        )
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = await call()
+        await cache.set(key, response)
+        return response
+
     async def run(self) -> AgentState:
         """Run the agent. Must be implemented by subclasses."""
         raise NotImplementedError("Subclasses must implement run()")
 
     async def cancel(self) -> None:
         """Cancel the agent execution."""
+        self._cancel_event.set()
         self.state.status = AgentStatus.CANCELLED
         self._transition_phase(AgentPhase.FAILED, "Agent cancelled")
 
+    def is_cancelled(self) -> bool:
+        """Check if cancel() has been requested."""
+        return self._cancel_event.is_set()
+
+    async def _interruptible(self, awaitable: Awaitable[T]) -> T:
+        """Await work, aborting with CancelledError as soon as cancel() is called."""
+        if self._cancel_event.is_set():
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            raise asyncio.CancelledError("Agent cancelled")
+
+        work = asyncio.ensure_future(awaitable)
+        cancel_wait = asyncio.ensure_future(self._cancel_event.wait())
+        try:
+            await asyncio.wait({work, cancel_wait}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            cancel_wait.cancel()
+            # Also reached when the caller itself is cancelled; never leave work detached
+            if not work.done():
+                work.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await work
+                raise asyncio.CancelledError("Agent cancelled")
+
+        return work.result()
+
     def get_state(self) -> AgentState:
         """Get current agent state."""
         return self.state
@@ -0,0 +1,123 @@
+"""
+LLM response cache for deterministic agent calls.
+
+Part of Claude God Code - Autonomous Excellence
+
+This module provides a small, pluggable cache for model responses. Only
+deterministic requests (temperature 0) are cached, so repeated prompts in
+planning and coding loops can skip a round trip to the API entirely.
+"""
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from typing import Any, Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+
+# Default number of responses kept by the in-memory backend
+DEFAULT_CACHE_SIZE = 256
+
+
+class CacheBackend(Protocol):
+    """Protocol for LLM cache storage backends."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        ...
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value under key."""
+        ...
+
+    async def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        ...
+
+
+class MemoryBackend:
+    """In-process LRU cache backend."""
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE) -> None:
+        """Initialize memory backend."""
+        self.max_size = max_size
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        """Remove key from the cache if present."""
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LLMCache:
+    """Cache for deterministic LLM responses."""
+
+    def __init__(self, backend: Optional[CacheBackend] = None) -> None:
+        """Initialize LLM cache."""
+        self.backend: CacheBackend = backend or MemoryBackend()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def cache_key(
+        model: str,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> str:
+        """Build a stable cache key from everything that shapes a response."""
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "tools": tools or [],
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def is_cacheable(temperature: float) -> bool:
+        """Check if a request is deterministic enough to cache."""
+        return temperature == 0
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Look up a response, tracking hit/miss counts."""
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            logger.debug(f"LLM cache hit: {key[:12]}")
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a response."""
+        await self.backend.set(key, value)
+
+    async def invalidate(self, key: str) -> None:
+        """Drop a cached response."""
+        await self.backend.delete(key)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get cache hit/miss statistics."""
+        return {"hits": self.hits, "misses": self.misses}
@@ -9,13 +9,15 @@ and auto-continue loop functionality.
 """
 
 import asyncio
+import io
 import logging
+import os
 import re
-import subprocess
+import time
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 from .base import (
     AgentConfig,
@@ -35,6 +37,20 @@ logger = logging.getLogger(__name__)
 MAX_DIFF_LINES = 5000
 # Maximum files per change to prevent overwhelming changes
 MAX_FILES_PER_CHANGE = 20
+# Maximum file changes applied concurrently in worker threads
+MAX_CONCURRENT_WRITES = 16
+
+# Start of a per-file section in unified git diff output
+_DIFF_GIT_RE = re.compile(r"^diff --git", re.MULTILINE)
+# Per-file header lines repeated at the top of each chunk
+_HEADER_RE = re.compile(r"diff --git|---|\+\+\+")
+# Leading characters of the header lines matched by _HEADER_RE
+_HEADER_FIRST_CHARS = frozenset("d-+")
+# Recent diffs whose chunks and size checks one DiffChunker remembers
+_DIFF_CACHE_SIZE = 8
+
+# Flags for truncating file writes; O_CLOEXEC is unavailable on Windows
+_WRITE_FLAGS = os.O_CREAT | os.O_WRONLY | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
 
 
 @dataclass
@@ -46,6 +62,24 @@ class FileChange:
     original_content: Optional[str] = None
     new_content: Optional[str] = None
     diff_lines: int = 0
+    # UTF-8 encoding kept with the new_content string it was made from, so
+    # retries reuse it and a reassigned new_content is encoded again
+    _encoded: Optional[tuple[str, bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def new_content_bytes(self) -> Optional[bytes]:
+        """Get new_content encoded as UTF-8, encoding it on first use."""
+        content = self.new_content
+        if content is None:
+            return None
+        cached = self._encoded
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        encoded = content.encode("utf-8")
+        self._encoded = (content, encoded)
+        return encoded
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary."""
@@ -56,6 +90,60 @@ class FileChange:
         }
 
 
+@dataclass
+class FileChangeStore:
+    """Column-oriented record of the file changes applied during a run.
+
+    Long runs accumulate many changes; keeping each field in its own list
+    makes serialization and totals a walk over flat columns instead of a
+    getattr per FileChange. Individual FileChange views are built on demand.
+    """
+
+    paths: list[str] = field(default_factory=list)
+    change_types: list[str] = field(default_factory=list)
+    diff_lines: list[int] = field(default_factory=list)
+    original_contents: list[Optional[str]] = field(default_factory=list)
+    new_contents: list[Optional[bytes]] = field(default_factory=list)
+
+    def append(self, change: FileChange) -> None:
+        """Record a file change."""
+        self.paths.append(change.path)
+        self.change_types.append(change.change_type)
+        self.diff_lines.append(change.diff_lines)
+        self.original_contents.append(change.original_content)
+        self.new_contents.append(change.new_content_bytes)
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __getitem__(self, index: int) -> FileChange:
+        content = self.new_contents[index]
+        change = FileChange(
+            path=self.paths[index],
+            change_type=self.change_types[index],
+            original_content=self.original_contents[index],
+            new_content=content.decode("utf-8") if content is not None else None,
+            diff_lines=self.diff_lines[index],
+        )
+        if content is not None:
+            change._encoded = (change.new_content, content)
+        return change
+
+    def __iter__(self) -> Iterator[FileChange]:
+        return (self[i] for i in range(len(self.paths)))
+
+    def total_diff_lines(self) -> int:
+        """Get total diff lines across all recorded changes."""
+        return sum(self.diff_lines)
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert to dictionaries without building FileChange objects."""
+        return [
+            {"path": path, "change_type": change_type, "diff_lines": lines}
+            for path, change_type, lines in zip(self.paths, self.change_types, self.diff_lines)
+        ]
+
+
 @dataclass
 class CodeGenerationResult:
     """Result of code generation."""
@@ -93,42 +181,110 @@ class DiffChunker:
     def __init__(self, max_lines: int = MAX_DIFF_LINES) -> None:
         """Initialize diff chunker."""
         self.max_lines = max_lines
+        # Results for recent (diff, max_lines) pairs. A chunker belongs to one
+        # agent run, so retries reuse them and nothing outlives the run
+        self._chunks: OrderedDict[tuple[str, int], tuple[str, ...]] = OrderedDict()
+        self._sizes: OrderedDict[tuple[str, int], tuple[bool, str]] = OrderedDict()
+        # Line count of the last diff checked, matched by identity so the
+        # size checks on one diff share a single scan
+        self._counted: Optional[tuple[str, int]] = None
+
+    def _line_count(self, diff: str) -> int:
+        """Count lines in diff, reusing the count for the last diff seen."""
+        counted = self._counted
+        if counted is not None and counted[0] is diff:
+            return counted[1]
+        count = _line_count(diff)
+        self._counted = (diff, count)
+        return count
 
     def needs_chunking(self, diff: str) -> bool:
         """Check if diff needs to be chunked."""
-        return diff.count("\n") > self.max_lines
+        return self._line_count(diff) - 1 > self.max_lines
 
-    def chunk_diff(self, diff: str) -> list[str]:
-        """Split diff into manageable chunks."""
+    def prepare(self, diff: str) -> tuple[list[str], bool]:
+        """Split diff once, returning its lines and whether it needs chunking.
+
+        Pass the lines to chunk_diff() to avoid scanning the diff again.
+        """
         lines = diff.split("\n")
+        self._counted = (diff, len(lines))
+        return lines, len(lines) - 1 > self.max_lines
+
+    def chunk_diff(self, diff: str, lines: Optional[list[str]] = None) -> list[str]:
+        """Split diff into manageable chunks."""
+        key = (diff, self.max_lines)
+        cached = _cache_get(self._chunks, key)
+        if cached is not None:
+            return list(cached)
 
-        if len(lines) <= self.max_lines:
-            return [diff]
+        if lines is None:
+            lines = diff.split("\n")
 
-        chunks = []
-        current_chunk: list[str] = []
-        current_file_header: list[str] = []
+        chunks = [diff] if len(lines) <= self.max_lines else self._split_lines(lines)
+        _cache_put(self._chunks, key, tuple(chunks))
+        return chunks
+
+    def validate_size(self, diff: str) -> tuple[bool, str]:
+        """Validate diff size against max_lines, reusing earlier checks."""
+        key = (diff, self.max_lines)
+        cached = _cache_get(self._sizes, key)
+        if cached is None:
+            cached = _size_status(self._line_count(diff), self.max_lines)
+            _cache_put(self._sizes, key, cached)
+        return cached
+
+    def _split_lines(self, lines: list[str]) -> list[str]:
+        """Split diff lines into chunks, repeating the file header in each."""
+        # Preallocate for the usual chunk count; repeated headers can push
+        # past the estimate, in which case the list grows as needed
+        capacity = len(lines) // self.max_lines + 2
+        chunks: list[Any] = [None] * capacity
+        count = 0
+        buf = io.StringIO()
+        buf_lines = 0
+        # Current file header, pre-joined so each new chunk copies it in one write
+        header = ""
+        header_lines = 0
 
         for line in lines:
-            # Track file headers for context
-            if line.startswith("diff --git") or line.startswith("---") or line.startswith("+++"):
-                if line.startswith("diff --git"):
-                    current_file_header = [line]
+            # Track file headers for context; gate on the first character so
+            # ordinary content lines never reach the regex
+            first = line[:1]
+            if first in _HEADER_FIRST_CHARS and _HEADER_RE.match(line):
+                if first == "d":
+                    header = line
+                    header_lines = 1
                 else:
-                    current_file_header.append(line)
+                    header = f"{header}\n{line}" if header_lines else line
+                    header_lines += 1
 
-            current_chunk.append(line)
+            if buf_lines:
+                buf.write("\n")
+            buf.write(line)
+            buf_lines += 1
 
             # Check if we need to start a new chunk
-            if len(current_chunk) >= self.max_lines:
-                chunks.append("\n".join(current_chunk))
+            if buf_lines >= self.max_lines:
+                if count < capacity:
+                    chunks[count] = buf.getvalue()
+                else:
+                    chunks.append(buf.getvalue())
+                count += 1
                 # Start new chunk with file header context
-                current_chunk = current_file_header.copy() if current_file_header else []
+                buf = io.StringIO()
+                buf.write(header)
+                buf_lines = header_lines
 
         # Add remaining lines
-        if current_chunk:
-            chunks.append("\n".join(current_chunk))
+        if buf_lines:
+            if count < capacity:
+                chunks[count] = buf.getvalue()
+            else:
+                chunks.append(buf.getvalue())
+            count += 1
 
+        del chunks[count:]
         return chunks
 
     def get_chunk_summary(self, chunks: list[str]) -> str:
@@ -197,12 +353,13 @@ class CoderAgent(BaseAgent):
         self._current_task: Optional[PlannedTask] = None
         self._iteration_count = 0
         self._auto_continue_count = 0
-        self._file_changes: list[FileChange] = []
+        self._file_changes = FileChangeStore()
 
     async def run(self) -> AgentState:
         """Run the coder agent with auto-continue loop."""
         self.state.status = AgentStatus.RUNNING
-        self.state.metrics.start_time = datetime.now()
+        self.state.metrics.start_time = time.monotonic_ns()
+        self.context.start_event_dispatch()
 
         try:
             # Setup worktree if isolation is enabled
@@ -212,6 +369,10 @@ class CoderAgent(BaseAgent):
             # Main execution loop
             await self._execution_loop()
 
+        except asyncio.CancelledError:
+            # Cooperative cancellation via cancel(); outside cancellation propagates
+            if not self.is_cancelled():
+                raise
         except Exception as e:
             self._record_error(
                 f"Coder execution failed: {str(e)}",
@@ -225,7 +386,9 @@ class CoderAgent(BaseAgent):
             elif self.context.config.cleanup_on_failure and self.state.status == AgentStatus.FAILED:
                 await self.worktree.cleanup_worktree()
 
-        self.state.metrics.end_time = datetime.now()
+            self.state.metrics.end_time = time.monotonic_ns()
+            await self.context.stop_event_dispatch()
+
         return self.state
 
     async def _setup_worktree(self) -> None:
@@ -236,7 +399,7 @@ class CoderAgent(BaseAgent):
         branch_name = f"claude-god/{spec_id}"
 
         worktree_path = await self.worktree.create_worktree(spec_id, branch_name)
-        self.context.worktree_path = worktree_path
+        self.context.set_worktree(worktree_path)
 
     async def _execution_loop(self) -> None:
         """Main execution loop with auto-continue."""
@@ -259,6 +422,7 @@ class CoderAgent(BaseAgent):
 
                     self.state.current_task = self._current_task.title
                     self.plan.mark_task_started(self._current_task.id)
+                    self._publish_plan_changes()
 
                 # Execute current iteration
                 result = await self._execute_iteration()
@@ -270,6 +434,7 @@ class CoderAgent(BaseAgent):
                             self._current_task.id,
                             result.message,
                         )
+                        self._publish_plan_changes()
                         self.state.complete_task(self._current_task.title)
 
                     # Check for auto-continue
@@ -285,10 +450,13 @@ class CoderAgent(BaseAgent):
                     # Handle failure
                     if self._current_task:
                         self.plan.mark_task_failed(self._current_task.id, result.message)
+                        self._publish_plan_changes()
 
                     if self._can_retry():
                         self.state.metrics.retries_performed += 1
-                        await asyncio.sleep(self.context.config.retry_delay_seconds)
+                        await self._interruptible(
+                            asyncio.sleep(self.context.config.retry_delay_seconds)
+                        )
                         continue
                     else:
                         self._record_error(
@@ -312,7 +480,9 @@ class CoderAgent(BaseAgent):
                     break
 
                 self.state.metrics.retries_performed += 1
-                await asyncio.sleep(self.context.config.retry_delay_seconds)
+                await self._interruptible(
+                    asyncio.sleep(self.context.config.retry_delay_seconds)
+                )
 
     async def _execute_iteration(self) -> CodeGenerationResult:
         """Execute a single iteration of code generation."""
@@ -331,11 +501,11 @@ class CoderAgent(BaseAgent):
 
             # Simulate code generation result
             # In real implementation, this would call Claude API
-            changes = await self._generate_code_changes(task_desc)
+            changes = await self._interruptible(self._generate_code_changes(task_desc))
 
             # Apply changes
-            for change in changes:
-                applied = await self._apply_change(change)
+            applied_flags = await self._apply_changes(changes)
+            for change, applied in zip(changes, applied_flags):
                 if applied:
                     self._file_changes.append(change)
                     result.files_changed.append(change)
@@ -375,27 +545,92 @@ class CoderAgent(BaseAgent):
 
         return changes
 
-    async def _apply_change(self, change: FileChange) -> bool:
+    async def _apply_changes(self, changes: list[FileChange]) -> list[bool]:
+        """Apply a batch of file changes concurrently.
+
+        Changes to the same path are applied in order within one worker so
+        they never race; different paths are written in parallel threads.
+        """
+        by_path: dict[str, list[int]] = {}
+        for index, change in enumerate(changes):
+            by_path.setdefault(change.path, []).append(index)
+
+        # Create every parent directory once up front instead of one
+        # mkdir per created file
+        working_dir = os.fspath(self.worktree.get_working_directory())
+        parents = {
+            os.path.dirname(os.path.join(working_dir, change.path))
+            for change in changes
+            if change.change_type == "create"
+        }
+        if parents:
+            await asyncio.to_thread(_make_dirs, parents)
+
+        results = [False] * len(changes)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
+
+        def apply_group(indices: list[int]) -> None:
+            for index in indices:
+                results[index] = self._apply_change_sync(
+                    changes[index], working_dir, ensure_parent=False
+                )
+
+        async def run_group(indices: list[int]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(apply_group, indices)
+
+        await asyncio.gather(*(run_group(indices) for indices in by_path.values()))
+
+        if logger.isEnabledFor(logging.INFO):
+            counts = {"create": 0, "modify": 0, "delete": 0}
+            for change, applied in zip(changes, results):
+                if applied and change.change_type in counts:
+                    counts[change.change_type] += 1
+            logger.info(
+                f"Applied changes: +{counts['create']} ~{counts['modify']} "
+                f"-{counts['delete']} ({results.count(False)} failed)"
+            )
+
+        return results
+
+    async def _apply_change(
+        self,
+        change: FileChange,
+        working_dir: Optional[str] = None,
+    ) -> bool:
         """Apply a file change."""
-        working_dir = self.worktree.get_working_directory()
-        file_path = working_dir / change.path
+        if working_dir is None:
+            working_dir = os.fspath(self.worktree.get_working_directory())
+        return await asyncio.to_thread(self._apply_change_sync, change, working_dir)
+
+    def _apply_change_sync(
+        self,
+        change: FileChange,
+        working_dir: str,
+        ensure_parent: bool = True,
+    ) -> bool:
+        """Apply a file change under working_dir, blocking on disk I/O."""
+        file_path = os.path.join(working_dir, change.path)
 
         try:
             if change.change_type == "create":
-                file_path.parent.mkdir(parents=True, exist_ok=True)
-                if change.new_content:
-                    file_path.write_text(change.new_content, encoding="utf-8")
-                logger.info(f"Created file: {change.path}")
+                if ensure_parent:
+                    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                if change.new_content_bytes:
+                    _write_file(file_path, change.new_content_bytes)
+                logger.debug(f"Created file: {change.path}")
 
             elif change.change_type == "modify":
-                if change.new_content:
-                    file_path.write_text(change.new_content, encoding="utf-8")
-                logger.info(f"Modified file: {change.path}")
+                if change.new_content_bytes:
+                    _write_file(file_path, change.new_content_bytes)
+                logger.debug(f"Modified file: {change.path}")
 
             elif change.change_type == "delete":
-                if file_path.exists():
-                    file_path.unlink()
-                logger.info(f"Deleted file: {change.path}")
+                try:
+                    os.unlink(file_path)
+                except FileNotFoundError:
+                    pass
+                logger.debug(f"Deleted file: {change.path}")
 
             return True
 
@@ -443,29 +678,67 @@ class CoderAgent(BaseAgent):
 
         return False
 
+    def _publish_plan_changes(self) -> None:
+        """Send plan task updates as deltas instead of the whole plan."""
+        changes = self.plan.drain_changes() if self.plan else []
+        if changes:
+            self.context.notify_progress(
+                self.agent_id,
+                self.state.phase,
+                "Plan updated",
+                {"plan_changes": changes},
+            )
+
     def _can_retry(self) -> bool:
         """Check if retry is allowed."""
         return self.state.metrics.retries_performed < self.context.config.max_retries
 
     def get_file_changes(self) -> list[FileChange]:
         """Get all file changes made during execution."""
-        return self._file_changes
+        return list(self._file_changes)
 
-    def get_diff_summary(self) -> str:
+    async def get_diff_summary(self) -> str:
         """Get summary of all changes as diff."""
+        return (await self.get_diff_summary_bytes()).decode("utf-8", errors="replace")
+
+    async def get_diff_summary_bytes(self) -> bytes:
+        """Get raw `git diff --stat` output for consumers that forward bytes."""
         working_dir = self.worktree.get_working_directory()
 
         try:
-            result = subprocess.run(
-                ["git", "diff", "--stat"],
+            proc = await asyncio.create_subprocess_exec(
+                "git",
+                "diff",
+                "--stat",
                 cwd=str(working_dir),
-                capture_output=True,
-                text=True,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            return result.stdout if result.returncode == 0 else ""
+            stdout, _ = await proc.communicate()
+            return stdout if proc.returncode == 0 else b""
         except Exception as e:
             logger.warning(f"Failed to get diff summary: {e}")
-            return ""
+            return b""
+
+
+def _make_dirs(directories: set[str]) -> None:
+    """Create directories, leaving failures to surface on the file write."""
+    for directory in sorted(directories):
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError as e:
+            logger.debug(f"Could not create directory {directory}: {e}")
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """Write data to path through a raw file descriptor."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 async def run_autonomous_agent(
@@ -477,10 +750,33 @@ async def run_autonomous_agent(
     return await coder.run()
 
 
+def _cache_get(cache: OrderedDict[Any, Any], key: Any) -> Any:
+    """Look up key in a bounded cache, marking it recently used."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict[Any, Any], key: Any, value: Any) -> None:
+    """Store value, evicting the least recently used entry past _DIFF_CACHE_SIZE."""
+    cache[key] = value
+    if len(cache) > _DIFF_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def _line_count(diff: str) -> int:
+    """Count lines in a diff, shared by the size checks so they agree."""
+    return diff.count("\n") + 1
+
+
 def validate_diff_size(diff: str, max_lines: int = MAX_DIFF_LINES) -> tuple[bool, str]:
     """Validate diff size and return status with message."""
-    line_count = diff.count("\n") + 1
+    return _size_status(_line_count(diff), max_lines)
+
 
+def _size_status(line_count: int, max_lines: int) -> tuple[bool, str]:
+    """Get the validation status and message for a diff's line count."""
     if line_count > max_lines:
         return False, f"Diff too large ({line_count} lines, max {max_lines})"
 
@@ -489,4 +785,4 @@ def validate_diff_size(diff: str, max_lines: int = MAX_DIFF_LINES) -> tuple[bool
 
 def count_affected_files(diff: str) -> int:
     """Count number of files affected by a diff."""
-    return len(re.findall(r"^diff --git", diff, re.MULTILINE))
+    return sum(1 for _ in _DIFF_GIT_RE.finditer(diff))
@@ -10,11 +10,15 @@ to prioritize safety during code changes.
 
 import logging
 import re
+import time
+from bisect import bisect_right
+from collections import Counter, defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
+from itertools import chain
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from .base import (
     AgentConfig,
@@ -51,7 +55,43 @@ class TaskType(Enum):
     REVIEW = "review"
 
 
-@dataclass
+# Task type keywords as one pattern with a named group per type. The
+# zero-width lookahead lets every word start be tried, so a keyword inside
+# a longer lower-ranked match (e.g. "clean upgrade") is still seen.
+_TASK_TYPE_RE = re.compile(
+    r"\b(?="
+    r"(?P<migration>migrat|upgrad|convert)"
+    r"|(?P<refactor>refactor|restructur|reorganiz|clean\s*up)"
+    r"|(?P<test>test|spec|coverage|assert)"
+    r"|(?P<documentation>document|readme|docs|comment)"
+    r"|(?P<analysis>analyz|investigat|research|explor)"
+    r"|(?P<design>design|architect|plan|propos)"
+    r")"
+)
+# Task type for each group, in precedence order; the first listed wins
+_GROUP_TO_TYPE: dict[str, TaskType] = {
+    "migration": TaskType.MIGRATION,
+    "refactor": TaskType.REFACTOR,
+    "test": TaskType.TEST,
+    "documentation": TaskType.DOCUMENTATION,
+    "analysis": TaskType.ANALYSIS,
+    "design": TaskType.DESIGN,
+}
+_GROUP_RANK: dict[str, int] = {name: rank for rank, name in enumerate(_GROUP_TO_TYPE)}
+
+# Numeric weight of each complexity level; unknown levels count as medium
+_COMPLEXITY_SCORES: dict[str, int] = {"simple": 1, "medium": 2, "complex": 3}
+# Average-score cut points between the overall plan complexity levels
+_COMPLEXITY_THRESHOLDS = (1.5, 2.5)
+_COMPLEXITY_LEVELS = ("simple", "medium", "complex")
+
+# Priority keywords, matched as substrings like the original word lists
+_CRITICAL_PRIORITY_RE = re.compile(r"critical|urgent|emergency|asap")
+_HIGH_PRIORITY_RE = re.compile(r"important|high|priority")
+_LOW_PRIORITY_RE = re.compile(r"low|minor|when possible")
+
+
+@dataclass(slots=True)
 class PlannedTask:
     """A single task in the execution plan."""
 
@@ -65,7 +105,7 @@ class PlannedTask:
     estimated_complexity: str = "medium"  # simple, medium, complex
     files_to_modify: list[str] = field(default_factory=list)
     files_to_create: list[str] = field(default_factory=list)
-    dependencies: list[str] = field(default_factory=list)
+    dependencies: frozenset[str] = field(default_factory=frozenset)
 
     # Safety information from Impact Analysis
     impact_severity: Optional[str] = None
@@ -78,6 +118,50 @@ class PlannedTask:
     completed_at: Optional[datetime] = None
     result: Optional[str] = None
 
+    # perf_counter_ns() stamps for duration math, and isoformat strings kept
+    # with the datetime they were rendered from
+    _start_ns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _end_ns: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _started_iso: Optional[tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _completed_iso: Optional[tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.dependencies, frozenset):
+            self.dependencies = frozenset(self.dependencies)
+
+    def _mark_started(self, now: datetime) -> str:
+        """Stamp the start time, returning it in isoformat."""
+        self._start_ns = time.perf_counter_ns()
+        self._end_ns = None
+        self.started_at = now
+        iso = now.isoformat()
+        self._started_iso = (now, iso)
+        return iso
+
+    def _mark_finished(self, now: datetime, iso: str, end_ns: int) -> None:
+        """Stamp the completion time with a pre-rendered isoformat string."""
+        self._end_ns = end_ns
+        self.completed_at = now
+        self._completed_iso = (now, iso)
+
+    @property
+    def duration_seconds(self) -> Optional[float]:
+        """Get the time between start and completion, if both happened."""
+        if self._start_ns is not None and self._end_ns is not None:
+            return (self._end_ns - self._start_ns) / 1e9
+        if self.started_at and self.completed_at:
+            return (self.completed_at - self.started_at).total_seconds()
+        return None
+
+    @property
+    def complexity_score(self) -> int:
+        """Get the numeric weight of estimated_complexity."""
+        return _COMPLEXITY_SCORES.get(self.estimated_complexity, 2)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -89,24 +173,41 @@ class PlannedTask:
             "estimated_complexity": self.estimated_complexity,
             "files_to_modify": self.files_to_modify,
             "files_to_create": self.files_to_create,
-            "dependencies": self.dependencies,
+            "dependencies": sorted(self.dependencies),
             "impact_severity": self.impact_severity,
             "breaking_changes": self.breaking_changes,
             "rollback_notes": self.rollback_notes,
             "status": self.status,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "started_at": _cached_isoformat(self.started_at, self._started_iso),
+            "completed_at": _cached_isoformat(self.completed_at, self._completed_iso),
             "result": self.result,
+            "duration_seconds": self.duration_seconds,
         }
 
 
-@dataclass
+def _utcnow() -> datetime:
+    """Get the current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+def _cached_isoformat(
+    value: Optional[datetime], cached: Optional[tuple[datetime, str]]
+) -> Optional[str]:
+    """Render a datetime, reusing the cached string if it belongs to value."""
+    if value is None:
+        return None
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    return value.isoformat()
+
+
+@dataclass(slots=True)
 class ExecutionPlan:
     """Complete execution plan for a specification."""
 
     spec_id: str
     task_description: str
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_utcnow)
 
     # Tasks
     tasks: list[PlannedTask] = field(default_factory=list)
@@ -125,9 +226,100 @@ class ExecutionPlan:
     risk_factors: list[str] = field(default_factory=list)
     prerequisites: list[str] = field(default_factory=list)
 
+    # Lookup indices over tasks, kept current by add_task() and mark_task_*()
+    _task_index: dict[str, PlannedTask] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _pending: dict[str, PlannedTask] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _completed_ids: set[str] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+    _status_counts: Counter[str] = field(
+        default_factory=Counter, init=False, repr=False, compare=False
+    )
+    _indexed_tasks: Optional[list[PlannedTask]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _indexed_len: int = field(default=0, init=False, repr=False, compare=False)
+    # Task field updates since the last drain_changes(), for incremental sync
+    _changes: list[tuple[str, dict[str, Any]]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    # Serialized tasks keyed by id(task), dropped when a task changes through
+    # mark_task_*(); the task is kept alongside so a recycled id() never matches
+    _task_dicts: dict[int, tuple[PlannedTask, dict[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._rebuild_index()
+
+    def _rebuild_index(self) -> None:
+        """Index tasks by id and status."""
+        self._task_index = {}
+        self._task_dicts = {}
+        self._pending = {}
+        self._completed_ids = set()
+        self._status_counts = Counter(task.status for task in self.tasks)
+        for task in self.tasks:
+            if task.id in self._task_index:
+                continue
+            self._task_index[task.id] = task
+            if task.status == "pending":
+                self._pending[task.id] = task
+            elif task.status == "completed":
+                self._completed_ids.add(task.id)
+        self._indexed_tasks = self.tasks
+        self._indexed_len = len(self.tasks)
+
+    def _index(self) -> dict[str, PlannedTask]:
+        """Get the task index, rebuilding it if tasks was replaced or grown directly."""
+        if self._indexed_tasks is not self.tasks or self._indexed_len != len(self.tasks):
+            self._rebuild_index()
+        return self._task_index
+
+    def _set_status(self, task: PlannedTask, status: str) -> None:
+        """Move a task to a new status, updating the status indices."""
+        self._task_dicts.pop(id(task), None)
+        if task.status == "completed":
+            self._completed_ids.discard(task.id)
+        self._pending.pop(task.id, None)
+        self._status_counts[task.status] -= 1
+        self._status_counts[status] += 1
+        task.status = status
+        if status == "completed":
+            self._completed_ids.add(task.id)
+        elif status == "pending":
+            self._pending[task.id] = task
+
+    def add_task(self, task: PlannedTask) -> None:
+        """Append a task, keeping lookup indices consistent."""
+        self._index()
+        self._task_dicts.pop(id(task), None)
+        self.tasks.append(task)
+        self._indexed_len += 1
+        self._status_counts[task.status] += 1
+        if task.id in self._task_index:
+            return
+        self._task_index[task.id] = task
+        if task.status == "pending":
+            self._pending[task.id] = task
+        elif task.status == "completed":
+            self._completed_ids.add(task.id)
+
+    def invalidate_cache(self) -> None:
+        """Drop cached task serializations after editing tasks directly."""
+        self._task_dicts.clear()
+
+    def get_task(self, task_id: str) -> Optional[PlannedTask]:
+        """Get a task by id."""
+        return self._index().get(task_id)
+
     def get_tasks_by_phase(self) -> list[list[PlannedTask]]:
         """Get tasks organized by execution phase."""
-        task_map = {t.id: t for t in self.tasks}
+        task_map = self._index()
         phases = []
 
         for phase_ids in self.execution_phases:
@@ -143,51 +335,86 @@ class ExecutionPlan:
 
     def get_next_task(self) -> Optional[PlannedTask]:
         """Get next task to execute based on dependencies."""
-        completed_ids = {t.id for t in self.tasks if t.status == "completed"}
-
-        for task in self.tasks:
-            if task.status != "pending":
-                continue
+        self._index()
+        completed_ids = self._completed_ids
 
+        for task in self._pending.values():
             # Check if all dependencies are satisfied
-            deps_satisfied = all(d in completed_ids for d in task.dependencies)
-            if deps_satisfied:
+            if task.dependencies <= completed_ids:
                 return task
 
         return None
 
     def mark_task_started(self, task_id: str) -> None:
         """Mark a task as started."""
-        for task in self.tasks:
-            if task.id == task_id:
-                task.status = "in_progress"
-                task.started_at = datetime.now()
-                break
+        task = self._index().get(task_id)
+        if task is not None:
+            self._set_status(task, "in_progress")
+            started_iso = task._mark_started(_utcnow())
+            self._changes.append((task_id, {
+                "status": task.status,
+                "started_at": started_iso,
+            }))
 
     def mark_task_completed(self, task_id: str, result: str = "") -> None:
         """Mark a task as completed."""
-        for task in self.tasks:
-            if task.id == task_id:
-                task.status = "completed"
-                task.completed_at = datetime.now()
+        self.mark_tasks_completed((task_id,), result)
+
+    def mark_tasks_completed(
+        self,
+        task_ids: Iterable[str],
+        result: str = "",
+        now: Optional[datetime] = None,
+    ) -> None:
+        """Mark several tasks as completed, sharing one timestamp."""
+        end_ns = time.perf_counter_ns()
+        completed_at = now or _utcnow()
+        completed_iso = completed_at.isoformat()
+        index = self._index()
+        for task_id in task_ids:
+            task = index.get(task_id)
+            if task is not None:
+                self._set_status(task, "completed")
+                task._mark_finished(completed_at, completed_iso, end_ns)
                 task.result = result
-                break
+                self._changes.append((task_id, {
+                    "status": task.status,
+                    "completed_at": completed_iso,
+                    "result": result,
+                }))
 
     def mark_task_failed(self, task_id: str, reason: str) -> None:
         """Mark a task as failed."""
-        for task in self.tasks:
-            if task.id == task_id:
-                task.status = "failed"
-                task.completed_at = datetime.now()
-                task.result = f"Failed: {reason}"
-                break
+        task = self._index().get(task_id)
+        if task is not None:
+            self._set_status(task, "failed")
+            end_ns = time.perf_counter_ns()
+            completed_at = _utcnow()
+            completed_iso = completed_at.isoformat()
+            task._mark_finished(completed_at, completed_iso, end_ns)
+            task.result = f"Failed: {reason}"
+            self._changes.append((task_id, {
+                "status": task.status,
+                "completed_at": completed_iso,
+                "result": task.result,
+            }))
+
+    def drain_changes(self) -> list[tuple[str, dict[str, Any]]]:
+        """Return task updates made since the last call, then forget them.
+
+        Send to_dict() once for the initial state and these deltas afterwards.
+        """
+        changes, self._changes = self._changes, []
+        return changes
 
     def get_progress(self) -> dict[str, int]:
         """Get progress statistics."""
+        self._index()
+        counts = self._status_counts
         total = len(self.tasks)
-        completed = sum(1 for t in self.tasks if t.status == "completed")
-        failed = sum(1 for t in self.tasks if t.status == "failed")
-        in_progress = sum(1 for t in self.tasks if t.status == "in_progress")
+        completed = counts["completed"]
+        failed = counts["failed"]
+        in_progress = counts["in_progress"]
         pending = total - completed - failed - in_progress
 
         return {
@@ -196,16 +423,34 @@ class ExecutionPlan:
             "failed": failed,
             "in_progress": in_progress,
             "pending": pending,
-            "percentage": int((completed / total) * 100) if total > 0 else 0,
+            "percentage": completed * 100 // total if total > 0 else 0,
         }
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for serialization."""
+        """Convert to dictionary for serialization.
+
+        Task dictionaries are rebuilt only for tasks changed through
+        mark_task_*() since the last call, and returned as shallow copies so
+        callers may edit them; progress is always recomputed.
+        """
+        self._index()
+        cache = self._task_dicts
+        # Rebuilt each call so entries for removed tasks are dropped
+        current: dict[int, tuple[PlannedTask, dict[str, Any]]] = {}
+        task_dicts = []
+        for task in self.tasks:
+            entry = cache.get(id(task))
+            if entry is None or entry[0] is not task:
+                entry = (task, task.to_dict())
+            current[id(task)] = entry
+            task_dicts.append(entry[1].copy())
+        self._task_dicts = current
+
         return {
             "spec_id": self.spec_id,
             "task_description": self.task_description,
             "created_at": self.created_at.isoformat(),
-            "tasks": [t.to_dict() for t in self.tasks],
+            "tasks": task_dicts,
             "overall_impact_severity": self.overall_impact_severity,
             "impact_summary": self.impact_summary,
             "requires_migration": self.requires_migration,
@@ -218,6 +463,201 @@ class ExecutionPlan:
         }
 
 
+@dataclass(frozen=True, slots=True)
+class TaskTemplate:
+    """Blueprint for one step of a decomposed plan."""
+
+    title: str
+    description: str  # may reference {description}
+    task_type: Optional[TaskType]  # None uses the inferred task type
+    priority: Optional[TaskPriority]  # None uses the inferred priority
+    estimated_complexity: str
+    dependencies: tuple[int, ...] = ()  # indexes of earlier steps
+
+
+# Task decomposition per task type
+_TEMPLATES: dict[TaskType, tuple[TaskTemplate, ...]] = {
+    TaskType.IMPLEMENTATION: (
+        TaskTemplate(
+            "Analyze requirements and existing code",
+            "Analyze the codebase to understand where and how to implement: {description}",
+            TaskType.ANALYSIS, TaskPriority.HIGH, "simple",
+        ),
+        TaskTemplate(
+            "Design implementation approach",
+            "Design the implementation approach, identifying files to modify and create",
+            TaskType.DESIGN, TaskPriority.HIGH, "medium", (0,),
+        ),
+        TaskTemplate(
+            "Implement changes",
+            "Implement the required changes for: {description}",
+            TaskType.IMPLEMENTATION, TaskPriority.CRITICAL, "complex", (1,),
+        ),
+        TaskTemplate(
+            "Write and run tests",
+            "Write unit tests and verify implementation",
+            TaskType.TEST, TaskPriority.HIGH, "medium", (2,),
+        ),
+        TaskTemplate(
+            "Review and finalize",
+            "Review changes, ensure code quality, and prepare for commit",
+            TaskType.REVIEW, TaskPriority.MEDIUM, "simple", (3,),
+        ),
+    ),
+    TaskType.REFACTOR: (
+        TaskTemplate(
+            "Identify refactoring scope",
+            "Analyze code to identify all areas affected by refactoring",
+            TaskType.ANALYSIS, TaskPriority.HIGH, "medium",
+        ),
+        TaskTemplate(
+            "Ensure test coverage",
+            "Verify existing tests cover refactoring scope, add tests if needed",
+            TaskType.TEST, TaskPriority.HIGH, "medium", (0,),
+        ),
+        TaskTemplate(
+            "Perform refactoring",
+            "Execute refactoring: {description}",
+            TaskType.REFACTOR, TaskPriority.CRITICAL, "complex", (1,),
+        ),
+        TaskTemplate(
+            "Verify tests pass",
+            "Run all tests to ensure refactoring didn't break functionality",
+            TaskType.TEST, TaskPriority.CRITICAL, "simple", (2,),
+        ),
+    ),
+    TaskType.TEST: (
+        TaskTemplate(
+            "Analyze test requirements",
+            "Identify what needs to be tested and current coverage gaps",
+            TaskType.ANALYSIS, TaskPriority.HIGH, "simple",
+        ),
+        TaskTemplate(
+            "Write tests",
+            "Write tests for: {description}",
+            TaskType.TEST, TaskPriority.CRITICAL, "medium", (0,),
+        ),
+        TaskTemplate(
+            "Run and verify tests",
+            "Execute tests and ensure they pass",
+            TaskType.TEST, TaskPriority.HIGH, "simple", (1,),
+        ),
+    ),
+    TaskType.MIGRATION: (
+        TaskTemplate(
+            "Analyze migration scope",
+            "Identify all components affected by migration",
+            TaskType.ANALYSIS, TaskPriority.CRITICAL, "complex",
+        ),
+        TaskTemplate(
+            "Create migration plan",
+            "Design step-by-step migration approach with rollback strategy",
+            TaskType.DESIGN, TaskPriority.CRITICAL, "complex", (0,),
+        ),
+        TaskTemplate(
+            "Implement migration",
+            "Execute migration: {description}",
+            TaskType.MIGRATION, TaskPriority.CRITICAL, "complex", (1,),
+        ),
+        TaskTemplate(
+            "Verify migration",
+            "Test all migrated components and verify functionality",
+            TaskType.TEST, TaskPriority.CRITICAL, "medium", (2,),
+        ),
+        TaskTemplate(
+            "Document migration",
+            "Document changes and update any affected documentation",
+            TaskType.DOCUMENTATION, TaskPriority.MEDIUM, "simple", (3,),
+        ),
+    ),
+}
+
+# Default decomposition for task types without a dedicated template
+_GENERIC_TEMPLATES: tuple[TaskTemplate, ...] = (
+    TaskTemplate(
+        "Analyze and prepare",
+        "Analyze requirements for: {description}",
+        TaskType.ANALYSIS, None, "simple",
+    ),
+    TaskTemplate(
+        "Execute task",
+        "{description}",
+        None, None, "medium", (0,),
+    ),
+    TaskTemplate(
+        "Verify and complete",
+        "Verify task completion and finalize",
+        TaskType.REVIEW, TaskPriority.MEDIUM, "simple", (1,),
+    ),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _TaskSkeleton:
+    """A template step with ids, type and priority already resolved."""
+
+    id: str
+    title: str
+    description: str  # may reference {description}
+    task_type: TaskType
+    priority: TaskPriority
+    estimated_complexity: str
+    dependencies: frozenset[str]
+
+
+# Resolved skeletons keyed by (task type, priority, start id); only the
+# description differs between plans of the same shape
+_SKELETON_CACHE: dict[tuple[TaskType, TaskPriority, int], tuple[_TaskSkeleton, ...]] = {}
+
+
+def _get_skeletons(
+    task_type: TaskType,
+    priority: TaskPriority,
+    start_id: int,
+) -> tuple[_TaskSkeleton, ...]:
+    """Get the resolved plan skeleton for a task type and priority."""
+    key = (task_type, priority, start_id)
+    skeletons = _SKELETON_CACHE.get(key)
+    if skeletons is None:
+        templates = _TEMPLATES.get(task_type, _GENERIC_TEMPLATES)
+        # Format each id once; dependencies reuse the same string objects
+        ids = tuple(f"task_{start_id + index + 1}" for index in range(len(templates)))
+        skeletons = _SKELETON_CACHE[key] = tuple(
+            _TaskSkeleton(
+                id=ids[index],
+                title=template.title,
+                description=template.description,
+                task_type=template.task_type or task_type,
+                priority=template.priority or priority,
+                estimated_complexity=template.estimated_complexity,
+                dependencies=frozenset(ids[dep] for dep in template.dependencies),
+            )
+            for index, template in enumerate(templates)
+        )
+    return skeletons
+
+
+def _instantiate(
+    task_type: TaskType,
+    priority: TaskPriority,
+    description: str,
+    start_id: int = 0,
+) -> list[PlannedTask]:
+    """Build planned tasks for a description, numbering ids from start_id + 1."""
+    return [
+        PlannedTask(
+            id=skeleton.id,
+            title=skeleton.title,
+            description=skeleton.description.format(description=description),
+            task_type=skeleton.task_type,
+            priority=skeleton.priority,
+            estimated_complexity=skeleton.estimated_complexity,
+            dependencies=skeleton.dependencies,
+        )
+        for skeleton in _get_skeletons(task_type, priority, start_id)
+    ]
+
+
 class PlannerAgent(BaseAgent):
     """Agent responsible for planning task execution with God Mode integration."""
 
@@ -234,7 +674,8 @@ class PlannerAgent(BaseAgent):
     async def run(self) -> AgentState:
         """Run the planner to create an execution plan."""
         self.state.status = AgentStatus.RUNNING
-        self.state.metrics.start_time = datetime.now()
+        self.state.metrics.start_time = time.monotonic_ns()
+        self.context.start_event_dispatch()
         self._transition_phase(AgentPhase.PLANNING, "Starting plan generation")
 
         try:
@@ -242,11 +683,6 @@ class PlannerAgent(BaseAgent):
             self._transition_phase(AgentPhase.PLANNING, "Analyzing task requirements")
             tasks = self._decompose_task(self.context.task_description)
 
-            # Run God Mode Impact Analysis if available
-            if self.impact_analyzer and self.context.config.require_impact_analysis:
-                self._transition_phase(AgentPhase.PLANNING, "Running God Mode Impact Analysis")
-                await self._apply_impact_analysis(tasks)
-
             # Organize tasks into execution phases
             self._transition_phase(AgentPhase.PLANNING, "Organizing execution phases")
             phases = self._organize_phases(tasks)
@@ -259,22 +695,44 @@ class PlannerAgent(BaseAgent):
                 execution_phases=phases,
             )
 
+        except Exception as e:
+            self._record_error(
+                f"Planning failed: {str(e)}",
+                ErrorSeverity.FATAL,
+                exception=e,
+            )
+        else:
+            # Run God Mode Impact Analysis if available, once the plan exists
+            # so plan-level results are recorded. Its failures are warnings:
+            # a flaky analyzer never fails the plan
+            if self.impact_analyzer and self.context.config.require_impact_analysis:
+                self._transition_phase(AgentPhase.PLANNING, "Running God Mode Impact Analysis")
+                try:
+                    await self._apply_impact_analysis(tasks)
+                except Exception as e:
+                    self._record_error(
+                        f"Impact analysis warning: {e}",
+                        ErrorSeverity.WARNING,
+                        exception=e,
+                    )
+
             # Set overall metrics
             self._calculate_plan_metrics()
 
             self.state.status = AgentStatus.COMPLETED
             self.state.result = f"Created plan with {len(tasks)} tasks in {len(phases)} phases"
             self.state.artifacts["plan"] = self._plan.to_dict()
-            self._transition_phase(AgentPhase.COMPLETING, "Plan generation complete")
-
-        except Exception as e:
-            self._record_error(
-                f"Planning failed: {str(e)}",
-                ErrorSeverity.FATAL,
-                exception=e,
+            # Full plan goes out once; later updates travel as drain_changes() deltas
+            self._transition_phase(
+                AgentPhase.COMPLETING,
+                "Plan generation complete",
+                {"plan": self.state.artifacts["plan"]},
             )
 
-        self.state.metrics.end_time = datetime.now()
+        finally:
+            self.state.metrics.end_time = time.monotonic_ns()
+            await self.context.stop_event_dispatch()
+
         return self.state
 
     def get_plan(self) -> Optional[ExecutionPlan]:
@@ -283,296 +741,44 @@ class PlannerAgent(BaseAgent):
 
     def _decompose_task(self, description: str) -> list[PlannedTask]:
         """Decompose task description into individual tasks."""
-        tasks: list[PlannedTask] = []
-        task_counter = 0
-
         # Detect task type from description
         task_type = self._infer_task_type(description)
         priority = self._infer_priority(description)
 
-        # Generate tasks based on task type
-        if task_type == TaskType.IMPLEMENTATION:
-            tasks.extend(self._plan_implementation(description, task_counter))
-        elif task_type == TaskType.REFACTOR:
-            tasks.extend(self._plan_refactor(description, task_counter))
-        elif task_type == TaskType.TEST:
-            tasks.extend(self._plan_testing(description, task_counter))
-        elif task_type == TaskType.MIGRATION:
-            tasks.extend(self._plan_migration(description, task_counter))
-        else:
-            # Default decomposition for generic tasks
-            tasks.extend(self._plan_generic(description, task_counter, task_type, priority))
-
-        return tasks
+        # Generate tasks from the template for this task type, falling back
+        # to the generic decomposition
+        return _instantiate(task_type, priority, description)
 
     def _infer_task_type(self, description: str) -> TaskType:
         """Infer task type from description."""
         desc_lower = description.lower()
 
-        type_patterns = [
-            (TaskType.MIGRATION, r"\b(migrat|upgrad|convert)\w*\b"),
-            (TaskType.REFACTOR, r"\b(refactor|restructur|reorganiz|clean\s*up)\w*\b"),
-            (TaskType.TEST, r"\b(test|spec|coverage|assert)\w*\b"),
-            (TaskType.DOCUMENTATION, r"\b(document|readme|docs|comment)\w*\b"),
-            (TaskType.ANALYSIS, r"\b(analyz|investigat|research|explor)\w*\b"),
-            (TaskType.DESIGN, r"\b(design|architect|plan|propos)\w*\b"),
-        ]
-
-        for task_type, pattern in type_patterns:
-            if re.search(pattern, desc_lower):
-                return task_type
+        # One scan over the description, keeping the highest-precedence hit
+        best: Optional[str] = None
+        best_rank = len(_GROUP_RANK)
+        for match in _TASK_TYPE_RE.finditer(desc_lower):
+            group = match.lastgroup
+            rank = _GROUP_RANK[group]
+            if rank < best_rank:
+                best, best_rank = group, rank
+                if rank == 0:
+                    break
 
-        return TaskType.IMPLEMENTATION
+        return _GROUP_TO_TYPE[best] if best else TaskType.IMPLEMENTATION
 
     def _infer_priority(self, description: str) -> TaskPriority:
         """Infer task priority from description."""
         desc_lower = description.lower()
 
-        if any(word in desc_lower for word in ["critical", "urgent", "emergency", "asap"]):
+        if _CRITICAL_PRIORITY_RE.search(desc_lower):
             return TaskPriority.CRITICAL
-        if any(word in desc_lower for word in ["important", "high", "priority"]):
+        if _HIGH_PRIORITY_RE.search(desc_lower):
             return TaskPriority.HIGH
-        if any(word in desc_lower for word in ["low", "minor", "when possible"]):
+        if _LOW_PRIORITY_RE.search(desc_lower):
             return TaskPriority.LOW
 
         return TaskPriority.MEDIUM
 
-    def _plan_implementation(self, description: str, start_id: int) -> list[PlannedTask]:
-        """Plan tasks for a new implementation."""
-        tasks = []
-
-        # Analysis task
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 1}",
-            title="Analyze requirements and existing code",
-            description=f"Analyze the codebase to understand where and how to implement: {description}",
-            task_type=TaskType.ANALYSIS,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="simple",
-        ))
-
-        # Design task
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 2}",
-            title="Design implementation approach",
-            description="Design the implementation approach, identifying files to modify and create",
-            task_type=TaskType.DESIGN,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="medium",
-            dependencies=[f"task_{start_id + 1}"],
-        ))
-
-        # Implementation task
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 3}",
-            title="Implement changes",
-            description=f"Implement the required changes for: {description}",
-            task_type=TaskType.IMPLEMENTATION,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="complex",
-            dependencies=[f"task_{start_id + 2}"],
-        ))
-
-        # Testing task
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 4}",
-            title="Write and run tests",
-            description="Write unit tests and verify implementation",
-            task_type=TaskType.TEST,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="medium",
-            dependencies=[f"task_{start_id + 3}"],
-        ))
-
-        # Review task
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 5}",
-            title="Review and finalize",
-            description="Review changes, ensure code quality, and prepare for commit",
-            task_type=TaskType.REVIEW,
-            priority=TaskPriority.MEDIUM,
-            estimated_complexity="simple",
-            dependencies=[f"task_{start_id + 4}"],
-        ))
-
-        return tasks
-
-    def _plan_refactor(self, description: str, start_id: int) -> list[PlannedTask]:
-        """Plan tasks for a refactoring operation."""
-        tasks = []
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 1}",
-            title="Identify refactoring scope",
-            description="Analyze code to identify all areas affected by refactoring",
-            task_type=TaskType.ANALYSIS,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="medium",
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 2}",
-            title="Ensure test coverage",
-            description="Verify existing tests cover refactoring scope, add tests if needed",
-            task_type=TaskType.TEST,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="medium",
-            dependencies=[f"task_{start_id + 1}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 3}",
-            title="Perform refactoring",
-            description=f"Execute refactoring: {description}",
-            task_type=TaskType.REFACTOR,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="complex",
-            dependencies=[f"task_{start_id + 2}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 4}",
-            title="Verify tests pass",
-            description="Run all tests to ensure refactoring didn't break functionality",
-            task_type=TaskType.TEST,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="simple",
-            dependencies=[f"task_{start_id + 3}"],
-        ))
-
-        return tasks
-
-    def _plan_testing(self, description: str, start_id: int) -> list[PlannedTask]:
-        """Plan tasks for testing work."""
-        tasks = []
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 1}",
-            title="Analyze test requirements",
-            description="Identify what needs to be tested and current coverage gaps",
-            task_type=TaskType.ANALYSIS,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="simple",
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 2}",
-            title="Write tests",
-            description=f"Write tests for: {description}",
-            task_type=TaskType.TEST,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="medium",
-            dependencies=[f"task_{start_id + 1}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 3}",
-            title="Run and verify tests",
-            description="Execute tests and ensure they pass",
-            task_type=TaskType.TEST,
-            priority=TaskPriority.HIGH,
-            estimated_complexity="simple",
-            dependencies=[f"task_{start_id + 2}"],
-        ))
-
-        return tasks
-
-    def _plan_migration(self, description: str, start_id: int) -> list[PlannedTask]:
-        """Plan tasks for a migration."""
-        tasks = []
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 1}",
-            title="Analyze migration scope",
-            description="Identify all components affected by migration",
-            task_type=TaskType.ANALYSIS,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="complex",
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 2}",
-            title="Create migration plan",
-            description="Design step-by-step migration approach with rollback strategy",
-            task_type=TaskType.DESIGN,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="complex",
-            dependencies=[f"task_{start_id + 1}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 3}",
-            title="Implement migration",
-            description=f"Execute migration: {description}",
-            task_type=TaskType.MIGRATION,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="complex",
-            dependencies=[f"task_{start_id + 2}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 4}",
-            title="Verify migration",
-            description="Test all migrated components and verify functionality",
-            task_type=TaskType.TEST,
-            priority=TaskPriority.CRITICAL,
-            estimated_complexity="medium",
-            dependencies=[f"task_{start_id + 3}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 5}",
-            title="Document migration",
-            description="Document changes and update any affected documentation",
-            task_type=TaskType.DOCUMENTATION,
-            priority=TaskPriority.MEDIUM,
-            estimated_complexity="simple",
-            dependencies=[f"task_{start_id + 4}"],
-        ))
-
-        return tasks
-
-    def _plan_generic(
-        self,
-        description: str,
-        start_id: int,
-        task_type: TaskType,
-        priority: TaskPriority,
-    ) -> list[PlannedTask]:
-        """Plan tasks for generic work."""
-        tasks = []
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 1}",
-            title="Analyze and prepare",
-            description=f"Analyze requirements for: {description}",
-            task_type=TaskType.ANALYSIS,
-            priority=priority,
-            estimated_complexity="simple",
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 2}",
-            title="Execute task",
-            description=description,
-            task_type=task_type,
-            priority=priority,
-            estimated_complexity="medium",
-            dependencies=[f"task_{start_id + 1}"],
-        ))
-
-        tasks.append(PlannedTask(
-            id=f"task_{start_id + 3}",
-            title="Verify and complete",
-            description="Verify task completion and finalize",
-            task_type=TaskType.REVIEW,
-            priority=TaskPriority.MEDIUM,
-            estimated_complexity="simple",
-            dependencies=[f"task_{start_id + 2}"],
-        ))
-
-        return tasks
-
     async def _apply_impact_analysis(self, tasks: list[PlannedTask]) -> None:
         """Apply God Mode Impact Analysis to tasks."""
         if not self.impact_analyzer:
@@ -580,10 +786,14 @@ class PlannerAgent(BaseAgent):
 
         try:
             # Collect all files that might be affected
-            all_files = set()
-            for task in tasks:
-                all_files.update(task.files_to_modify)
-                all_files.update(task.files_to_create)
+            all_files = set(chain.from_iterable(
+                chain(task.files_to_modify, task.files_to_create) for task in tasks
+            ))
+
+            # Nothing declared to touch yet; skip the analyzer round trip
+            if not all_files:
+                logger.debug("Impact analysis skipped: no files declared")
+                return
 
             # Run impact analysis
             impact = await self.impact_analyzer.analyze_impact(
@@ -602,14 +812,23 @@ class PlannerAgent(BaseAgent):
                         [bc.description for bc in impact.breaking_changes]
                     )
 
+            # Index breaking changes by location so each task only looks up
+            # its own files
+            breaking = impact.breaking_changes
+            by_location: defaultdict[str, list[int]] = defaultdict(list)
+            for index, bc in enumerate(breaking):
+                by_location[bc.location].append(index)
+
             # Update tasks with impact severity
             for task in tasks:
                 if task.task_type in (TaskType.IMPLEMENTATION, TaskType.REFACTOR, TaskType.MIGRATION):
                     task.impact_severity = impact.severity.value
-                    task.breaking_changes = [
-                        bc.description for bc in impact.breaking_changes
-                        if any(f in task.files_to_modify for f in [bc.location])
-                    ]
+                    matched = sorted({
+                        index
+                        for path in set(task.files_to_modify)
+                        for index in by_location.get(path, ())
+                    })
+                    task.breaking_changes = [breaking[index].description for index in matched]
 
             logger.info(f"Impact Analysis: severity={impact.severity.value}, migration_required={impact.requires_migration_plan()}")
 
@@ -622,29 +841,51 @@ class PlannerAgent(BaseAgent):
             )
 
     def _organize_phases(self, tasks: list[PlannedTask]) -> list[list[str]]:
-        """Organize tasks into execution phases based on dependencies."""
-        phases: list[list[str]] = []
-        remaining = {t.id: t for t in tasks}
-        completed: set[str] = set()
-
-        while remaining:
-            # Find tasks with all dependencies satisfied
-            phase_tasks = []
-            for task_id, task in list(remaining.items()):
-                if all(d in completed for d in task.dependencies):
-                    phase_tasks.append(task_id)
-
-            if not phase_tasks:
-                # Circular dependency - add remaining tasks in a single phase
-                logger.warning("Circular dependency detected, adding remaining tasks")
-                phase_tasks = list(remaining.keys())
-
-            phases.append(phase_tasks)
+        """Organize tasks into execution phases based on dependencies.
+
+        Uses Kahn's algorithm: each phase is the frontier of tasks whose
+        in-degree has dropped to zero, so every dependency edge is visited once.
+        """
+        by_id = {t.id: t for t in tasks}
+
+        # Common case: no task depends on another, so everything is one phase
+        first_phase = [task_id for task_id, task in by_id.items() if not task.dependencies]
+        if first_phase and len(first_phase) == len(by_id):
+            return [first_phase]
+
+        order = {task_id: index for index, task_id in enumerate(by_id)}
+        in_degree: dict[str, int] = {}
+        successors: defaultdict[str, list[str]] = defaultdict(list)
+        for task_id, task in by_id.items():
+            in_degree[task_id] = len(task.dependencies)
+            for dep in task.dependencies:
+                successors[dep].append(task_id)
 
-            # Mark tasks as completed for next phase
-            for task_id in phase_tasks:
-                completed.add(task_id)
-                del remaining[task_id]
+        phases: list[list[str]] = []
+        placed = 0
+        frontier = first_phase
+
+        while frontier:
+            phases.append(frontier)
+            placed += len(frontier)
+
+            next_frontier: list[str] = []
+            for task_id in frontier:
+                for successor in successors.get(task_id, ()):
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        next_frontier.append(successor)
+
+            # Keep tasks within a phase in plan order; chains yield one task
+            # per phase, so most frontiers skip the sort entirely
+            if len(next_frontier) > 1:
+                next_frontier.sort(key=order.__getitem__)
+            frontier = next_frontier
+
+        if placed < len(by_id):
+            # Circular or unknown dependency - add remaining tasks in a single phase
+            logger.warning("Circular dependency detected, adding remaining tasks")
+            phases.append([task_id for task_id, degree in in_degree.items() if degree > 0])
 
         return phases
 
@@ -654,20 +895,12 @@ class PlannerAgent(BaseAgent):
             return
 
         # Calculate complexity
-        complexity_scores = {"simple": 1, "medium": 2, "complex": 3}
-        total_score = sum(
-            complexity_scores.get(t.estimated_complexity, 2)
-            for t in self._plan.tasks
-        )
-
+        total_score = sum(t.complexity_score for t in self._plan.tasks)
         avg_score = total_score / len(self._plan.tasks) if self._plan.tasks else 2
 
-        if avg_score < 1.5:
-            self._plan.estimated_total_complexity = "simple"
-        elif avg_score < 2.5:
-            self._plan.estimated_total_complexity = "medium"
-        else:
-            self._plan.estimated_total_complexity = "complex"
+        self._plan.estimated_total_complexity = _COMPLEXITY_LEVELS[
+            bisect_right(_COMPLEXITY_THRESHOLDS, avg_score)
+        ]
 
 
 async def run_followup_planner(
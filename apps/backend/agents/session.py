@@ -11,12 +11,19 @@ agent execution from initialization to completion.
 import asyncio
 import json
 import logging
+import os
+import shutil
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
+from weakref import WeakValueDictionary
 
+from .async_writer import AsyncSessionWriter
 from .base import (
     AgentConfig,
     AgentContext,
@@ -26,28 +33,70 @@ from .base import (
     AgentState,
     AgentStatus,
     ErrorSeverity,
+    json_dumps,
+    json_loads,
 )
 
 logger = logging.getLogger(__name__)
 
+# Files inside each session's directory: a small rewritable header and an
+# append-only message log
+SESSION_HEADER_FILE = "header.json"
+SESSION_MESSAGES_FILE = "messages.jsonl"
+# Map of session id -> created_at, so recent sessions can be picked without
+# loading every session
+SESSION_INDEX_FILE = "index.json"
+# Sessions each SessionStore keeps in memory
+SESSION_CACHE_SIZE = 128
+# How stale a message timestamp may be, in nanoseconds
+MESSAGE_CLOCK_RESOLUTION_NS = 5_000_000
 
-@dataclass
+# Session statuses whose timestamps no longer change
+_FINISHED_STATUSES = frozenset({"completed", "failed"})
+
+_clock_now: Optional[datetime] = None
+_clock_mono_ns = 0
+
+
+def _coarse_now() -> datetime:
+    """Get the current time, reusing the last reading while it is fresh enough.
+
+    Messages streamed in quick succession share one datetime object instead of
+    each taking a wall-clock reading.
+    """
+    global _clock_now, _clock_mono_ns
+    mono_ns = time.monotonic_ns()
+    if _clock_now is None or mono_ns - _clock_mono_ns > MESSAGE_CLOCK_RESOLUTION_NS:
+        _clock_now = datetime.now()
+        _clock_mono_ns = mono_ns
+    return _clock_now
+
+
+@dataclass(slots=True)
 class ConversationMessage:
-    """A message in the agent conversation."""
+    """A message in the agent conversation.
+
+    Messages are not edited once added to a session, so the serialized form
+    is built once and reused.
+    """
 
     role: str  # "user", "assistant", "system"
     content: str
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: datetime = field(default_factory=_coarse_now)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    _dict: Optional[dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
-            "role": self.role,
-            "content": self.content,
-            "timestamp": self.timestamp.isoformat(),
-            "metadata": self.metadata,
-        }
+        if self._dict is None:
+            self._dict = {
+                "role": self.role,
+                "content": self.content,
+                "timestamp": self.timestamp.isoformat(),
+                "metadata": self.metadata,
+            }
+        return self._dict
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> "ConversationMessage":
@@ -90,6 +139,11 @@ class SessionData:
     # Error information
     errors: list[dict[str, Any]] = field(default_factory=list)
 
+    # Duration of a finished session, with the timestamps it was computed from
+    _duration: Optional[tuple[datetime, datetime, float]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
     def add_message(self, role: str, content: str, metadata: Optional[dict] = None) -> None:
         """Add a message to the conversation."""
         self.messages.append(
@@ -101,14 +155,28 @@ class SessionData:
         )
 
     def get_duration_seconds(self) -> float:
-        """Get session duration in seconds."""
+        """Get session duration in seconds, cached once the session has finished."""
         if self.started_at is None:
             return 0.0
-        end = self.completed_at or datetime.now()
-        return (end - self.started_at).total_seconds()
+        if self.completed_at is None or self.status not in _FINISHED_STATUSES:
+            end = self.completed_at or datetime.now()
+            return (end - self.started_at).total_seconds()
+
+        cached = self._duration
+        if cached is not None and cached[0] == self.started_at and cached[1] == self.completed_at:
+            return cached[2]
+        duration = (self.completed_at - self.started_at).total_seconds()
+        self._duration = (self.started_at, self.completed_at, duration)
+        return duration
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
+        data = self.to_header_dict()
+        data["messages"] = [m.to_dict() for m in self.messages]
+        return data
+
+    def to_header_dict(self) -> dict[str, Any]:
+        """Convert everything but the message bodies to a dictionary."""
         return {
             "session_id": self.session_id,
             "spec_id": self.spec_id,
@@ -119,7 +187,7 @@ class SessionData:
             "status": self.status,
             "phase": self.phase,
             "result": self.result,
-            "messages": [m.to_dict() for m in self.messages],
+            "message_count": len(self.messages),
             "metrics": self.metrics,
             "artifacts": self.artifacts,
             "errors": self.errors,
@@ -153,67 +221,468 @@ class SessionData:
         return session
 
 
+def _write_atomic(path: Path, data: bytes, durable: bool = False) -> None:
+    """Write a file through a temporary sibling and an atomic rename.
+
+    Readers see either the old or the new contents, never a torn write.
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        if durable:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+@dataclass(slots=True)
+class _SessionWrite:
+    """Serialized session state ready to be written by the I/O thread."""
+
+    session_id: str
+    session_dir: Path
+    messages_mode: Optional[str]  # "w" to rewrite the log, "a" to append, None to skip
+    message_lines: list[bytes]
+    header: bytes
+    legacy_path: Path
+    start: int  # log position message_lines continue from
+    messages: list[ConversationMessage]  # snapshot, to rewrite the log if it fell behind
+    index: Optional[bytes] = None  # new index contents, if the index changed
+    durable: bool = False  # fsync the session's files
+
+
 class SessionStore:
-    """Persistent storage for session data."""
+    """Persistent storage for session data.
+
+    Each session lives in its own directory as a header file plus an
+    append-only JSONL message log, so saving after a new message appends one
+    line instead of rewriting the whole conversation. Messages are treated as
+    append-only; if the list is replaced or shortened the log is rewritten.
+    Sessions in the older single-file format are still loaded and are
+    migrated on their next save.
+
+    Disk I/O runs on a single store thread, so writes land in the order they
+    were made and the async methods never block the event loop.
+
+    Writes come in two durability classes. Ordinary saves hand data to the
+    OS without fsync; durable saves, used for terminal session states, fsync
+    the log and header before returning.
+
+    Up to SESSION_CACHE_SIZE sessions are kept in memory, least recently used
+    first out; sessions with a pending background save are never evicted.
+    """
 
     def __init__(self, sessions_dir: Path) -> None:
         """Initialize session store."""
         self.sessions_dir = sessions_dir
         self.sessions_dir.mkdir(parents=True, exist_ok=True)
-        self._cache: dict[str, SessionData] = {}
+        self._cache: OrderedDict[str, SessionData] = OrderedDict()
+        self._writer = AsyncSessionWriter(self._write)
+        # Contents of SESSION_INDEX_FILE, read on first use
+        self._index: Optional[dict[str, str]] = None
+        # Parsed index from the last _sync_index(), valid while the sessions
+        # directory keeps the recorded mtime and the index is not edited
+        self._index_times: Optional[dict[str, datetime]] = None
+        self._index_mtime_ns: Optional[int] = None
+        # Messages handed to the I/O thread for each session's log
+        self._logged_counts: dict[str, int] = {}
+        # State below is only read and written on the I/O thread:
+        # messages confirmed on disk in each session's log
+        self._disk_counts: dict[str, int] = {}
+        # Index contents whose write failed, retried with the next session write
+        self._unsaved_index: Optional[bytes] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_session_dir(self, session_id: str) -> Path:
+        """Get path to session directory."""
+        return self.sessions_dir / session_id
 
     def _get_session_path(self, session_id: str) -> Path:
-        """Get path to session file."""
+        """Get path to legacy single-file session."""
         return self.sessions_dir / f"{session_id}.json"
 
-    def save(self, session: SessionData) -> None:
-        """Save session to disk."""
-        path = self._get_session_path(session.session_id)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(session.to_dict(), f, indent=2)
+    def _cache_get(self, session_id: str) -> Optional[SessionData]:
+        """Get a cached session, marking it most recently used."""
+        session = self._cache.get(session_id)
+        if session is not None:
+            self._cache.move_to_end(session_id)
+        return session
+
+    def _cache_put(self, session: SessionData) -> None:
+        """Cache a session, evicting the least recently used ones over the limit."""
         self._cache[session.session_id] = session
+        self._cache.move_to_end(session.session_id)
+        if len(self._cache) <= SESSION_CACHE_SIZE:
+            return
+        evictable = [sid for sid in self._cache if not self._writer.has_pending(sid)]
+        for session_id in evictable[: len(self._cache) - SESSION_CACHE_SIZE]:
+            del self._cache[session_id]
+
+    def save(self, session: SessionData, durable: bool = False) -> None:
+        """Save session to disk, fsyncing it if durable."""
+        self._writer.discard(session.session_id)
+        self._submit_write(session, durable).result()
+        self._cache_put(session)
+
+    async def asave(self, session: SessionData, durable: bool = False) -> None:
+        """Save session to disk without blocking the event loop."""
+        self._writer.discard(session.session_id)
+        self._cache_put(session)
+        await asyncio.wrap_future(self._submit_write(session, durable))
+
+    def schedule_save(self, session: SessionData) -> None:
+        """Save session in the background, coalescing with other pending saves.
+
+        load() sees the new state right away through the cache; call flush()
+        when it must be on disk.
+        """
+        self._writer.schedule(session.session_id, session)
+        self._cache_put(session)
+
+    async def flush(self, session_id: Optional[str] = None) -> None:
+        """Write pending background saves, for one session or all of them."""
+        await self._writer.flush(session_id)
+
+    async def close(self) -> None:
+        """Write pending background saves and stop the writer."""
+        await self._writer.close()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the store's I/O thread, starting it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-store")
+        return self._executor
+
+    def _prepare_write(self, session: SessionData, durable: bool = False) -> _SessionWrite:
+        """Serialize the parts of session that need writing.
+
+        Runs on the caller's thread so the I/O thread never reads a session
+        that is still being mutated.
+        """
+        session_id = session.session_id
+        messages = session.messages
+        logged = self._logged_counts.get(session_id)
+        if logged is None or logged > len(messages):
+            mode: Optional[str] = "w"
+            logged = 0
+        elif logged < len(messages):
+            mode = "a"
+        else:
+            mode = None
+        self._logged_counts[session_id] = len(messages)
+
+        index = self._get_index()
+        index_bytes = None
+        if session_id not in index:
+            index[session_id] = session.created_at.isoformat()
+            index_bytes = json_dumps(index)
+            self._index_times = None
+
+        return _SessionWrite(
+            session_id=session_id,
+            session_dir=self._get_session_dir(session_id),
+            messages_mode=mode,
+            message_lines=[json_dumps(m.to_dict()) + b"\n" for m in messages[logged:]],
+            header=json_dumps(session.to_header_dict(), indent=True),
+            legacy_path=self._get_session_path(session_id),
+            start=logged,
+            messages=list(messages),
+            index=index_bytes,
+            durable=durable,
+        )
+
+    def _get_index(self) -> dict[str, str]:
+        """Get the session id -> created_at index, reading it on first use."""
+        if self._index is None:
+            index_path = self.sessions_dir / SESSION_INDEX_FILE
+            try:
+                with open(index_path, "rb") as f:
+                    self._index = json_loads(f.read())
+            except FileNotFoundError:
+                self._index = {}
+            except ValueError as e:
+                logger.warning(f"Rebuilding session index: {e}")
+                self._index = {}
+        return self._index
+
+    def _submit_write(self, session: SessionData, durable: bool = False) -> "Future[None]":
+        """Queue session for writing on the I/O thread."""
+        return self._get_executor().submit(self._write_files, self._prepare_write(session, durable))
+
+    def _write_files(self, write: _SessionWrite) -> None:
+        """Write one prepared session to disk. Runs on the I/O thread.
+
+        The on-disk message count only advances once a write succeeds. After
+        a failed write the log is rewritten from the snapshot, so messages
+        that never reached disk are not skipped by later appends.
+        """
+        try:
+            self._write_session_files(write)
+        except BaseException:
+            self._disk_counts.pop(write.session_id, None)
+            if write.index is not None:
+                self._unsaved_index = write.index
+            raise
+        self._disk_counts[write.session_id] = len(write.messages)
+
+    def _write_session_files(self, write: _SessionWrite) -> None:
+        """Write a session's log, header and index entry."""
+        write.session_dir.mkdir(exist_ok=True)
+
+        mode, lines = write.messages_mode, write.message_lines
+        if mode != "w" and self._disk_counts.get(write.session_id) != write.start:
+            # An earlier write failed, so the log is missing messages before start
+            mode, lines = "w", [json_dumps(m.to_dict()) + b"\n" for m in write.messages]
+
+        messages_path = write.session_dir / SESSION_MESSAGES_FILE
+        if mode is not None:
+            with open(messages_path, mode + "b") as f:
+                f.writelines(lines)
+                if write.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
+        elif write.durable and messages_path.exists():
+            # Earlier appends may still be only in the page cache
+            with open(messages_path, "ab") as f:
+                os.fsync(f.fileno())
+
+        _write_atomic(write.session_dir / SESSION_HEADER_FILE, write.header, write.durable)
+
+        if write.legacy_path.exists():
+            write.legacy_path.unlink()
+        # Fall back to an index whose earlier write failed
+        index = write.index if write.index is not None else self._unsaved_index
+        if index is not None:
+            self._write_index(index)
+
+    def _write(self, session: SessionData) -> Optional["asyncio.Future[None]"]:
+        """Write session for the background writer, awaitably when a loop is running."""
+        future = self._submit_write(session)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            future.result()
+            return None
+        return asyncio.wrap_future(future)
 
     def load(self, session_id: str) -> Optional[SessionData]:
         """Load session from disk."""
+        session = self._cache_get(session_id)
+        if session is not None:
+            return session
+        return self._loaded(session_id, *self._get_executor().submit(self._read, session_id).result())
+
+    async def aload(self, session_id: str) -> Optional[SessionData]:
+        """Load session from disk without blocking the event loop."""
+        session = self._cache_get(session_id)
+        if session is not None:
+            return session
+        session, logged = await asyncio.wrap_future(
+            self._get_executor().submit(self._read, session_id)
+        )
+        # Another task may have cached the session while this one waited
         if session_id in self._cache:
             return self._cache[session_id]
+        return self._loaded(session_id, session, logged)
 
-        path = self._get_session_path(session_id)
-        if not path.exists():
-            return None
+    def _loaded(
+        self,
+        session_id: str,
+        session: Optional[SessionData],
+        logged: Optional[int],
+    ) -> Optional[SessionData]:
+        """Cache a session just read from disk."""
+        if session is not None:
+            if logged is not None:
+                self._logged_counts[session_id] = logged
+            self._cache_put(session)
+        return session
+
+    def _read(self, session_id: str) -> tuple[Optional[SessionData], Optional[int]]:
+        """Read session from disk, with the number of messages in its log.
+
+        The count is None for legacy single-file sessions, which have no log.
+        """
+        session_dir = self._get_session_dir(session_id)
+        header_path = session_dir / SESSION_HEADER_FILE
+        legacy_path = self._get_session_path(session_id)
 
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            session = SessionData.from_dict(data)
-            self._cache[session_id] = session
-            return session
+            if header_path.exists():
+                with open(header_path, "rb") as f:
+                    session = SessionData.from_dict(json_loads(f.read()))
+                session.messages = list(self.iter_messages(session_id))
+                self._disk_counts[session_id] = len(session.messages)
+                return session, len(session.messages)
+            if legacy_path.exists():
+                with open(legacy_path, "rb") as f:
+                    self._disk_counts.pop(session_id, None)
+                    return SessionData.from_dict(json_loads(f.read())), None
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to load session {session_id}: {e}")
-            return None
+
+        return None, None
+
+    def load_header(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Load a session's header fields from disk without its messages.
+
+        Legacy single-file sessions have to be parsed in full.
+        """
+        header_path = self._get_session_dir(session_id) / SESSION_HEADER_FILE
+        legacy_path = self._get_session_path(session_id)
+        try:
+            if header_path.exists():
+                with open(header_path, "rb") as f:
+                    return json_loads(f.read())
+            if legacy_path.exists():
+                with open(legacy_path, "rb") as f:
+                    data = json_loads(f.read())
+                data["message_count"] = len(data.pop("messages", ()))
+                return data
+        except ValueError as e:
+            logger.error(f"Failed to load session header {session_id}: {e}")
+        return None
+
+    def load_summary(self, session_id: str) -> Optional[dict[str, Any]]:
+        """Summarize a session, reading only its header unless it is cached."""
+        session = self._cache_get(session_id)
+        if session is not None:
+            message_count = len(session.messages)
+        else:
+            header = self.load_header(session_id)
+            if header is None:
+                return None
+            try:
+                session = SessionData.from_dict(header)
+            except (KeyError, ValueError) as e:
+                logger.error(f"Failed to load session header {session_id}: {e}")
+                return None
+            message_count = header.get("message_count", 0)
+
+        return {
+            "session_id": session.session_id,
+            "status": session.status,
+            "created_at": session.created_at,
+            "started_at": session.started_at,
+            "completed_at": session.completed_at,
+            "duration_seconds": session.get_duration_seconds(),
+            "metrics": session.metrics,
+            "artifact_keys": list(session.artifacts),
+            "message_count": message_count,
+            "error_count": len(session.errors),
+        }
+
+    def iter_messages(self, session_id: str) -> Iterator[ConversationMessage]:
+        """Stream a session's logged messages from disk, one line at a time.
+
+        A trailing line without a newline is an unfinished write and is skipped.
+        """
+        messages_path = self._get_session_dir(session_id) / SESSION_MESSAGES_FILE
+        try:
+            f = open(messages_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                if line.strip():
+                    yield ConversationMessage.from_dict(json_loads(line))
 
     def delete(self, session_id: str) -> bool:
         """Delete session from disk."""
+        self._writer.discard(session_id)
+        index = self._get_index()
+        index_bytes = None
+        if index.pop(session_id, None) is not None:
+            index_bytes = json_dumps(index)
+            self._index_times = None
+        self._get_executor().submit(self._remove, session_id, index_bytes).result()
+        self._cache.pop(session_id, None)
+        self._logged_counts.pop(session_id, None)
+        return True
+
+    def _remove(self, session_id: str, index: Optional[bytes]) -> None:
+        """Remove session files from disk."""
+        self._disk_counts.pop(session_id, None)
+        shutil.rmtree(self._get_session_dir(session_id), ignore_errors=True)
         path = self._get_session_path(session_id)
         if path.exists():
             path.unlink()
-        self._cache.pop(session_id, None)
-        return True
+        if index is not None:
+            self._write_index(index)
 
     def list_sessions(self) -> list[str]:
         """List all session IDs."""
-        return [p.stem for p in self.sessions_dir.glob("*.json")]
+        session_ids = [p.parent.name for p in self.sessions_dir.glob(f"*/{SESSION_HEADER_FILE}")]
+        known = set(session_ids)
+        session_ids.extend(
+            p.stem
+            for p in self.sessions_dir.glob("*.json")
+            if p.stem not in known and p.name != SESSION_INDEX_FILE
+        )
+        return session_ids
 
     def get_recent_sessions(self, limit: int = 10) -> list[SessionData]:
-        """Get most recent sessions."""
+        """Get most recent sessions.
+
+        Sessions are ordered through the index, so only the ones returned
+        are loaded.
+        """
+        created = self._sync_index()
         sessions = []
-        for session_id in self.list_sessions():
+        for session_id in sorted(created, key=created.__getitem__, reverse=True):
+            if len(sessions) >= limit:
+                break
             session = self.load(session_id)
             if session:
                 sessions.append(session)
-
-        sessions.sort(key=lambda s: s.created_at, reverse=True)
-        return sessions[:limit]
+        return sessions
+
+    def _sync_index(self) -> dict[str, datetime]:
+        """Reconcile the index with the sessions on disk.
+
+        Returns creation times by session id. Sessions missing from the
+        index, such as legacy files, have their headers read to add them.
+        Adding or removing a session changes the directory's mtime, so the
+        listing is skipped while the mtime is the one last seen.
+        """
+        mtime_ns = self.sessions_dir.stat().st_mtime_ns
+        if self._index_times is not None and mtime_ns == self._index_mtime_ns:
+            return self._index_times
+
+        index = self._get_index()
+        on_disk = self.list_sessions()
+        known = set(on_disk)
+        stale = [sid for sid in index if sid not in known]
+        for session_id in stale:
+            del index[session_id]
+        added = False
+        for session_id in on_disk:
+            if session_id not in index:
+                header = self.load_header(session_id)
+                if header is not None and "created_at" in header:
+                    index[session_id] = header["created_at"]
+                    added = True
+
+        if stale or added:
+            index_bytes = json_dumps(index)
+            self._get_executor().submit(self._write_index, index_bytes).result()
+            # Writing the index may have created it
+            mtime_ns = self.sessions_dir.stat().st_mtime_ns
+
+        self._index_times = {sid: datetime.fromisoformat(created) for sid, created in index.items()}
+        self._index_mtime_ns = mtime_ns
+        return self._index_times
+
+    def _write_index(self, index: bytes) -> None:
+        """Write the index file. Runs on the I/O thread."""
+        _write_atomic(self.sessions_dir / SESSION_INDEX_FILE, index)
+        # Any index written here is at least as new as a failed one
+        self._unsaved_index = None
 
 
 class SessionOrchestrator:
@@ -232,7 +701,8 @@ class SessionOrchestrator:
         self.config = config or AgentConfig()
 
         self._active_sessions: dict[str, SessionData] = {}
-        self._locks: dict[str, asyncio.Lock] = {}
+        # Held only while in use, so finished sessions do not leave locks behind
+        self._locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
 
     def create_session(
         self,
@@ -269,7 +739,25 @@ class SessionOrchestrator:
         agent_context: Optional[AgentContext] = None,
     ) -> SessionData:
         """Start an agent session."""
-        session = self.store.load(session_id)
+        return await self._start_session(session_id, "initializing")
+
+    async def start_session_with_phase(
+        self,
+        session_id: str,
+        phase: str,
+        message: Optional[str] = None,
+    ) -> SessionData:
+        """Start an agent session directly in phase, persisting both in one save."""
+        return await self._start_session(session_id, phase, message)
+
+    async def _start_session(
+        self,
+        session_id: str,
+        phase: str,
+        message: Optional[str] = None,
+    ) -> SessionData:
+        """Mark a session running in phase and save it once."""
+        session = await self.store.aload(session_id)
         if session is None:
             raise ValueError(f"Session {session_id} not found")
 
@@ -277,13 +765,14 @@ class SessionOrchestrator:
             raise ValueError(f"Session {session_id} cannot be started (status: {session.status})")
 
         # Get or create lock for this session
-        if session_id not in self._locks:
-            self._locks[session_id] = asyncio.Lock()
+        lock = self._locks.get(session_id)
+        if lock is None:
+            lock = self._locks[session_id] = asyncio.Lock()
 
-        async with self._locks[session_id]:
+        async with lock:
             session.started_at = datetime.now()
             session.status = "running"
-            session.phase = "initializing"
+            session.phase = phase
 
             self._active_sessions[session_id] = session
 
@@ -292,8 +781,10 @@ class SessionOrchestrator:
                 "Session started",
                 {"started_at": session.started_at.isoformat()},
             )
+            if message:
+                session.add_message("system", message, {"phase": phase})
 
-            self.store.save(session)
+            await self.store.asave(session)
 
         logger.info(f"Started session {session_id}")
         return session
@@ -307,7 +798,7 @@ class SessionOrchestrator:
         """Update session phase."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             return
@@ -316,7 +807,7 @@ class SessionOrchestrator:
         if message:
             session.add_message("system", message, {"phase": phase})
 
-        self.store.save(session)
+        self.store.schedule_save(session)
 
     async def add_agent_message(
         self,
@@ -327,13 +818,13 @@ class SessionOrchestrator:
         """Add an assistant message to the session."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             return
 
         session.add_message("assistant", content, metadata)
-        self.store.save(session)
+        self.store.schedule_save(session)
 
     async def add_user_message(
         self,
@@ -344,13 +835,13 @@ class SessionOrchestrator:
         """Add a user message to the session."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             return
 
         session.add_message("user", content, metadata)
-        self.store.save(session)
+        self.store.schedule_save(session)
 
     async def record_error(
         self,
@@ -360,7 +851,7 @@ class SessionOrchestrator:
         """Record an error in the session."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             return
@@ -375,8 +866,9 @@ class SessionOrchestrator:
         if error.severity == ErrorSeverity.FATAL:
             session.status = "failed"
             session.phase = "failed"
-
-        self.store.save(session)
+            await self.store.asave(session, durable=True)
+        else:
+            self.store.schedule_save(session)
 
     async def complete_session(
         self,
@@ -388,7 +880,7 @@ class SessionOrchestrator:
         """Complete a session successfully."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             raise ValueError(f"Session {session_id} not found")
@@ -411,7 +903,7 @@ class SessionOrchestrator:
         )
 
         self._active_sessions.pop(session_id, None)
-        self.store.save(session)
+        await self.store.asave(session, durable=True)
 
         logger.info(f"Completed session {session_id}: {result[:50]}...")
         return session
@@ -425,7 +917,7 @@ class SessionOrchestrator:
         """Mark a session as failed."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             raise ValueError(f"Session {session_id} not found")
@@ -445,7 +937,7 @@ class SessionOrchestrator:
         )
 
         self._active_sessions.pop(session_id, None)
-        self.store.save(session)
+        await self.store.asave(session, durable=True)
 
         logger.error(f"Failed session {session_id}: {reason}")
         return session
@@ -454,7 +946,7 @@ class SessionOrchestrator:
         """Pause a running session."""
         session = self._active_sessions.get(session_id)
         if session is None:
-            session = self.store.load(session_id)
+            session = await self.store.aload(session_id)
 
         if session is None:
             raise ValueError(f"Session {session_id} not found")
@@ -462,14 +954,14 @@ class SessionOrchestrator:
         session.status = "paused"
         session.add_message("system", "Session paused")
 
-        self.store.save(session)
+        await self.store.asave(session)
         logger.info(f"Paused session {session_id}")
 
         return session
 
     async def resume_session(self, session_id: str) -> SessionData:
         """Resume a paused session."""
-        session = self.store.load(session_id)
+        session = await self.store.aload(session_id)
         if session is None:
             raise ValueError(f"Session {session_id} not found")
 
@@ -480,33 +972,38 @@ class SessionOrchestrator:
         session.add_message("system", "Session resumed")
 
         self._active_sessions[session_id] = session
-        self.store.save(session)
+        await self.store.asave(session)
 
         logger.info(f"Resumed session {session_id}")
         return session
 
+    async def close(self) -> None:
+        """Write any session state still waiting on the background writer."""
+        await self.store.close()
+
     def get_active_sessions(self) -> list[SessionData]:
         """Get all active sessions."""
         return list(self._active_sessions.values())
 
     def cleanup_stale_sessions(self, max_age_hours: int = 24) -> int:
         """Cleanup sessions that have been running too long."""
-        cleaned = 0
-        cutoff = datetime.now()
+        now = datetime.now()
+        started_before = now - timedelta(hours=max_age_hours)
 
-        for session in list(self._active_sessions.values()):
-            if session.started_at:
-                age_hours = (cutoff - session.started_at).total_seconds() / 3600
-                if age_hours > max_age_hours:
-                    session.status = "failed"
-                    session.result = "Session timed out"
-                    session.completed_at = cutoff
-                    self.store.save(session)
-                    self._active_sessions.pop(session.session_id, None)
-                    cleaned += 1
-                    logger.warning(f"Cleaned up stale session {session.session_id}")
+        stale = [
+            session
+            for session in self._active_sessions.values()
+            if session.started_at and session.started_at < started_before
+        ]
+        for session in stale:
+            session.status = "failed"
+            session.result = "Session timed out"
+            session.completed_at = now
+            self.store.save(session, durable=True)
+            self._active_sessions.pop(session.session_id, None)
+            logger.warning(f"Cleaned up stale session {session.session_id}")
 
-        return cleaned
+        return len(stale)
 
 
 async def run_agent_session(
@@ -555,27 +1052,28 @@ async def post_session_processing(
     repo_root: Path,
 ) -> dict[str, Any]:
     """Perform post-session processing tasks."""
-    session = orchestrator.get_session(session_id)
-    if session is None:
+    # Only the header is needed; message bodies stay on disk
+    summary = orchestrator.store.load_summary(session_id)
+    if summary is None:
         return {"error": f"Session {session_id} not found"}
 
     results: dict[str, Any] = {
         "session_id": session_id,
-        "status": session.status,
-        "duration_seconds": session.get_duration_seconds(),
+        "status": summary["status"],
+        "duration_seconds": summary["duration_seconds"],
     }
 
     # Only process completed sessions
-    if session.status != "completed":
+    if summary["status"] != "completed":
         results["skipped"] = True
-        results["reason"] = f"Session not completed (status: {session.status})"
+        results["reason"] = f"Session not completed (status: {summary['status']})"
         return results
 
     # Collect statistics
-    results["metrics"] = session.metrics
-    results["artifacts"] = list(session.artifacts.keys())
-    results["message_count"] = len(session.messages)
-    results["error_count"] = len(session.errors)
+    results["metrics"] = summary["metrics"]
+    results["artifacts"] = summary["artifact_keys"]
+    results["message_count"] = summary["message_count"]
+    results["error_count"] = summary["error_count"]
 
     # Log summary
     logger.info(
@@ -7,20 +7,40 @@ This package provides the command-line interface for the application,
 including the main entry point, command handlers, and terminal formatting.
 """
 
+import importlib
+from typing import Any
+
 from .entry import main, create_parser, CLIApplication, VERSION
-from .formatter import (
-    TerminalFormatter,
-    FormatterConfig,
-    Color,
-    Style,
-    create_formatter,
-)
-from .commands import (
-    StartCommand,
-    StatusCommand,
-    ConfigCommand,
-    QACommand,
-)
+
+# The formatter and command handlers pull in the spec, qa and agent layers,
+# so they are imported on first attribute access (PEP 562).
+_LAZY_IMPORTS: dict[str, str] = {
+    # Formatter
+    "Color": ".formatter",
+    "FormatterConfig": ".formatter",
+    "Style": ".formatter",
+    "TerminalFormatter": ".formatter",
+    "create_formatter": ".formatter",
+    # Commands
+    "ConfigCommand": ".commands",
+    "QACommand": ".commands",
+    "StartCommand": ".commands",
+    "StatusCommand": ".commands",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     "main",
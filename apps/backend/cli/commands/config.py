@@ -8,10 +8,13 @@ Handles configuration management for the CLI.
 
 import json
 import logging
+import os
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
+from agents.base import json_dumps, json_loads
 from core.platform import get_config_dir
 
 from ..formatter import TerminalFormatter
@@ -28,6 +31,16 @@ DEFAULT_CONFIG = {
     "color_output": True,
 }
 
+# Value type of every known key, used to coerce values set from the CLI
+_KEY_TYPES: dict[str, type] = {key: type(value) for key, value in DEFAULT_CONFIG.items()}
+
+_BOOL_VALUES = {"true": True, "false": False}
+_INT_RE = re.compile(r"-?\d+")
+_FLOAT_RE = re.compile(r"-?\d+\.\d+(?:[eE][-+]?\d+)?")
+# Anything int() or float() might accept starts like this; other strings
+# skip the conversion attempts entirely
+_NUMERIC_PREFIX_RE = re.compile(r"\s*[-+]?(?:\d|\.\d|inf|nan)", re.IGNORECASE)
+
 
 @dataclass
 class ConfigOptions:
@@ -50,26 +63,40 @@ class ConfigResult:
 
 
 class ConfigManager:
-    """Manages configuration storage and retrieval."""
+    """Manages configuration storage and retrieval.
+
+    The parsed file is cached and re-read only when its mtime changes.
+    """
 
     def __init__(self, config_dir: Optional[Path] = None) -> None:
         """Initialize config manager."""
         self.config_dir = config_dir or get_config_dir()
         self.config_file = self.config_dir / "config.json"
         self._cache: Optional[dict[str, Any]] = None
+        self._mtime_ns: Optional[int] = None
+
+    def _stat_mtime_ns(self) -> Optional[int]:
+        """Get the config file's mtime, or None if it does not exist."""
+        try:
+            return self.config_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
 
     def load(self) -> dict[str, Any]:
         """Load configuration from file."""
-        if self._cache is not None:
+        mtime_ns = self._stat_mtime_ns()
+        if self._cache is not None and mtime_ns == self._mtime_ns:
             return self._cache
 
-        if not self.config_file.exists():
+        self._mtime_ns = mtime_ns
+        if mtime_ns is None:
             self._cache = DEFAULT_CONFIG.copy()
             return self._cache
 
         try:
-            with open(self.config_file, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
+            with open(self.config_file, "rb") as f:
+                data = f.read()
+            loaded = json_loads(data)
             self._cache = {**DEFAULT_CONFIG, **loaded}
             return self._cache
         except (json.JSONDecodeError, OSError) as e:
@@ -81,10 +108,15 @@ class ConfigManager:
         """Save configuration to file."""
         self.config_dir.mkdir(parents=True, exist_ok=True)
 
-        with open(self.config_file, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=2)
+        data = json_dumps(config, indent=True)
+        # Write through a temporary file so a crash never leaves a torn config
+        tmp_file = self.config_file.with_name(self.config_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(data)
+        os.replace(tmp_file, self.config_file)
 
         self._cache = config
+        self._mtime_ns = self._stat_mtime_ns()
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
@@ -143,10 +175,12 @@ class ConfigCommand:
 
     def _handle_set(self, key: str, value: str) -> ConfigResult:
         """Handle setting a config value."""
-        if key not in DEFAULT_CONFIG:
+        key_type = _KEY_TYPES.get(key)
+        if key_type is None:
             self.formatter.warning(f"Unknown configuration key: {key}")
-
-        parsed_value = self._parse_value(value)
+            parsed_value = self._parse_value(value)
+        else:
+            parsed_value = self._coerce_value(value, key_type)
         self.config_manager.set(key, parsed_value)
         self.formatter.success(f"Set {key} = {parsed_value}")
 
@@ -193,12 +227,33 @@ class ConfigCommand:
             message="Configuration listed",
         )
 
+    def _coerce_value(self, value: str, key_type: type) -> Any:
+        """Convert a string value to a known key's type, or parse it generically."""
+        if key_type is str:
+            return value
+        if key_type is bool:
+            boolean = _BOOL_VALUES.get(value.lower())
+            if boolean is not None:
+                return boolean
+        elif key_type is int:
+            if _INT_RE.fullmatch(value):
+                return int(value)
+        elif key_type is float:
+            if _FLOAT_RE.fullmatch(value) or _INT_RE.fullmatch(value):
+                return float(value)
+        return self._parse_value(value)
+
     def _parse_value(self, value: str) -> Any:
         """Parse a string value to appropriate type."""
-        if value.lower() == "true":
-            return True
-        if value.lower() == "false":
-            return False
+        boolean = _BOOL_VALUES.get(value.lower())
+        if boolean is not None:
+            return boolean
+        if _INT_RE.fullmatch(value):
+            return int(value)
+        if _FLOAT_RE.fullmatch(value):
+            return float(value)
+        if not _NUMERIC_PREFIX_RE.match(value):
+            return value
         try:
             return int(value)
         except ValueError:
@@ -210,13 +265,25 @@ class ConfigCommand:
         return value
 
 
+# Shared manager for the convenience functions, replaced if the config
+# directory changes
+_default_manager: Optional[ConfigManager] = None
+
+
+def _get_default_manager() -> ConfigManager:
+    """Get the shared config manager for the current config directory."""
+    global _default_manager
+    config_dir = get_config_dir()
+    if _default_manager is None or _default_manager.config_dir != config_dir:
+        _default_manager = ConfigManager(config_dir)
+    return _default_manager
+
+
 def get_config_value(key: str, default: Any = None) -> Any:
     """Convenience function to get a config value."""
-    manager = ConfigManager()
-    return manager.get(key, default)
+    return _get_default_manager().get(key, default)
 
 
 def set_config_value(key: str, value: Any) -> None:
     """Convenience function to set a config value."""
-    manager = ConfigManager()
-    manager.set(key, value)
+    _get_default_manager().set(key, value)
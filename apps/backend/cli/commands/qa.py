@@ -6,12 +6,13 @@ Part of Claude God Code - Autonomous Excellence
 Handles running QA validation loops and displaying QA status.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable, Optional
 
-from spec.models import get_specs_dir
+from spec.models import find_spec_dir, get_specs_dir
 from qa.loop import QALoop, QALoopConfig, QALoopState, QAPhase
 from qa.criteria import get_qa_signoff_status, QASignoff
 from qa.fixer import run_qa_fixer
@@ -20,6 +21,11 @@ from ..formatter import TerminalFormatter
 
 logger = logging.getLogger(__name__)
 
+# Progress log lines held for the next batched write before writing directly
+LOG_QUEUE_SIZE = 256
+# Seconds between batched progress log writes
+LOG_FLUSH_INTERVAL_SECONDS = 0.05
+
 
 @dataclass
 class QAOptions:
@@ -54,11 +60,13 @@ class QACommand:
     ) -> None:
         """Initialize QA command."""
         self.formatter = formatter
+        self._log_queue: Optional[asyncio.Queue[tuple[str, str]]] = None
+        self._log_task: Optional[asyncio.Task[None]] = None
 
     async def execute(self, options: QAOptions) -> QAResult:
         """Execute the QA command."""
         specs_dir = get_specs_dir(options.project_dir)
-        spec_dir = self._find_spec_dir(specs_dir, options.spec_name)
+        spec_dir = await asyncio.to_thread(self._find_spec_dir, specs_dir, options.spec_name)
 
         if spec_dir is None:
             self.formatter.error(f"Spec not found: {options.spec_name}")
@@ -83,9 +91,13 @@ class QACommand:
         self.formatter.section("Progress")
 
         try:
-            state = await qa_loop.run()
+            self._start_log_drain()
+            try:
+                state = await qa_loop.run()
+            finally:
+                await self._stop_log_drain()
 
-            signoff = get_qa_signoff_status(spec_dir)
+            signoff = await asyncio.to_thread(get_qa_signoff_status, spec_dir)
             if signoff:
                 self.formatter.format_qa_status(signoff, state)
 
@@ -122,19 +134,49 @@ class QACommand:
 
     def _find_spec_dir(self, specs_dir: Path, spec_name: str) -> Optional[Path]:
         """Find a spec directory by name or number."""
-        if not specs_dir.exists():
-            return None
-
-        for spec_path in specs_dir.glob("*"):
-            if spec_path.is_dir():
-                if spec_path.name == spec_name:
-                    return spec_path
-                if spec_path.name.startswith(f"{spec_name}-"):
-                    return spec_path
-                if spec_name in spec_path.name:
-                    return spec_path
-
-        return None
+        return find_spec_dir(specs_dir, spec_name)
+
+    def _start_log_drain(self) -> None:
+        """Start batching progress logs through a queue drained in the background."""
+        self._log_queue = asyncio.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_task = asyncio.create_task(self._drain_logs())
+
+    async def _stop_log_drain(self) -> None:
+        """Stop the background drain and write any logs still queued."""
+        if self._log_task is not None:
+            self._log_task.cancel()
+            try:
+                await self._log_task
+            except asyncio.CancelledError:
+                pass
+            self._log_task = None
+        self._flush_logs()
+        self._log_queue = None
+
+    async def _drain_logs(self) -> None:
+        """Write queued progress logs once per flush interval."""
+        while True:
+            await asyncio.sleep(LOG_FLUSH_INTERVAL_SECONDS)
+            self._flush_logs()
+
+    def _flush_logs(self) -> None:
+        """Write every queued progress log in one batch."""
+        if self._log_queue is None or self._log_queue.empty():
+            return
+        entries = []
+        while not self._log_queue.empty():
+            entries.append(self._log_queue.get_nowait())
+        self.formatter.stream_log_batch(entries)
+
+    def _log(self, message: str, level: str) -> None:
+        """Queue a progress log, or write it directly when not batching."""
+        if self._log_queue is not None:
+            try:
+                self._log_queue.put_nowait((message, level))
+                return
+            except asyncio.QueueFull:
+                self._flush_logs()
+        self.formatter.stream_log(message, level=level)
 
     def _create_phase_callback(self) -> Callable[[QAPhase, str], None]:
         """Create callback for phase changes."""
@@ -144,24 +186,21 @@ class QACommand:
                 level = "error"
             elif phase == QAPhase.COMPLETE:
                 level = "info"
-            self.formatter.stream_log(f"[{phase.value}] {message}", level=level)
+            self._log(f"[{phase.value}] {message}", level)
 
         return on_phase_change
 
     def _create_iteration_callback(self) -> Callable[[int, str], None]:
         """Create callback for iteration completions."""
         def on_iteration_complete(iteration: int, status: str) -> None:
-            self.formatter.stream_log(
-                f"Iteration {iteration} complete: {status}",
-                level="info",
-            )
+            self._log(f"Iteration {iteration} complete: {status}", "info")
 
         return on_iteration_complete
 
     async def run_fix_only(self, options: QAOptions) -> QAResult:
         """Run only the fix phase without full QA loop."""
         specs_dir = get_specs_dir(options.project_dir)
-        spec_dir = self._find_spec_dir(specs_dir, options.spec_name)
+        spec_dir = await asyncio.to_thread(self._find_spec_dir, specs_dir, options.spec_name)
 
         if spec_dir is None:
             self.formatter.error(f"Spec not found: {options.spec_name}")
@@ -172,7 +211,7 @@ class QACommand:
 
         self.formatter.header("Claude God Code", f"Fix Issues: {spec_dir.name}")
 
-        signoff = get_qa_signoff_status(spec_dir)
+        signoff = await asyncio.to_thread(get_qa_signoff_status, spec_dir)
         if not signoff or not signoff.issues_found:
             self.formatter.info("No issues found to fix")
             return QAResult(
@@ -211,7 +250,7 @@ class QACommand:
     async def show_status(self, options: QAOptions) -> QAResult:
         """Show QA status without running the loop."""
         specs_dir = get_specs_dir(options.project_dir)
-        spec_dir = self._find_spec_dir(specs_dir, options.spec_name)
+        spec_dir = await asyncio.to_thread(self._find_spec_dir, specs_dir, options.spec_name)
 
         if spec_dir is None:
             self.formatter.error(f"Spec not found: {options.spec_name}")
@@ -220,7 +259,7 @@ class QACommand:
                 message=f"Spec not found: {options.spec_name}",
             )
 
-        signoff = get_qa_signoff_status(spec_dir)
+        signoff = await asyncio.to_thread(get_qa_signoff_status, spec_dir)
         if signoff:
             self.formatter.format_qa_status(signoff)
             return QAResult(
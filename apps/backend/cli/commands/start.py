@@ -6,25 +6,21 @@ Part of Claude God Code - Autonomous Excellence
 Handles starting new specifications and sessions.
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from spec.models import get_specs_dir, create_spec_dir, Specification
-from spec.discovery import ProjectDiscovery
-from spec.pipeline import SpecPipeline
-from spec.impact import ImpactAnalyzer
-
-from agents.session import SessionOrchestrator
-from agents.planner import PlannerAgent
-from agents.coder import CoderAgent
-from agents.base import AgentConfig, AgentContext
-
-from core.worktree import WorktreeManager
+from spec.models import get_specs_dir, create_spec_dir
 
 from ..formatter import TerminalFormatter
 
+# Agent, discovery and worktree modules are imported where they are used, so
+# loading the command package for status or qa does not pay for them
+if TYPE_CHECKING:
+    from agents.session import SessionOrchestrator
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,26 +53,41 @@ class StartCommand:
     def __init__(
         self,
         formatter: TerminalFormatter,
-        orchestrator: Optional[SessionOrchestrator] = None,
+        orchestrator: Optional["SessionOrchestrator"] = None,
     ) -> None:
         """Initialize start command."""
         self.formatter = formatter
         self._orchestrator = orchestrator
 
-    def _get_orchestrator(self, project_dir: Path) -> SessionOrchestrator:
+    def _get_orchestrator(self, project_dir: Path) -> "SessionOrchestrator":
         """Get or create session orchestrator."""
         if self._orchestrator is None:
+            from agents.session import SessionOrchestrator
+
             self._orchestrator = SessionOrchestrator(project_dir)
         return self._orchestrator
 
+    async def _close_orchestrator(self) -> None:
+        """Write background session saves before the event loop goes away."""
+        if self._orchestrator is not None:
+            await self._orchestrator.close()
+
     async def execute(self, options: StartOptions) -> StartResult:
         """Execute the start command."""
         self.formatter.header("Claude God Code", "New Specification")
         self.formatter.info(f"Task: {options.task_description}")
 
+        from spec.discovery import ProjectDiscovery
+        from spec.impact import ImpactAnalyzer
+
         try:
             discovery = ProjectDiscovery(options.project_dir)
-            project_index = await discovery.discover()
+            # Impact analysis needs the project index, but the session store
+            # setup does not, so it is prepared while discovery runs
+            project_index, orchestrator = await asyncio.gather(
+                discovery.discover(),
+                asyncio.to_thread(self._get_orchestrator, options.project_dir),
+            )
 
             self.formatter.section("Project Analysis")
             self.formatter.key_value("Type", project_index.project_type)
@@ -96,11 +107,10 @@ class StartCommand:
                     )
 
             specs_dir = get_specs_dir(options.project_dir)
-            spec_dir = create_spec_dir(specs_dir)
+            spec_dir = await asyncio.to_thread(create_spec_dir, specs_dir)
 
             self.formatter.success(f"Created spec: {spec_dir.name}")
 
-            orchestrator = self._get_orchestrator(options.project_dir)
             session = orchestrator.create_session(
                 task_description=options.task_description,
                 spec_id=spec_dir.name,
@@ -108,23 +118,52 @@ class StartCommand:
 
             self.formatter.success(f"Created session: {session.session_id[:8]}...")
 
+            # Built before the start coroutine exists, so a project that is
+            # not a git repository fails without leaving it unawaited
+            worktree_manager = None
             if options.isolated:
+                from core.worktree import WorktreeManager
+
                 self.formatter.info("Setting up isolated worktree...")
                 worktree_manager = WorktreeManager(options.project_dir)
-                worktree_path = worktree_manager.setup_worktree(
-                    spec_dir.name,
-                    f"spec/{spec_dir.name}",
-                )
-                self.formatter.key_value("Worktree", str(worktree_path))
 
-            session = await orchestrator.start_session(session.session_id)
-
-            await orchestrator.update_session_phase(
+            started = orchestrator.start_session_with_phase(
                 session.session_id,
                 "planning",
                 "Analyzing task and creating implementation plan",
             )
 
+            if worktree_manager is not None:
+                # The git worktree add runs in a thread while the session is saved
+                started_session, worktree_path = await asyncio.gather(
+                    started,
+                    asyncio.to_thread(
+                        worktree_manager.setup_worktree,
+                        spec_dir.name,
+                        f"spec/{spec_dir.name}",
+                    ),
+                    return_exceptions=True,
+                )
+                for outcome in (started_session, worktree_path):
+                    if isinstance(outcome, BaseException):
+                        if not isinstance(worktree_path, BaseException):
+                            # The worktree was created for a session that did not start
+                            try:
+                                await asyncio.to_thread(
+                                    worktree_manager.remove_worktree, spec_dir.name, delete_branch=True
+                                )
+                            except Exception:
+                                logger.exception("Could not remove worktree")
+                        try:
+                            await orchestrator.fail_session(session.session_id, str(outcome))
+                        except Exception:
+                            logger.exception("Could not mark session as failed")
+                        raise outcome
+                self.formatter.key_value("Worktree", str(worktree_path))
+                session = started_session
+            else:
+                session = await started
+
             self.formatter.info("Implementation started...")
 
             return StartResult(
@@ -143,6 +182,9 @@ class StartCommand:
                 message=f"Start failed: {e}",
             )
 
+        finally:
+            await self._close_orchestrator()
+
     async def run_implementation(
         self,
         session_id: str,
@@ -151,6 +193,9 @@ class StartCommand:
         options: StartOptions,
     ) -> StartResult:
         """Run the full implementation pipeline."""
+        from agents.base import AgentConfig, AgentContext
+        from agents.coder import CoderAgent
+
         orchestrator = self._get_orchestrator(project_dir)
 
         try:
@@ -210,3 +255,6 @@ class StartCommand:
                 error=str(e),
                 message=f"Implementation failed: {e}",
             )
+
+        finally:
+            await self._close_orchestrator()
@@ -6,19 +6,39 @@ Part of Claude God Code - Autonomous Excellence
 Handles displaying session and spec status information.
 """
 
+import asyncio
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
-from spec.models import get_specs_dir
+from spec.models import get_specs_dir, list_spec_dirs
 from agents.session import SessionOrchestrator, SessionData
-from qa.criteria import get_qa_signoff_status
+from qa.criteria import IMPLEMENTATION_PLAN_FILE, get_qa_signoff_status
 
 from ..formatter import TerminalFormatter
 
 logger = logging.getLogger(__name__)
 
+# Status icons for brief session and spec listings
+_SESSION_ICONS = {
+    "pending": "○",
+    "running": "◐",
+    "completed": "✓",
+    "failed": "✗",
+    "paused": "⏸",
+}
+_SPEC_ICONS = {
+    "unknown": "?",
+    "pending": "○",
+    "in_progress": "◐",
+    "approved": "✓",
+    "rejected": "✗",
+    "fixes_applied": "⚡",
+    "escalated": "⚠",
+}
+
 
 @dataclass
 class StatusOptions:
@@ -42,6 +62,13 @@ class StatusResult:
     message: str = ""
 
 
+def _list_specs_with_plans(project_dir: Path) -> tuple[list[Path], list[Path]]:
+    """List spec directories and the subset that has an implementation plan to read."""
+    spec_paths = list_spec_dirs(get_specs_dir(project_dir))
+    planned = [p for p in spec_paths if os.path.isfile(p / IMPLEMENTATION_PLAN_FILE)]
+    return spec_paths, planned
+
+
 class StatusCommand:
     """Command handler for displaying status information."""
 
@@ -66,7 +93,7 @@ class StatusCommand:
 
         active_sessions = orchestrator.get_active_sessions()
         recent_sessions = orchestrator.store.get_recent_sessions(limit=options.limit)
-        specs = self._gather_spec_status(options.project_dir)
+        specs = await self._gather_spec_status(options.project_dir)
 
         self.formatter.header("Claude God Code", "System Status")
 
@@ -85,7 +112,8 @@ class StatusCommand:
                 )
 
         elif options.spec_name:
-            spec_info = self._find_spec(specs, options.spec_name)
+            index = {spec["name"]: spec for spec in specs}
+            spec_info = self._find_spec(index, specs, options.spec_name)
             if spec_info:
                 self._display_spec_detail(spec_info)
             else:
@@ -99,7 +127,8 @@ class StatusCommand:
                 )
 
         else:
-            self._display_summary(active_sessions, recent_sessions, specs)
+            with self.formatter.buffered():
+                self._display_summary(active_sessions, recent_sessions, specs)
 
         return StatusResult(
             success=True,
@@ -109,32 +138,42 @@ class StatusCommand:
             message="Status retrieved successfully",
         )
 
-    def _gather_spec_status(self, project_dir: Path) -> list[dict[str, Any]]:
-        """Gather status for all specs."""
-        specs_dir = get_specs_dir(project_dir)
-        if not specs_dir.exists():
-            return []
+    async def _gather_spec_status(self, project_dir: Path) -> list[dict[str, Any]]:
+        """Gather status for all specs, reading their signoffs concurrently."""
+        spec_paths, planned = await asyncio.to_thread(_list_specs_with_plans, project_dir)
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(get_qa_signoff_status, p) for p in planned)
+        )
+        signoffs = dict(zip(planned, loaded))
 
         specs = []
-        for spec_path in sorted(specs_dir.glob("*")):
-            if spec_path.is_dir():
-                signoff = get_qa_signoff_status(spec_path)
-                specs.append({
-                    "name": spec_path.name,
-                    "path": spec_path,
-                    "status": signoff.status.value if signoff else "unknown",
-                    "qa_session": signoff.qa_session if signoff else 0,
-                    "issues_count": len(signoff.issues_found) if signoff else 0,
-                })
+        for spec_path in spec_paths:
+            signoff = signoffs.get(spec_path)
+            specs.append({
+                "name": spec_path.name,
+                "path": spec_path,
+                "status": signoff.status.value if signoff else "unknown",
+                "qa_session": signoff.qa_session if signoff else 0,
+                "issues_count": len(signoff.issues_found) if signoff else 0,
+                "signoff": signoff,
+            })
 
         return specs
 
-    def _find_spec(self, specs: list[dict[str, Any]], name: str) -> Optional[dict[str, Any]]:
-        """Find a spec by name."""
-        for spec in specs:
-            if spec["name"] == name or name in spec["name"]:
-                return spec
-        return None
+    def _find_spec(
+        self,
+        index: dict[str, dict[str, Any]],
+        specs: list[dict[str, Any]],
+        name: str,
+    ) -> Optional[dict[str, Any]]:
+        """Find a spec by exact name via index, then name prefix, then substring."""
+        spec = index.get(name)
+        if spec is not None:
+            return spec
+        return (
+            next((spec for spec in specs if spec["name"].startswith(name)), None)
+            or next((spec for spec in specs if name in spec["name"]), None)
+        )
 
     def _display_summary(
         self,
@@ -145,40 +184,28 @@ class StatusCommand:
         """Display summary status."""
         self.formatter.section(f"Active Sessions ({len(active_sessions)})")
         if active_sessions:
-            for session in active_sessions:
-                self._display_session_brief(session)
+            self.formatter.bullets([self._session_line(s) for s in active_sessions])
         else:
             self.formatter.info("No active sessions")
 
         self.formatter.section(f"Recent Sessions")
         if recent_sessions:
-            for session in recent_sessions[:5]:
-                self._display_session_brief(session)
+            self.formatter.bullets([self._session_line(s) for s in recent_sessions[:5]])
         else:
             self.formatter.info("No recent sessions")
 
         self.formatter.section(f"Specifications ({len(specs)})")
         if specs:
-            for spec in specs:
-                self._display_spec_brief(spec)
+            self.formatter.bullets([self._spec_line(spec) for spec in specs])
         else:
             self.formatter.info("No specifications found")
 
-    def _display_session_brief(self, session: SessionData) -> None:
-        """Display brief session info."""
-        status_icons = {
-            "pending": "○",
-            "running": "◐",
-            "completed": "✓",
-            "failed": "✗",
-            "paused": "⏸",
-        }
-        icon = status_icons.get(session.status, "?")
-        duration = f"{session.get_duration_seconds():.1f}s"
-
-        self.formatter.bullet(
+    def _session_line(self, session: SessionData) -> str:
+        """Render the one-line summary of a session."""
+        icon = _SESSION_ICONS.get(session.status, "?")
+        return (
             f"{icon} {session.session_id[:8]}... [{session.status}] "
-            f"{session.task_description[:40]}... ({duration})"
+            f"{session.task_description[:40]}... ({session.get_duration_seconds():.1f}s)"
         )
 
     def _display_session_detail(self, session: SessionData) -> None:
@@ -202,21 +229,11 @@ class StatusCommand:
             for key in session.artifacts:
                 self.formatter.bullet(key)
 
-    def _display_spec_brief(self, spec: dict[str, Any]) -> None:
-        """Display brief spec info."""
-        status_icons = {
-            "unknown": "?",
-            "pending": "○",
-            "in_progress": "◐",
-            "approved": "✓",
-            "rejected": "✗",
-            "fixes_applied": "⚡",
-            "escalated": "⚠",
-        }
-        icon = status_icons.get(spec["status"], "?")
+    def _spec_line(self, spec: dict[str, Any]) -> str:
+        """Render the one-line summary of a spec."""
+        icon = _SPEC_ICONS.get(spec["status"], "?")
         issues = f" ({spec['issues_count']} issues)" if spec["issues_count"] else ""
-
-        self.formatter.bullet(f"{icon} {spec['name']} [{spec['status']}]{issues}")
+        return f"{icon} {spec['name']} [{spec['status']}]{issues}"
 
     def _display_spec_detail(self, spec: dict[str, Any]) -> None:
         """Display detailed spec info."""
@@ -226,7 +243,7 @@ class StatusCommand:
         self.formatter.key_value("Issues", spec["issues_count"])
         self.formatter.key_value("Path", str(spec["path"]))
 
-        signoff = get_qa_signoff_status(spec["path"])
+        signoff = spec.get("signoff")
         if signoff and signoff.issues_found:
             self.formatter.section("Issues")
             for issue in signoff.issues_found:
@@ -12,32 +12,58 @@ import asyncio
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from core.platform import get_config_dir, get_data_dir, is_git_repo
-from core.auth import get_auth_token, ensure_authenticated
-from core.worktree import WorktreeManager
-from core.client import create_client
+# Domain modules are imported by the subcommands that use them, so parsing
+# arguments (and --help, --version or usage errors) does not load them
+if TYPE_CHECKING:
+    from agents.session import SessionOrchestrator
+    from core.worktree import WorktreeManager
+    from spec.discovery import ProjectDiscovery
 
-from spec.models import get_specs_dir, Complexity
-from spec.discovery import ProjectDiscovery
-from spec.pipeline import SpecPipeline
-from spec.impact import ImpactAnalyzer
-
-from agents.session import SessionOrchestrator, SessionData
-from agents.planner import PlannerAgent
-from agents.coder import CoderAgent
-
-from qa.loop import QALoop, QALoopConfig, QAIntegration
-from qa.criteria import get_qa_signoff_status
-
-from .formatter import TerminalFormatter, create_formatter
+    from .formatter import TerminalFormatter
 
 logger = logging.getLogger(__name__)
 
 VERSION = "0.1.0"
 PROGRAM_NAME = "claude-god-code"
 
+# Printed for a bare -h/--help without building the parser; keep in sync with
+# create_parser (a test checks that every option is listed)
+HELP_TEXT = f"""usage: {PROGRAM_NAME} [options]
+
+Claude God Code - Autonomous Excellence in Software Engineering
+
+options:
+  -h, --help            show this help message and exit
+  -V, --version         show program's version number and exit
+  --spec SPEC           Spec name or task description to process
+  --project-dir DIR     Project directory (default: current directory)
+  --model MODEL         Claude model to use
+  --list                List all specs in the project
+  --status              Show current session status
+  --verbose, -v         Enable verbose output
+  --isolated            Run in isolated worktree mode
+  --direct              Run directly without worktree isolation
+  --merge               Merge completed spec changes to main
+  --review              Review changes before merging
+  --discard             Discard spec worktree and changes
+  --qa                  Run QA validation loop
+  --force               Skip confirmation prompts (including impact analysis)
+  --no-color            Disable colored output
+  --config KEY=VALUE    Set configuration value
+  --resume SESSION_ID   Resume a paused session
+  --max-iterations N    Maximum QA loop iterations (default: 50)
+  --auto-fix            Automatically apply fixes in QA loop
+
+Examples:
+  {PROGRAM_NAME} --spec "Add user authentication"
+  {PROGRAM_NAME} --list
+  {PROGRAM_NAME} --status
+  {PROGRAM_NAME} --qa --spec 001-add-auth
+  {PROGRAM_NAME} --force --spec 001-add-auth
+"""
+
 
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser with all CLI options."""
@@ -56,7 +82,7 @@ Examples:
     )
 
     parser.add_argument(
-        "--version",
+        "-V", "--version",
         action="version",
         version=f"%(prog)s {VERSION}",
     )
@@ -190,9 +216,11 @@ class CLIApplication:
     def __init__(
         self,
         args: argparse.Namespace,
-        formatter: Optional[TerminalFormatter] = None,
+        formatter: Optional["TerminalFormatter"] = None,
     ) -> None:
         """Initialize CLI application."""
+        from .formatter import create_formatter
+
         self.args = args
         self.project_dir = args.project_dir or Path.cwd()
         self.formatter = formatter or create_formatter(
@@ -200,9 +228,9 @@ class CLIApplication:
             verbose=args.verbose,
         )
 
-        self._orchestrator: Optional[SessionOrchestrator] = None
-        self._worktree_manager: Optional[WorktreeManager] = None
-        self._discovery: Optional[ProjectDiscovery] = None
+        self._orchestrator: Optional["SessionOrchestrator"] = None
+        self._worktree_manager: Optional["WorktreeManager"] = None
+        self._discovery: Optional["ProjectDiscovery"] = None
 
     def _setup_logging(self) -> None:
         """Configure logging based on verbosity."""
@@ -215,6 +243,8 @@ class CLIApplication:
 
     def _validate_project_dir(self) -> bool:
         """Validate project directory exists and is a git repo."""
+        from core.platform import is_git_repo
+
         if not self.project_dir.exists():
             self.formatter.error(f"Project directory not found: {self.project_dir}")
             return False
@@ -227,26 +257,35 @@ class CLIApplication:
 
         return True
 
-    def _init_orchestrator(self) -> SessionOrchestrator:
+    def _init_orchestrator(self) -> "SessionOrchestrator":
         """Initialize the session orchestrator."""
         if self._orchestrator is None:
+            from agents.session import SessionOrchestrator
+
             self._orchestrator = SessionOrchestrator(self.project_dir)
         return self._orchestrator
 
-    def _init_worktree_manager(self) -> WorktreeManager:
+    def _init_worktree_manager(self) -> "WorktreeManager":
         """Initialize the worktree manager."""
         if self._worktree_manager is None:
+            from core.worktree import WorktreeManager
+
             self._worktree_manager = WorktreeManager(self.project_dir)
         return self._worktree_manager
 
-    def _init_discovery(self) -> ProjectDiscovery:
+    def _init_discovery(self) -> "ProjectDiscovery":
         """Initialize project discovery."""
         if self._discovery is None:
+            from spec.discovery import ProjectDiscovery
+
             self._discovery = ProjectDiscovery(self.project_dir)
         return self._discovery
 
     async def run_list_specs(self) -> int:
         """List all specs in the project."""
+        from qa.criteria import get_qa_signoff_status
+        from spec.models import get_specs_dir
+
         self.formatter.header("Claude God Code", "Specification List")
 
         specs_dir = get_specs_dir(self.project_dir)
@@ -303,6 +342,10 @@ class CLIApplication:
 
     async def run_qa(self, spec_name: str) -> int:
         """Run QA validation loop for a spec."""
+        from qa.criteria import get_qa_signoff_status
+        from qa.loop import QALoop, QALoopConfig
+        from spec.models import get_specs_dir
+
         specs_dir = get_specs_dir(self.project_dir)
         spec_dir = self._find_spec_dir(specs_dir, spec_name)
 
@@ -340,6 +383,9 @@ class CLIApplication:
 
     async def run_spec(self, spec_input: str) -> int:
         """Process a spec (create new or continue existing)."""
+        from spec.impact import ImpactAnalyzer
+        from spec.models import get_specs_dir
+
         specs_dir = get_specs_dir(self.project_dir)
         spec_dir = self._find_spec_dir(specs_dir, spec_input)
 
@@ -421,6 +467,9 @@ class CLIApplication:
 
     async def run_merge(self, spec_name: str) -> int:
         """Merge spec changes to main branch."""
+        from qa.criteria import get_qa_signoff_status
+        from spec.models import get_specs_dir
+
         specs_dir = get_specs_dir(self.project_dir)
         spec_dir = self._find_spec_dir(specs_dir, spec_name)
 
@@ -450,6 +499,8 @@ class CLIApplication:
 
     async def run_discard(self, spec_name: str) -> int:
         """Discard spec worktree and changes."""
+        from spec.models import get_specs_dir
+
         specs_dir = get_specs_dir(self.project_dir)
         spec_dir = self._find_spec_dir(specs_dir, spec_name)
 
@@ -503,6 +554,15 @@ class CLIApplication:
         """Run the CLI application."""
         self._setup_logging()
 
+        try:
+            return await self._dispatch()
+        finally:
+            # Background session saves would be cancelled with the event loop
+            if self._orchestrator is not None:
+                await self._orchestrator.close()
+
+    async def _dispatch(self) -> int:
+        """Run the action selected by the command-line arguments."""
         if not self._validate_project_dir():
             return 1
 
@@ -536,6 +596,16 @@ class CLIApplication:
 
 def main(argv: Optional[list[str]] = None) -> int:
     """Main entry point."""
+    argv = argv if argv is not None else sys.argv[1:]
+
+    # Answer the trivial invocations before building the parser
+    if not argv or argv[0] in ("-h", "--help"):
+        print(HELP_TEXT, end="")
+        return 0
+    if argv[0] in ("-V", "--version"):
+        print(f"{PROGRAM_NAME} {VERSION}")
+        return 0
+
     parser = create_parser()
     args = parser.parse_args(argv)
 
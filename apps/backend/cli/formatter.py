@@ -10,12 +10,14 @@ This module provides rich terminal formatting for displaying:
 - Session status and metrics
 """
 
+import io
 import shutil
 import sys
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Optional, TextIO
+from typing import Any, Iterator, Optional, TextIO
 
 from spec.models import ImpactAnalysis, ImpactSeverity, BreakingChange, ComplexityAssessment, Complexity
 from qa.criteria import QAStatus, QAIssue, QASignoff, IssueSeverity
@@ -96,6 +98,7 @@ class TerminalFormatter:
     def __init__(self, config: Optional[FormatterConfig] = None) -> None:
         """Initialize formatter with configuration."""
         self.config = config or FormatterConfig.auto_detect()
+        self._buffer: Optional[io.StringIO] = None
 
         self.ICONS = {
             "check": "✓" if self.config.use_unicode else "[OK]",
@@ -126,8 +129,29 @@ class TerminalFormatter:
         return self.ICONS.get(name, "")
 
     def _print(self, *args: Any, **kwargs: Any) -> None:
-        """Print to configured stream."""
-        print(*args, file=self.config.stream, **kwargs)
+        """Print to configured stream, or to the buffer while buffering."""
+        stream = self._buffer if self._buffer is not None else self.config.stream
+        print(*args, file=stream, **kwargs)
+
+    def _flush_buffer(self) -> None:
+        """Write buffered output to the configured stream in one call."""
+        if self._buffer is not None and self._buffer.tell():
+            self.config.stream.write(self._buffer.getvalue())
+            self._buffer = io.StringIO()
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """Collect output inside the block and write it to the stream once on exit."""
+        if self._buffer is not None:
+            yield
+            return
+
+        self._buffer = io.StringIO()
+        try:
+            yield
+        finally:
+            self._flush_buffer()
+            self._buffer = None
 
     def _divider(self, char: str = "─", width: Optional[int] = None) -> str:
         """Create a divider line."""
@@ -170,6 +194,13 @@ class TerminalFormatter:
         spaces = " " * indent
         self._print(f"{spaces}{self._icon('bullet')} {message}")
 
+    def bullets(self, messages: list[str], indent: int = 2) -> None:
+        """Print several bullet points with a single write."""
+        if not messages:
+            return
+        prefix = f"{' ' * indent}{self._icon('bullet')} "
+        self._print("\n".join(prefix + message for message in messages))
+
     def key_value(self, key: str, value: Any, indent: int = 4) -> None:
         """Print key-value pair."""
         spaces = " " * indent
@@ -254,27 +285,28 @@ class TerminalFormatter:
 
     def format_qa_status(self, signoff: QASignoff, state: Optional[QALoopState] = None) -> None:
         """Format and display QA Loop status."""
-        self.header("QA Loop Status", f"Session: {signoff.qa_session}")
+        with self.buffered():
+            self.header("QA Loop Status", f"Session: {signoff.qa_session}")
 
-        status_style, status_icon = self._get_qa_status_style(signoff.status)
-        self._print(f"  {self._color('Status:', Style.DIM)} {self._color(f'{status_icon} {signoff.status.value.upper()}', status_style)}")
+            status_style, status_icon = self._get_qa_status_style(signoff.status)
+            self._print(f"  {self._color('Status:', Style.DIM)} {self._color(f'{status_icon} {signoff.status.value.upper()}', status_style)}")
 
-        if state:
-            self._print(f"  {self._color('Iteration:', Style.DIM)} {state.current_iteration}")
-            self._print(f"  {self._color('Phase:', Style.DIM)} {state.current_phase.value}")
+            if state:
+                self._print(f"  {self._color('Iteration:', Style.DIM)} {state.current_iteration}")
+                self._print(f"  {self._color('Phase:', Style.DIM)} {state.current_phase.value}")
 
-        if signoff.issues_found:
-            self.section(f"Issues Found ({len(signoff.issues_found)})")
-            for issue in signoff.issues_found:
-                self._format_qa_issue(issue)
+            if signoff.issues_found:
+                self.section(f"Issues Found ({len(signoff.issues_found)})")
+                for issue in signoff.issues_found:
+                    self._format_qa_issue(issue)
 
-        if state and state.history:
-            self.section("Iteration History")
-            for record in state.history[-5:]:
-                phase_icon = self._get_phase_icon(record.phase)
-                self._print(f"    {phase_icon} Iteration {record.iteration}: {record.phase.value} - {record.status}")
+            if state and state.history:
+                self.section("Iteration History")
+                for record in state.history[-5:]:
+                    phase_icon = self._get_phase_icon(record.phase)
+                    self._print(f"    {phase_icon} Iteration {record.iteration}: {record.phase.value} - {record.status}")
 
-        self._print()
+            self._print()
 
     def _get_qa_status_style(self, status: QAStatus) -> tuple[str, str]:
         """Get style and icon for QA status."""
@@ -409,20 +441,21 @@ class TerminalFormatter:
         metrics: Optional[dict[str, Any]] = None,
     ) -> None:
         """Format and display session status."""
-        self.header("Session Status", f"ID: {session_id[:8]}...")
+        with self.buffered():
+            self.header("Session Status", f"ID: {session_id[:8]}...")
 
-        status_style = self._get_session_status_style(status)
-        self._print(f"  {self._color('Status:', Style.DIM)} {self._color(status.upper(), status_style)}")
-        self._print(f"  {self._color('Phase:', Style.DIM)} {phase}")
-        self._print(f"  {self._color('Task:', Style.DIM)} {task[:60]}{'...' if len(task) > 60 else ''}")
-        self._print(f"  {self._color('Duration:', Style.DIM)} {duration_seconds:.1f}s")
+            status_style = self._get_session_status_style(status)
+            self._print(f"  {self._color('Status:', Style.DIM)} {self._color(status.upper(), status_style)}")
+            self._print(f"  {self._color('Phase:', Style.DIM)} {phase}")
+            self._print(f"  {self._color('Task:', Style.DIM)} {task[:60]}{'...' if len(task) > 60 else ''}")
+            self._print(f"  {self._color('Duration:', Style.DIM)} {duration_seconds:.1f}s")
 
-        if metrics:
-            self.section("Metrics")
-            for key, value in metrics.items():
-                self.key_value(key, value)
+            if metrics:
+                self.section("Metrics")
+                for key, value in metrics.items():
+                    self.key_value(key, value)
 
-        self._print()
+            self._print()
 
     def _get_session_status_style(self, status: str) -> str:
         """Get style for session status."""
@@ -439,6 +472,7 @@ class TerminalFormatter:
         """Prompt user for confirmation."""
         default_str = "[Y/n]" if default else "[y/N]"
         prompt = f"  {self._icon('warning')} {message} {default_str}: "
+        self._flush_buffer()
 
         try:
             response = input(prompt).strip().lower()
@@ -483,6 +517,12 @@ class TerminalFormatter:
         level_tag = self._color(f"[{level.upper()}]", level_style)
         self._print(f"{prefix} {level_tag} {message}")
 
+    def stream_log_batch(self, entries: list[tuple[str, str]]) -> None:
+        """Stream several (message, level) log entries with a single write."""
+        with self.buffered():
+            for message, level in entries:
+                self.stream_log(message, level=level)
+
 
 def create_formatter(
     use_colors: Optional[bool] = None,
@@ -18,6 +18,9 @@ from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# Implementation plan file in each spec directory; it also holds the QA signoff
+IMPLEMENTATION_PLAN_FILE = "implementation_plan.json"
+
 
 class QAStatus(Enum):
     """QA validation status."""
@@ -198,7 +201,7 @@ class QASignoff:
 
 def load_implementation_plan(spec_dir: Path) -> Optional[dict[str, Any]]:
     """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
+    plan_file = spec_dir / IMPLEMENTATION_PLAN_FILE
     if not plan_file.exists():
         return None
     try:
@@ -211,7 +214,7 @@ def load_implementation_plan(spec_dir: Path) -> Optional[dict[str, Any]]:
 
 def save_implementation_plan(spec_dir: Path, plan: dict[str, Any]) -> bool:
     """Save the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
+    plan_file = spec_dir / IMPLEMENTATION_PLAN_FILE
     try:
         spec_dir.mkdir(parents=True, exist_ok=True)
         with open(plan_file, "w", encoding="utf-8") as f:
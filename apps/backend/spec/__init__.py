@@ -26,8 +26,10 @@ from spec.models import (
     Specification,
     WorkflowType,
     create_spec_dir,
+    find_spec_dir,
     generate_spec_name,
     get_specs_dir,
+    list_spec_dirs,
 )
 
 # Discovery
@@ -87,8 +89,10 @@ __all__ = [
     "Specification",
     "WorkflowType",
     "create_spec_dir",
+    "find_spec_dir",
     "generate_spec_name",
     "get_specs_dir",
+    "list_spec_dirs",
     # Discovery
     "ProjectDiscovery",
     "run_discovery",
@@ -11,10 +11,12 @@ Part of Claude God Code - Autonomous Excellence
 from __future__ import annotations
 
 import json
+import os
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Coroutine, TypeAlias
 
@@ -544,6 +546,9 @@ def generate_spec_name(task_description: str) -> str:
     return name or "unnamed-spec"
 
 
+# Leading number of a spec directory name, e.g. "001-add-auth"
+_SPEC_NUMBER_RE = re.compile(r"^(\d+)-")
+
 def get_specs_dir(project_dir: Path) -> Path:
     """Get the specifications directory for a project."""
     return project_dir / ".claude-god-code" / "specs"
@@ -560,19 +565,89 @@ def create_spec_dir(specs_dir: Path, spec_number: int | None = None) -> Path:
     Returns:
         Path to the created spec directory
     """
-    specs_dir.mkdir(parents=True, exist_ok=True)
-
     if spec_number is None:
-        existing = list(specs_dir.glob("*"))
         numbers = []
-        for p in existing:
-            match = re.match(r"^(\d+)-", p.name)
-            if match:
-                numbers.append(int(match.group(1)))
+        try:
+            with os.scandir(specs_dir) as entries:
+                for entry in entries:
+                    match = _SPEC_NUMBER_RE.match(entry.name)
+                    if match:
+                        numbers.append(int(match.group(1)))
+        except FileNotFoundError:
+            # No specs yet; the mkdir below creates specs_dir as a parent
+            pass
         spec_number = max(numbers, default=0) + 1
 
     spec_name = f"{spec_number:03d}-pending"
     spec_dir = specs_dir / spec_name
+    # One mkdir creates specs_dir too, instead of a separate call for it
     spec_dir.mkdir(parents=True, exist_ok=True)
 
     return spec_dir
+
+
+def _specs_mtime_ns(specs_dir: Path) -> int | None:
+    """Get the specs directory mtime, or None when it does not exist."""
+    try:
+        return specs_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=32)
+def _list_spec_dirs(specs_dir: Path, mtime_ns: int) -> tuple[Path, ...]:
+    """List spec directories once per specs directory mtime."""
+    with os.scandir(specs_dir) as entries:
+        names = [entry.name for entry in entries if entry.is_dir()]
+    return tuple(specs_dir / name for name in sorted(names))
+
+
+@lru_cache(maxsize=32)
+def _build_spec_index(specs_dir: Path, mtime_ns: int) -> dict[str, Path]:
+    """
+    Map spec names and their dash-separated prefixes to spec directories.
+
+    "001-add-auth" is reachable as "001-add-auth", "001-add" and "001".
+    Full names take precedence over prefixes, and earlier names win ties.
+    """
+    spec_dirs = _list_spec_dirs(specs_dir, mtime_ns)
+    index = {spec_dir.name: spec_dir for spec_dir in spec_dirs}
+    for spec_dir in spec_dirs:
+        stem = spec_dir.name
+        while "-" in stem:
+            stem = stem.rsplit("-", 1)[0]
+            index.setdefault(stem, spec_dir)
+    return index
+
+
+def _fuzzy_lookup(spec_dirs: tuple[Path, ...], name: str) -> Path | None:
+    """Find the first spec directory whose name contains name."""
+    return next((spec_dir for spec_dir in spec_dirs if name in spec_dir.name), None)
+
+
+def list_spec_dirs(specs_dir: Path) -> list[Path]:
+    """
+    List spec directories sorted by name.
+
+    The listing is cached until a spec is added, renamed or removed,
+    which changes the mtime of the specs directory.
+    """
+    mtime_ns = _specs_mtime_ns(specs_dir)
+    if mtime_ns is None:
+        return []
+    return list(_list_spec_dirs(specs_dir, mtime_ns))
+
+
+def find_spec_dir(specs_dir: Path, name: str) -> Path | None:
+    """
+    Find a spec directory by name or number.
+
+    Exact names and dash-separated prefixes resolve through an index that is
+    rebuilt only when the mtime of the specs directory changes; anything
+    else falls back to a substring match.
+    """
+    mtime_ns = _specs_mtime_ns(specs_dir)
+    if mtime_ns is None:
+        return None
+    index = _build_spec_index(specs_dir, mtime_ns)
+    return index.get(name) or _fuzzy_lookup(_list_spec_dirs(specs_dir, mtime_ns), name)
@@ -0,0 +1,105 @@
+"""
+Tests for agents.async_writer module.
+
+Part of Claude God Code - Autonomous Excellence
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "apps" / "backend"))
+
+from agents.async_writer import AsyncSessionWriter
+
+
+class TestAsyncSessionWriter:
+    """Tests for AsyncSessionWriter class."""
+
+    def test_writes_immediately_without_loop(self) -> None:
+        """Should write straight away when no event loop is running."""
+        written: list[str] = []
+        writer = AsyncSessionWriter(written.append)
+        writer.schedule("a", "a1")
+        assert written == ["a1"]
+        assert not writer.has_pending()
+
+    @pytest.mark.asyncio
+    async def test_coalesces_latest_per_key(self) -> None:
+        """Should write only the latest item scheduled for each key."""
+        written: list[str] = []
+        writer = AsyncSessionWriter(written.append, interval=60)
+        for item in ("a1", "a2", "a3"):
+            writer.schedule("a", item)
+        writer.schedule("b", "b1")
+        assert written == []
+
+        await writer.close()
+        assert written == ["a3", "b1"]
+
+    @pytest.mark.asyncio
+    async def test_background_flush(self) -> None:
+        """Should write pending items after the flush interval."""
+        written: list[str] = []
+        writer = AsyncSessionWriter(written.append, interval=0.01)
+        writer.schedule("a", "a1")
+        await asyncio.sleep(0.05)
+        assert written == ["a1"]
+        assert not writer.has_pending()
+
+    @pytest.mark.asyncio
+    async def test_flush_single_key(self) -> None:
+        """Should flush one key and leave the others pending."""
+        written: list[str] = []
+        writer = AsyncSessionWriter(written.append, interval=60)
+        writer.schedule("a", "a1")
+        writer.schedule("b", "b1")
+
+        await writer.flush("a")
+        assert written == ["a1"]
+        assert writer.has_pending("b")
+
+        writer.discard("b")
+        await writer.close()
+        assert written == ["a1"]
+
+    @pytest.mark.asyncio
+    async def test_write_failure_is_logged(self) -> None:
+        """Should keep writing other items when one write fails."""
+        written: list[str] = []
+
+        def write(item: str) -> None:
+            if item == "bad":
+                raise OSError("disk full")
+            written.append(item)
+
+        writer = AsyncSessionWriter(write, interval=60)
+        writer.schedule("a", "bad")
+        writer.schedule("b", "good")
+        await writer.close()
+        assert written == ["good"]
+
+
+    @pytest.mark.asyncio
+    async def test_schedule_during_inflight_write(self) -> None:
+        """Should write items scheduled while a background write is in flight."""
+        written: list[str] = []
+        writer: AsyncSessionWriter
+
+        async def write(item: str) -> None:
+            await asyncio.sleep(0)
+            if item == "a1":
+                writer.schedule("a", "a2")
+            written.append(item)
+
+        writer = AsyncSessionWriter(write, interval=0.01)
+        writer.schedule("a", "a1")
+        await asyncio.sleep(0.1)
+
+        assert written == ["a1", "a2"]
+        assert not writer.has_pending()
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -4,7 +4,12 @@ Tests for agents.base module.
 Part of Claude God Code - Autonomous Excellence
 """
 
+import asyncio
+import dataclasses
+import json
+import subprocess
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
 
@@ -12,6 +17,7 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "apps" / "backend"))
 
+import agents.base as base_module
 from agents.base import (
     AgentConfig,
     AgentContext,
@@ -20,6 +26,7 @@ from agents.base import (
     AgentPhase,
     AgentState,
     AgentStatus,
+    BaseAgent,
     ErrorSeverity,
 )
 
@@ -64,6 +71,19 @@ class TestAgentConfig:
         issues = config.validate()
         assert "temperature must be between 0 and 2" in issues
 
+    def test_config_is_frozen(self) -> None:
+        """Should reject mutation and be usable as a cache key."""
+        config = AgentConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.max_iterations = 10  # type: ignore[misc]
+        assert hash(config) == hash(AgentConfig())
+
+    def test_validate_returns_fresh_list(self) -> None:
+        """Should not leak the memoized result to callers."""
+        config = AgentConfig(max_iterations=0)
+        config.validate().clear()
+        assert config.validate() == ["max_iterations must be at least 1"]
+
 
 class TestAgentError:
     """Tests for AgentError dataclass."""
@@ -105,6 +125,31 @@ class TestAgentError:
         assert d["message"] == "Test"
         assert d["severity"] == "warning"
         assert d["phase"] == "planning"
+        assert type(d["severity"]) is str
+        assert type(d["phase"]) is str
+        assert datetime.fromisoformat(d["timestamp"]).year >= 2024
+
+    def test_to_json(self) -> None:
+        """Should serialize to JSON bytes matching to_dict."""
+        error = AgentError(
+            message="Test",
+            severity=ErrorSeverity.FATAL,
+            phase=AgentPhase.CODING,
+            context={"path": Path("src/app.py")},
+        )
+        data = json.loads(error.to_json())
+        assert data["severity"] == "fatal"
+        assert data["context"]["path"] == "src/app.py"
+
+    def test_to_json_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should produce the same payload without orjson installed."""
+        error = AgentError(
+            message="Test",
+            severity=ErrorSeverity.WARNING,
+            phase=AgentPhase.PLANNING,
+        )
+        monkeypatch.setattr(base_module, "ORJSON_AVAILABLE", False)
+        assert json.loads(error.to_json()) == error.to_dict()
 
 
 class TestAgentMetrics:
@@ -120,11 +165,18 @@ class TestAgentMetrics:
     def test_get_duration(self) -> None:
         """Should calculate duration correctly."""
         metrics = AgentMetrics()
-        metrics.start_time = datetime.now()
+        metrics.start_time = time.monotonic_ns()
         duration = metrics.get_duration_seconds()
         assert duration >= 0
         assert duration < 1  # Should be nearly instant
 
+    def test_get_duration_finished(self) -> None:
+        """Should use end_time once the run has finished."""
+        metrics = AgentMetrics(start_time=1_000_000_000, end_time=3_500_000_000)
+        assert metrics.get_duration_seconds() == 2.5
+        assert metrics.get_duration_ns() == 2_500_000_000
+        assert AgentMetrics().get_duration_ns() == 0
+
     def test_to_dict(self) -> None:
         """Should convert to dictionary."""
         metrics = AgentMetrics(
@@ -137,6 +189,11 @@ class TestAgentMetrics:
         assert d["api_calls"] == 5
         assert d["files_modified"] == 3
 
+    def test_to_json(self) -> None:
+        """Should serialize to JSON bytes."""
+        metrics = AgentMetrics(iterations=2)
+        assert json.loads(metrics.to_json())["iterations"] == 2
+
 
 class TestAgentState:
     """Tests for AgentState dataclass."""
@@ -148,6 +205,48 @@ class TestAgentState:
         assert state.phase == AgentPhase.INITIALIZING
         assert state.current_iteration == 0
 
+    def test_slotted_state(self) -> None:
+        """Should use slots instead of a per-instance __dict__."""
+        state = AgentState()
+        assert not hasattr(state, "__dict__")
+        assert not hasattr(state.metrics, "__dict__")
+        with pytest.raises(AttributeError):
+            state.unknown_field = 1  # type: ignore[attr-defined]
+
+    def test_containers_allocated_on_first_write(self) -> None:
+        """Should share an empty placeholder until a task or error is recorded."""
+        state = AgentState()
+        assert len(state.errors) == 0
+        assert state.to_dict()["pending_tasks"] == []
+        state.complete_task("task1")
+        state.add_error(AgentError(
+            message="Warning",
+            severity=ErrorSeverity.WARNING,
+            phase=AgentPhase.CODING,
+        ))
+        assert list(state.completed_tasks) == ["task1"]
+        assert len(state.errors) == 1
+        assert len(AgentState().errors) == 0
+
+    def test_errors_are_bounded(self) -> None:
+        """Should keep only the most recent errors but remember fatal ones."""
+        state = AgentState(max_errors=2)
+        state.add_error(AgentError(
+            message="Fatal",
+            severity=ErrorSeverity.FATAL,
+            phase=AgentPhase.CODING,
+        ))
+        for i in range(3):
+            state.add_error(AgentError(
+                message=f"Warning {i}",
+                severity=ErrorSeverity.WARNING,
+                phase=AgentPhase.CODING,
+            ))
+        assert [e.message for e in state.errors] == ["Warning 1", "Warning 2"]
+        assert state.metrics.errors_encountered == 4
+        assert state.has_fatal_error() is True
+        assert len(state.to_dict()["errors"]) == 2
+
     def test_add_error(self) -> None:
         """Should add error and update metrics."""
         state = AgentState()
@@ -177,13 +276,24 @@ class TestAgentState:
     def test_complete_task(self) -> None:
         """Should move task from pending to completed."""
         state = AgentState()
-        state.pending_tasks = ["task1", "task2"]
+        state.pending_tasks = dict.fromkeys(["task1", "task2"])
         state.current_task = "task1"
         state.complete_task("task1")
         assert "task1" not in state.pending_tasks
         assert "task1" in state.completed_tasks
         assert state.current_task is None
 
+    def test_complete_task_idempotent(self) -> None:
+        """Should not duplicate tasks and should serialize as lists."""
+        state = AgentState()
+        state.pending_tasks = dict.fromkeys(["task1", "task2", "task3"])
+        state.complete_task("task2")
+        state.complete_task("task2")
+        state.complete_task("unknown")
+        d = state.to_dict()
+        assert d["pending_tasks"] == ["task1", "task3"]
+        assert d["completed_tasks"] == ["task2", "unknown"]
+
     def test_is_running(self) -> None:
         """Should correctly identify running state."""
         state = AgentState()
@@ -245,6 +355,184 @@ class TestAgentContext:
         )
         assert context.get_working_directory() == worktree
 
+    def test_set_worktree(self, tmp_path: Path) -> None:
+        """Should refresh the working directory when the worktree changes."""
+        context = AgentContext(repo_root=tmp_path)
+        worktree = tmp_path / "worktree"
+        context.set_worktree(worktree)
+        assert context.worktree_path == worktree
+        assert context.get_working_directory() == worktree
+        context.set_worktree(None)
+        assert context.get_working_directory() == tmp_path
+
+    def test_notify_progress_inline(self, tmp_path: Path) -> None:
+        """Should call the callback immediately without dispatch running."""
+        events: list[str] = []
+        context = AgentContext(
+            repo_root=tmp_path,
+            on_progress=lambda agent_id, phase, message, data=None: events.append(message),
+        )
+        context.notify_progress("agent", AgentPhase.CODING, "hello")
+        assert events == ["hello"]
+
+    def test_default_callbacks_are_noops(self, tmp_path: Path) -> None:
+        """Should accept notifications without callbacks or with None."""
+        context = AgentContext(repo_root=tmp_path, on_progress=None)  # type: ignore[arg-type]
+        context.notify_progress("agent", AgentPhase.CODING, "ignored")
+        context.notify_error("agent", AgentPhase.CODING, "ignored")
+        assert callable(context.on_progress)
+
+    @pytest.mark.asyncio
+    async def test_event_dispatch_delivers_in_background(self, tmp_path: Path) -> None:
+        """Should queue events and deliver them, including async callbacks."""
+        events: list[str] = []
+
+        async def on_progress(agent_id, phase, message, data=None) -> None:
+            events.append(message)
+
+        context = AgentContext(repo_root=tmp_path, on_progress=on_progress)
+        context.start_event_dispatch()
+        context.notify_progress("agent", AgentPhase.CODING, "first")
+        context.notify_progress("agent", AgentPhase.CODING, "second")
+        assert events == []
+
+        await context.stop_event_dispatch()
+        assert events == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_event_dispatch_drops_when_full(self, tmp_path: Path) -> None:
+        """Should drop events rather than block when the queue is full."""
+        events: list[str] = []
+        context = AgentContext(
+            repo_root=tmp_path,
+            on_error=lambda agent_id, phase, message, data=None: events.append(message),
+        )
+        context.start_event_dispatch(maxsize=1)
+        context.notify_error("agent", AgentPhase.CODING, "kept")
+        context.notify_error("agent", AgentPhase.CODING, "dropped")
+
+        await context.stop_event_dispatch()
+        assert events == ["kept"]
+
+
+
+class TestBaseAgent:
+    """Tests for BaseAgent."""
+
+    def test_agent_ids_are_unique(self, tmp_path: Path) -> None:
+        """Should give each agent a distinct id prefixed with its class name."""
+
+        class CustomAgent(BaseAgent):
+            pass
+
+        context = AgentContext(repo_root=tmp_path)
+        ids = {CustomAgent(context).agent_id for _ in range(50)}
+        assert len(ids) == 50
+        assert all(agent_id.startswith("CustomAgent_") for agent_id in ids)
+        assert BaseAgent(context).agent_id.startswith("BaseAgent_")
+
+    def test_state_uses_config_error_limit(self, tmp_path: Path) -> None:
+        """Should size the error buffer from the agent config."""
+        config = AgentConfig(max_errors_retained=5)
+        agent = BaseAgent(AgentContext(repo_root=tmp_path, config=config))
+        agent._record_error("boom")
+        assert agent.state.errors.maxlen == 5
+
+    def test_record_error_without_callback(self, tmp_path: Path) -> None:
+        """Should record the error even when nobody listens."""
+        agent = BaseAgent(AgentContext(repo_root=tmp_path))
+        error = agent._record_error("boom", ErrorSeverity.WARNING)
+        assert agent.state.last_error is error
+        assert error.context == {}
+
+    def test_record_error_notifies_callback(self, tmp_path: Path) -> None:
+        """Should pass severity and context to the error callback."""
+        received: list[dict] = []
+        context = AgentContext(
+            repo_root=tmp_path,
+            on_error=lambda agent_id, phase, message, data=None: received.append(data),
+        )
+        agent = BaseAgent(context)
+        agent._record_error("boom", ErrorSeverity.FATAL, context={"file": "a.py"})
+        assert received == [{"severity": "fatal", "context": {"file": "a.py"}}]
+
+    def test_transition_phase_default_message(self, tmp_path: Path) -> None:
+        """Should report the old and new phase when no message is given."""
+        messages: list[str] = []
+        context = AgentContext(
+            repo_root=tmp_path,
+            on_progress=lambda agent_id, phase, message, data=None: messages.append(message),
+        )
+        agent = BaseAgent(context)
+        agent._transition_phase(AgentPhase.CODING)
+        agent._transition_phase(AgentPhase.TESTING, "Running tests")
+        assert messages == ["Transitioned from initializing to coding", "Running tests"]
+
+    @pytest.mark.asyncio
+    async def test_interruptible_returns_result(self, tmp_path: Path) -> None:
+        """Should pass through the awaited result when not cancelled."""
+        agent = BaseAgent(AgentContext(repo_root=tmp_path))
+
+        async def work() -> int:
+            return 42
+
+        assert await agent._interruptible(work()) == 42
+
+    @pytest.mark.asyncio
+    async def test_cancel_interrupts_pending_await(self, tmp_path: Path) -> None:
+        """Should abort a long await as soon as cancel() is called."""
+        agent = BaseAgent(AgentContext(repo_root=tmp_path))
+        waiter = asyncio.ensure_future(agent._interruptible(asyncio.sleep(60)))
+        await asyncio.sleep(0)
+
+        await agent.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, timeout=1)
+        assert agent.is_cancelled() is True
+        assert agent.state.status == AgentStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_outer_cancel_stops_work(self, tmp_path: Path) -> None:
+        """Should cancel the awaited work when the caller is cancelled."""
+        agent = BaseAgent(AgentContext(repo_root=tmp_path))
+        finished = []
+
+        async def work() -> None:
+            await asyncio.sleep(0.05)
+            finished.append(True)
+
+        waiter = asyncio.ensure_future(agent._interruptible(work()))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        await asyncio.sleep(0.1)
+        assert finished == []
+        assert agent.is_cancelled() is False
+
+
+class TestPackageImports:
+    """Tests for lazy imports in the agents package."""
+
+    def test_base_import_is_lazy(self) -> None:
+        """Should not import coder/planner/session until requested."""
+        backend = Path(__file__).parent.parent.parent.parent / "apps" / "backend"
+        code = (
+            "import sys; import agents; "
+            "assert 'agents.coder' not in sys.modules; "
+            "assert 'agents.session' not in sys.modules; "
+            "from agents import CoderAgent; "
+            "assert 'agents.coder' in sys.modules"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=str(backend),
+            capture_output=True,
+            text=True,
+        )
+        assert result.returncode == 0, result.stderr
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,106 @@
+"""
+Tests for agents.cache module.
+
+Part of Claude God Code - Autonomous Excellence
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "apps" / "backend"))
+
+from agents.base import AgentConfig, AgentContext, BaseAgent
+from agents.cache import LLMCache, MemoryBackend
+
+
+class TestMemoryBackend:
+    """Tests for MemoryBackend."""
+
+    @pytest.mark.asyncio
+    async def test_get_set_delete(self) -> None:
+        """Should store, return and remove values."""
+        backend = MemoryBackend()
+        await backend.set("key", "value")
+        assert await backend.get("key") == "value"
+        await backend.delete("key")
+        assert await backend.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used(self) -> None:
+        """Should evict the oldest untouched entry when full."""
+        backend = MemoryBackend(max_size=2)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")
+        await backend.set("c", 3)
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+        assert len(backend) == 2
+
+
+class TestLLMCache:
+    """Tests for LLMCache."""
+
+    def test_cache_key_is_stable(self) -> None:
+        """Should produce the same key for equivalent requests."""
+        messages = [{"role": "user", "content": "hi"}]
+        key1 = LLMCache.cache_key("model", messages, 0.0, 100)
+        key2 = LLMCache.cache_key("model", list(messages), 0.0, 100)
+        assert key1 == key2
+        assert key1 != LLMCache.cache_key("other", messages, 0.0, 100)
+
+    def test_is_cacheable(self) -> None:
+        """Should only cache deterministic requests."""
+        assert LLMCache.is_cacheable(0) is True
+        assert LLMCache.is_cacheable(0.7) is False
+
+    @pytest.mark.asyncio
+    async def test_tracks_stats(self) -> None:
+        """Should count hits and misses."""
+        cache = LLMCache()
+        await cache.get("missing")
+        await cache.set("key", "value")
+        await cache.get("key")
+        assert cache.get_stats() == {"hits": 1, "misses": 1}
+
+
+class TestCachedLLMCall:
+    """Tests for BaseAgent._cached_llm_call."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_deterministic_response(self, tmp_path: Path) -> None:
+        """Should only call the model once for repeated temperature-0 requests."""
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            return "response"
+
+        config = AgentConfig(temperature=0.0, llm_cache=LLMCache())
+        agent = BaseAgent(AgentContext(repo_root=tmp_path, config=config))
+        messages = [{"role": "user", "content": "plan"}]
+
+        assert await agent._cached_llm_call(messages, call) == "response"
+        assert await agent._cached_llm_call(messages, call) == "response"
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_skips_cache_when_not_deterministic(self, tmp_path: Path) -> None:
+        """Should always call the model when temperature is above zero."""
+        calls = 0
+
+        async def call() -> str:
+            nonlocal calls
+            calls += 1
+            return "response"
+
+        config = AgentConfig(temperature=0.7, llm_cache=LLMCache())
+        agent = BaseAgent(AgentContext(repo_root=tmp_path, config=config))
+        messages = [{"role": "user", "content": "plan"}]
+
+        await agent._cached_llm_call(messages, call)
+        await agent._cached_llm_call(messages, call)
+        assert calls == 2
@@ -4,6 +4,8 @@ Tests for agents.coder module.
 Part of Claude God Code - Autonomous Excellence
 """
 
+import asyncio
+import logging
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,6 +20,7 @@ from agents.coder import (
     CoderAgent,
     DiffChunker,
     FileChange,
+    FileChangeStore,
     WorktreeIntegration,
     count_affected_files,
     validate_diff_size,
@@ -53,6 +56,55 @@ class TestFileChange:
         assert d["change_type"] == "create"
         assert d["diff_lines"] == 50
 
+    def test_encodes_content_once(self) -> None:
+        """Should encode content on first use and reuse the bytes."""
+        change = FileChange(path="a.py", change_type="create", new_content="é\nb\n", diff_lines=7)
+        encoded = change.new_content_bytes
+        assert encoded == "é\nb\n".encode("utf-8")
+        assert change.new_content_bytes is encoded
+        assert change.diff_lines == 7
+        assert "new_content_bytes" not in change.to_dict()
+
+    def test_reassigned_content_is_encoded_again(self) -> None:
+        """Should encode the new string after new_content is reassigned."""
+        change = FileChange(path="a.py", change_type="create", new_content="a\n", diff_lines=1)
+        assert change.new_content_bytes == b"a\n"
+        change.new_content = "é\nb\nc\n"
+        assert change.new_content_bytes == "é\nb\nc\n".encode("utf-8")
+        assert change.diff_lines == 1
+
+        change.new_content = None
+        assert change.new_content_bytes is None
+
+
+class TestFileChangeStore:
+    """Tests for FileChangeStore."""
+
+    def test_round_trips_changes(self) -> None:
+        """Should rebuild equal FileChange views from its columns."""
+        store = FileChangeStore()
+        change = FileChange(path="a.py", change_type="modify", original_content="x", new_content="é")
+        store.append(change)
+        store.append(FileChange(path="b.py", change_type="delete"))
+
+        assert len(store) == 2
+        assert store[0] == change
+        assert store[0].new_content_bytes == change.new_content_bytes
+        assert [c.path for c in store] == ["a.py", "b.py"]
+
+    def test_to_dicts_matches_file_change(self) -> None:
+        """Should serialize the same as FileChange.to_dict."""
+        changes = [
+            FileChange(path="a.py", change_type="create", diff_lines=3),
+            FileChange(path="b.py", change_type="modify", diff_lines=4),
+        ]
+        store = FileChangeStore()
+        for change in changes:
+            store.append(change)
+
+        assert store.to_dicts() == [c.to_dict() for c in changes]
+        assert store.total_diff_lines() == 7
+
 
 class TestCodeGenerationResult:
     """Tests for CodeGenerationResult dataclass."""
@@ -121,6 +173,89 @@ class TestDiffChunker:
         chunks = chunker.chunk_diff(diff)
         assert len(chunks) > 1
 
+    def test_chunk_repeats_file_header(self) -> None:
+        """Should start continuation chunks with the current file header."""
+        chunker = DiffChunker(max_lines=6)
+        header = ["diff --git a/f.py b/f.py", "--- a/f.py", "+++ b/f.py"]
+        body = [f"+line{i}" for i in range(6)]
+        chunks = chunker.chunk_diff("\n".join(header + body))
+        assert chunks[0] == "\n".join(header + body[:3])
+        assert chunks[1] == "\n".join(header + body[3:])
+
+    def test_chunk_header_resets_per_file(self) -> None:
+        """Should carry only the latest file's header into continuation chunks."""
+        chunker = DiffChunker(max_lines=5)
+        first = ["diff --git a/a.py b/a.py", "--- a/a.py", "+++ b/a.py", "+a"]
+        second = ["diff --git a/b.py b/b.py", "--- a/b.py", "+++ b/b.py"]
+        body = [f"+line{i}" for i in range(4)]
+        chunks = chunker.chunk_diff("\n".join(first + second + body))
+        assert all("a/a.py" not in chunk for chunk in chunks[1:])
+        assert chunks[1].startswith("\n".join(second))
+
+    def test_chunk_count_beyond_estimate(self) -> None:
+        """Should keep every chunk when repeated headers exceed the size estimate."""
+        chunker = DiffChunker(max_lines=3)
+        header = ["diff --git a/f.py b/f.py", "--- a/f.py", "+++ b/f.py"]
+        body = [f"+line{i}" for i in range(10)]
+        chunks = chunker.chunk_diff("\n".join(header + body))
+        assert len(chunks) == 12
+        assert chunks[-2] == "\n".join(header + body[-1:])
+
+    def test_prepare_matches_needs_chunking(self) -> None:
+        """Should split once and agree with needs_chunking."""
+        chunker = DiffChunker(max_lines=10)
+        for size in (5, 11, 12, 50):
+            diff = "\n".join([f"line{i}" for i in range(size)])
+            lines, needs = chunker.prepare(diff)
+            assert needs is chunker.needs_chunking(diff)
+            assert chunker.chunk_diff(diff, lines) == chunker.chunk_diff(diff)
+
+    def test_chunk_diff_is_memoized_per_chunker(self) -> None:
+        """Should reuse chunks for a repeated diff without sharing the list."""
+        chunker = DiffChunker(max_lines=10)
+        diff = "\n".join([f"memo{i}" for i in range(50)])
+        first = chunker.chunk_diff(diff)
+        first.append("mutated")
+        second = chunker.chunk_diff(diff)
+        assert "mutated" not in second
+        assert second == DiffChunker(max_lines=10).chunk_diff(diff)
+
+        chunker.max_lines = 25
+        assert chunker.chunk_diff(diff) != second
+
+    def test_chunk_cache_is_bounded(self) -> None:
+        """Should only remember a few recent diffs."""
+        chunker = DiffChunker(max_lines=10)
+        for i in range(20):
+            chunker.chunk_diff(f"diff {i}")
+            chunker.validate_size(f"diff {i}")
+        assert len(chunker._chunks) == len(chunker._sizes) == 8
+
+    def test_validate_size_matches_function(self) -> None:
+        """Should agree with validate_diff_size for the chunker's limit."""
+        chunker = DiffChunker(max_lines=10)
+        diff = "\n".join(f"line{i}" for i in range(20))
+        assert chunker.validate_size(diff) == validate_diff_size(diff, max_lines=10)
+        assert chunker.validate_size(diff) is chunker.validate_size(diff)
+
+    def test_size_checks_share_one_count(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should scan a diff once across needs_chunking and validate_size."""
+        import agents.coder as coder_module
+
+        calls = []
+        real = coder_module._line_count
+
+        def counting(diff: str) -> int:
+            calls.append(diff)
+            return real(diff)
+
+        monkeypatch.setattr(coder_module, "_line_count", counting)
+        chunker = DiffChunker(max_lines=10)
+        diff = "\n".join(f"line{i}" for i in range(50))
+        assert chunker.needs_chunking(diff) is True
+        assert chunker.validate_size(diff)[0] is False
+        assert len(calls) == 1
+
     def test_get_chunk_summary(self) -> None:
         """Should provide chunk summary."""
         chunker = DiffChunker(max_lines=10)
@@ -159,6 +294,12 @@ class TestValidateDiffSize:
         assert valid is False
         assert "too large" in msg
 
+    def test_counts_last_line(self) -> None:
+        """Should count a final line without a trailing newline."""
+        valid, msg = validate_diff_size("a\nb", max_lines=1)
+        assert valid is False
+        assert "2 lines" in msg
+
 
 class TestCountAffectedFiles:
     """Tests for count_affected_files function."""
@@ -279,6 +420,48 @@ class TestCoderAgent:
 class TestCoderAgentAsync:
     """Async tests for CoderAgent."""
 
+    @pytest.mark.asyncio
+    async def test_run_publishes_plan_changes(self, tmp_path: Path) -> None:
+        """Should report task status changes as deltas while running a plan."""
+        events: list[tuple] = []
+        context = AgentContext(
+            repo_root=tmp_path,
+            task_description="Test",
+            config=AgentConfig(use_worktree_isolation=False, auto_continue=True),
+            on_progress=lambda *args: events.append(args),
+        )
+        plan = ExecutionPlan(spec_id="test", task_description="Test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+        coder = CoderAgent(context, plan)
+
+        await coder.run()
+
+        deltas = [data["plan_changes"] for *_, data in events if data and "plan_changes" in data]
+        assert [change[0][1]["status"] for change in deltas] == ["in_progress", "completed"]
+        assert plan.drain_changes() == []
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_generation(self, tmp_path: Path) -> None:
+        """Should stop promptly when cancelled mid-generation."""
+        context = AgentContext(
+            repo_root=tmp_path,
+            task_description="Test",
+            config=AgentConfig(use_worktree_isolation=False),
+        )
+        coder = CoderAgent(context)
+
+        async def slow_generation(task_description: str) -> list[FileChange]:
+            await asyncio.sleep(60)
+            return []
+
+        coder._generate_code_changes = slow_generation  # type: ignore[method-assign]
+        run_task = asyncio.ensure_future(coder.run())
+        await asyncio.sleep(0.01)
+
+        await coder.cancel()
+        state = await asyncio.wait_for(run_task, timeout=1)
+        assert state.status == AgentStatus.CANCELLED
+
     @pytest.mark.asyncio
     async def test_apply_change_create(self, tmp_path: Path) -> None:
         """Should create new file."""
@@ -316,6 +499,18 @@ class TestCoderAgentAsync:
         assert result is True
         assert test_file.read_text() == "new content"
 
+    @pytest.mark.asyncio
+    async def test_apply_change_modify_truncates(self, tmp_path: Path) -> None:
+        """Should replace longer existing content and keep UTF-8 intact."""
+        test_file = tmp_path / "existing.py"
+        test_file.write_text("x" * 1000)
+
+        coder = CoderAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        change = FileChange(path="existing.py", change_type="modify", new_content="é = 1\n")
+
+        assert await coder._apply_change(change) is True
+        assert test_file.read_bytes() == "é = 1\n".encode("utf-8")
+
     @pytest.mark.asyncio
     async def test_apply_change_delete(self, tmp_path: Path) -> None:
         """Should delete file."""
@@ -335,6 +530,77 @@ class TestCoderAgentAsync:
         assert result is True
         assert not test_file.exists()
 
+    @pytest.mark.asyncio
+    async def test_apply_change_delete_missing(self, tmp_path: Path) -> None:
+        """Should treat deleting a missing file as success."""
+        coder = CoderAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        change = FileChange(path="missing.py", change_type="delete")
+        assert await coder._apply_change(change) is True
+
+    @pytest.mark.asyncio
+    async def test_apply_changes_batch(self, tmp_path: Path) -> None:
+        """Should apply a batch, keeping same-path changes in order."""
+        (tmp_path / "gone.py").write_text("bye")
+        context = AgentContext(repo_root=tmp_path, task_description="Test")
+        coder = CoderAgent(context)
+
+        changes = [
+            FileChange(path=f"pkg/mod{i}.py", change_type="create", new_content=f"x = {i}")
+            for i in range(20)
+        ]
+        changes.append(FileChange(path="pkg/mod0.py", change_type="modify", new_content="x = 'last'"))
+        changes.append(FileChange(path="gone.py", change_type="delete"))
+
+        results = await coder._apply_changes(changes)
+        assert results == [True] * len(changes)
+        assert (tmp_path / "pkg" / "mod5.py").read_text() == "x = 5"
+        assert (tmp_path / "pkg" / "mod0.py").read_text() == "x = 'last'"
+        assert not (tmp_path / "gone.py").exists()
+
+    @pytest.mark.asyncio
+    async def test_apply_changes_logs_summary(
+        self, tmp_path: Path, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Should log one summary line per batch instead of one per file."""
+        coder = CoderAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        changes = [
+            FileChange(path=f"mod{i}.py", change_type="create", new_content="x = 1")
+            for i in range(3)
+        ]
+
+        with caplog.at_level(logging.INFO, logger="agents.coder"):
+            await coder._apply_changes(changes)
+
+        messages = [r.getMessage() for r in caplog.records if r.name == "agents.coder"]
+        assert messages == ["Applied changes: +3 ~0 -0 (0 failed)"]
+
+    @pytest.mark.asyncio
+    async def test_get_diff_summary(self, tmp_path: Path) -> None:
+        """Should report changed files from git without blocking."""
+        import subprocess
+
+        def git(*args: str) -> None:
+            subprocess.run(["git", *args], cwd=tmp_path, check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test")
+        (tmp_path / "app.py").write_text("x = 1\n")
+        git("add", "app.py")
+        git("commit", "-q", "-m", "init")
+        (tmp_path / "app.py").write_text("x = 2\n")
+
+        coder = CoderAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        summary = await coder.get_diff_summary()
+        assert "app.py" in summary
+        assert await coder.get_diff_summary_bytes() == summary.encode("utf-8")
+
+    @pytest.mark.asyncio
+    async def test_get_diff_summary_not_a_repo(self, tmp_path: Path) -> None:
+        """Should return an empty summary outside a git repository."""
+        coder = CoderAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        assert await coder.get_diff_summary() == ""
+
     @pytest.mark.asyncio
     async def test_update_metrics_for_change(self, tmp_path: Path) -> None:
         """Should update metrics correctly."""
@@ -5,13 +5,15 @@ Part of Claude God Code - Autonomous Excellence
 """
 
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "apps" / "backend"))
 
-from agents.base import AgentConfig, AgentContext
+from agents.base import AgentConfig, AgentContext, AgentStatus, ErrorSeverity
 from agents.planner import (
     ExecutionPlan,
     PlannedTask,
@@ -77,6 +79,24 @@ class TestPlannedTask:
         assert d["priority"] == "medium"
         assert "file1.py" in d["files_to_modify"]
 
+    def test_complexity_score(self) -> None:
+        """Should weight complexity levels, treating unknown levels as medium."""
+        task = PlannedTask(id="1", title="T", description="", task_type=TaskType.TEST, priority=TaskPriority.LOW)
+        scores = {}
+        for level in ("simple", "medium", "complex", "unknown"):
+            task.estimated_complexity = level
+            scores[level] = task.complexity_score
+        assert scores == {"simple": 1, "medium": 2, "complex": 3, "unknown": 2}
+
+    def test_dependencies_normalized_to_frozenset(self) -> None:
+        """Should store dependencies as a frozenset and serialize them sorted."""
+        task = PlannedTask(
+            id="3", title="T3", description="", task_type=TaskType.TEST,
+            priority=TaskPriority.LOW, dependencies=["2", "1", "2"],
+        )
+        assert task.dependencies == frozenset({"1", "2"})
+        assert task.to_dict()["dependencies"] == ["1", "2"]
+
 
 class TestExecutionPlan:
     """Tests for ExecutionPlan dataclass."""
@@ -146,6 +166,147 @@ class TestExecutionPlan:
         assert plan.tasks[0].completed_at is not None
         assert plan.tasks[0].result == "Done"
 
+    def test_task_timestamps_are_utc_with_duration(self) -> None:
+        """Should stamp aware UTC times and report a non-negative duration."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.tasks = [
+            PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH),
+        ]
+        assert plan.tasks[0].duration_seconds is None
+        plan.mark_task_started("1")
+        plan.mark_task_completed("1", "Done")
+        task = plan.tasks[0]
+        assert task.started_at.tzinfo is timezone.utc
+        assert task.completed_at.tzinfo is timezone.utc
+        assert plan.created_at.tzinfo is timezone.utc
+        assert task.duration_seconds >= 0
+        data = task.to_dict()
+        assert data["started_at"] == task.started_at.isoformat()
+        assert data["completed_at"] == task.completed_at.isoformat()
+        assert data["duration_seconds"] == task.duration_seconds
+
+    def test_to_dict_rerenders_reassigned_timestamp(self) -> None:
+        """Should not reuse a cached isoformat string after started_at is replaced."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.tasks = [
+            PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH),
+        ]
+        plan.mark_task_started("1")
+        replacement = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+        plan.tasks[0].started_at = replacement
+        assert plan.tasks[0].to_dict()["started_at"] == replacement.isoformat()
+
+    def test_uses_slots(self) -> None:
+        """Should use slots instead of a per-instance __dict__."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+        assert not hasattr(plan, "__dict__")
+        assert not hasattr(plan.tasks[0], "__dict__")
+
+    def test_to_dict_reuses_unchanged_tasks(self) -> None:
+        """Should reuse task dictionaries until a task changes."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+        plan.add_task(PlannedTask(id="2", title="T2", description="", task_type=TaskType.TEST, priority=TaskPriority.HIGH))
+
+        first = plan.to_dict()
+        plan.mark_task_completed("1", "Done")
+        second = plan.to_dict()
+
+        assert second["tasks"][1] == first["tasks"][1]
+        assert first["tasks"][0]["status"] == "pending"
+        assert second["tasks"][0]["status"] == "completed"
+        assert second["progress"]["completed"] == 1
+
+        plan.tasks[1].title = "Renamed"
+        plan.invalidate_cache()
+        assert plan.to_dict()["tasks"][1]["title"] == "Renamed"
+
+    def test_to_dict_returns_task_copies(self) -> None:
+        """Should not let edits to a returned task dictionary reach the cache."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+
+        plan.to_dict()["tasks"][0]["status"] = "corrupted"
+        assert plan.to_dict()["tasks"][0]["status"] == "pending"
+
+        plan.mark_task_started("1")
+        assert plan.to_dict()["tasks"][0]["status"] == "in_progress"
+
+    def test_to_dict_drops_removed_tasks_from_cache(self) -> None:
+        """Should not keep serializations of tasks no longer in the plan."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+        plan.add_task(PlannedTask(id="2", title="T2", description="", task_type=TaskType.TEST, priority=TaskPriority.HIGH))
+        plan.to_dict()
+
+        del plan.tasks[0]
+        assert [t["id"] for t in plan.to_dict()["tasks"]] == ["2"]
+        assert len(plan._task_dicts) == 1
+
+    def test_add_task_keeps_index(self) -> None:
+        """Should find tasks added after construction."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+        plan.add_task(PlannedTask(id="2", title="T2", description="", task_type=TaskType.TEST, priority=TaskPriority.HIGH, dependencies=["1"]))
+
+        assert plan.get_task("2") is plan.tasks[1]
+        plan.mark_task_completed("1")
+        next_task = plan.get_next_task()
+        assert next_task is not None and next_task.id == "2"
+
+    def test_next_task_follows_status_changes(self) -> None:
+        """Should skip started and failed tasks and unblock on completion."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.tasks = [
+            PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH),
+            PlannedTask(id="2", title="T2", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH),
+            PlannedTask(id="3", title="T3", description="", task_type=TaskType.TEST, priority=TaskPriority.HIGH, dependencies=["1"]),
+        ]
+        plan.mark_task_started("1")
+        assert plan.get_next_task().id == "2"
+        plan.mark_task_failed("2", "boom")
+        assert plan.get_next_task() is None
+        plan.mark_task_completed("1")
+        assert plan.get_next_task().id == "3"
+        plan.mark_task_started("missing")
+
+    def test_drain_changes(self) -> None:
+        """Should report task updates since the last drain only."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        plan.add_task(PlannedTask(id="1", title="T1", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH))
+        plan.add_task(PlannedTask(id="2", title="T2", description="", task_type=TaskType.TEST, priority=TaskPriority.HIGH))
+
+        plan.mark_task_started("1")
+        plan.mark_task_completed("1", "Done")
+        changes = plan.drain_changes()
+
+        assert [(task_id, fields["status"]) for task_id, fields in changes] == [
+            ("1", "in_progress"), ("1", "completed"),
+        ]
+        assert changes[1][1]["result"] == "Done"
+        assert changes[1][1]["completed_at"] == plan.tasks[0].completed_at.isoformat()
+        assert plan.drain_changes() == []
+
+        plan.mark_task_failed("2", "boom")
+        assert plan.drain_changes() == [("2", {
+            "status": "failed",
+            "completed_at": plan.tasks[1].completed_at.isoformat(),
+            "result": "Failed: boom",
+        })]
+
+    def test_mark_tasks_completed(self) -> None:
+        """Should complete a batch of tasks with one shared timestamp."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        for i in range(3):
+            plan.add_task(PlannedTask(id=str(i), title="T", description="", task_type=TaskType.TEST, priority=TaskPriority.LOW))
+
+        plan.mark_tasks_completed(["0", "2", "missing"], "Replayed")
+
+        assert [t.status for t in plan.tasks] == ["completed", "pending", "completed"]
+        assert plan.tasks[0].completed_at is plan.tasks[2].completed_at
+        assert plan.tasks[2].result == "Replayed"
+
     def test_get_progress(self) -> None:
         """Should calculate progress correctly."""
         plan = ExecutionPlan(spec_id="test", task_description="test")
@@ -162,6 +323,20 @@ class TestExecutionPlan:
         assert progress["pending"] == 2
         assert progress["percentage"] == 25
 
+    def test_get_progress_tracks_marks(self) -> None:
+        """Should keep counts current as tasks change status."""
+        plan = ExecutionPlan(spec_id="test", task_description="test")
+        for i in range(3):
+            plan.add_task(PlannedTask(id=str(i), title="T", description="", task_type=TaskType.TEST, priority=TaskPriority.LOW))
+        plan.mark_task_started("0")
+        plan.mark_task_completed("0")
+        plan.mark_task_failed("1", "boom")
+
+        progress = plan.get_progress()
+        assert (progress["completed"], progress["failed"], progress["pending"]) == (1, 1, 1)
+        assert progress["in_progress"] == 0
+        assert progress["percentage"] == 33
+
 
 class TestPlannerAgent:
     """Tests for PlannerAgent class."""
@@ -201,6 +376,13 @@ class TestPlannerAgent:
         task_type = planner._infer_task_type("Document API endpoints")
         assert task_type == TaskType.DOCUMENTATION
 
+    def test_infer_task_type_precedence(self, tmp_path: Path) -> None:
+        """Should prefer higher-precedence types regardless of word order."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        assert planner._infer_task_type("Add tests then migrate the schema") == TaskType.MIGRATION
+        assert planner._infer_task_type("Clean upgrade of the parser") == TaskType.MIGRATION
+        assert planner._infer_task_type("Design docs for the API") == TaskType.DOCUMENTATION
+
     def test_infer_priority_critical(self, tmp_path: Path) -> None:
         """Should infer critical priority."""
         context = AgentContext(repo_root=tmp_path, task_description="Critical security fix needed urgently")
@@ -222,6 +404,12 @@ class TestPlannerAgent:
         priority = planner._infer_priority("Minor cleanup when possible")
         assert priority == TaskPriority.LOW
 
+    def test_infer_priority_matches_word_stems(self, tmp_path: Path) -> None:
+        """Should match priority keywords inside longer words."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        assert planner._infer_priority("Urgently patch the login") == TaskPriority.CRITICAL
+        assert planner._infer_priority("Add profile page") == TaskPriority.MEDIUM
+
     def test_decompose_implementation_task(self, tmp_path: Path) -> None:
         """Should decompose implementation task into subtasks."""
         context = AgentContext(repo_root=tmp_path, task_description="Add user profile page")
@@ -262,10 +450,258 @@ class TestPlannerAgent:
         assert "2" in phases[1]
         assert "3" in phases[2]
 
+    def test_organize_phases_diamond(self, tmp_path: Path) -> None:
+        """Should group independent tasks and keep plan order within a phase."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+
+        def task(task_id: str, deps: list[str]) -> PlannedTask:
+            return PlannedTask(
+                id=task_id, title=task_id, description="",
+                task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH, dependencies=deps,
+            )
+
+        tasks = [task("a", []), task("c", ["a"]), task("b", ["a"]), task("d", ["b", "c"])]
+        assert planner._organize_phases(tasks) == [["a"], ["c", "b"], ["d"]]
+
+    def test_organize_phases_independent(self, tmp_path: Path) -> None:
+        """Should place independent tasks in a single phase."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        tasks = [
+            PlannedTask(id=str(i), title="T", description="", task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH)
+            for i in range(4)
+        ]
+        assert planner._organize_phases(tasks) == [["0", "1", "2", "3"]]
+        assert planner._organize_phases([]) == []
+
+    def test_organize_phases_cycle(self, tmp_path: Path) -> None:
+        """Should flush tasks stuck in a cycle into a final phase."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+
+        def task(task_id: str, deps: list[str]) -> PlannedTask:
+            return PlannedTask(
+                id=task_id, title=task_id, description="",
+                task_type=TaskType.ANALYSIS, priority=TaskPriority.HIGH, dependencies=deps,
+            )
+
+        tasks = [task("a", []), task("b", ["c"]), task("c", ["b"]), task("d", ["missing"])]
+        assert planner._organize_phases(tasks) == [["a"], ["b", "c", "d"]]
+
+
+    @pytest.mark.parametrize(
+        ("levels", "expected"),
+        [
+            (["simple", "simple", "medium"], "simple"),
+            (["simple", "medium"], "medium"),
+            (["medium", "complex"], "complex"),
+            ([], "medium"),
+        ],
+    )
+    def test_calculate_plan_metrics(self, tmp_path: Path, levels: list[str], expected: str) -> None:
+        """Should bucket the average task complexity at the 1.5 and 2.5 cut points."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        planner._plan = ExecutionPlan(spec_id="test", task_description="test")
+        for i, level in enumerate(levels):
+            planner._plan.add_task(PlannedTask(
+                id=str(i), title="T", description="", task_type=TaskType.TEST,
+                priority=TaskPriority.LOW, estimated_complexity=level,
+            ))
+        planner._calculate_plan_metrics()
+        assert planner._plan.estimated_total_complexity == expected
+
+
+class TestTaskTemplates:
+    """Tests for the plan decomposition templates."""
+
+    def test_dependencies_point_backwards(self) -> None:
+        """Should only depend on earlier steps so plans stay acyclic."""
+        from agents.planner import _GENERIC_TEMPLATES, _TEMPLATES
+
+        for templates in (*_TEMPLATES.values(), _GENERIC_TEMPLATES):
+            for index, template in enumerate(templates):
+                assert all(0 <= dep < index for dep in template.dependencies)
+
+    def test_reuses_skeletons_across_plans(self, tmp_path: Path) -> None:
+        """Should share immutable structure but not task objects between plans."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        first = planner._decompose_task("Add login page")
+        second = planner._decompose_task("Add signup page")
+
+        assert first[2].dependencies is second[2].dependencies
+        assert first[0] is not second[0]
+        assert "signup" in second[0].description
+        first[0].status = "completed"
+        assert second[0].status == "pending"
+
+    def test_generic_uses_inferred_type_and_priority(self, tmp_path: Path) -> None:
+        """Should fill unset template fields from the description."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+        tasks = planner._decompose_task("Document {config} urgently")
+
+        assert [t.id for t in tasks] == ["task_1", "task_2", "task_3"]
+        assert tasks[1].description == "Document {config} urgently"
+        assert tasks[1].task_type == TaskType.DOCUMENTATION
+        assert tasks[1].priority == TaskPriority.CRITICAL
+        assert tasks[2].dependencies == frozenset({"task_2"})
+
+
+class StubImpactAnalyzer:
+    """Impact analyzer returning a fixed result and recording its inputs."""
+
+    def __init__(self, breaking: list[tuple[str, str]]) -> None:
+        self.calls: list[list[str]] = []
+        self.impact = SimpleNamespace(
+            severity=SimpleNamespace(value="high"),
+            summary="stub",
+            breaking_changes=[
+                SimpleNamespace(location=location, description=description)
+                for location, description in breaking
+            ],
+            requires_migration_plan=lambda: False,
+        )
+
+    async def analyze_impact(self, description: str, files: list[str]) -> SimpleNamespace:
+        self.calls.append(sorted(files))
+        return self.impact
+
+
+class FailingImpactAnalyzer:
+    """Impact analyzer whose every call fails."""
+
+    async def analyze_impact(self, description: str, files: list[str]) -> SimpleNamespace:
+        raise TimeoutError("analyzer timed out")
+
+
+def _decompose_with_files(description: str) -> list[PlannedTask]:
+    """Decompose into a single implementation task that declares a file."""
+    return [
+        PlannedTask(
+            id="task_1", title="T1", description=description, task_type=TaskType.IMPLEMENTATION,
+            priority=TaskPriority.HIGH, files_to_modify=["a.py"],
+        ),
+    ]
+
 
 class TestPlannerAgentAsync:
     """Async tests for PlannerAgent."""
 
+    @pytest.mark.asyncio
+    async def test_impact_assigns_breaking_changes_by_file(self, tmp_path: Path) -> None:
+        """Should attach only breaking changes located in a task's files, in report order."""
+        analyzer = StubImpactAnalyzer([
+            ("b.py", "b changed"), ("a.py", "a changed"), ("c.py", "c changed"), ("a.py", "a again"),
+        ])
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"), analyzer)
+        tasks = [
+            PlannedTask(
+                id="1", title="T1", description="", task_type=TaskType.IMPLEMENTATION,
+                priority=TaskPriority.HIGH, files_to_modify=["a.py", "b.py", "a.py"],
+            ),
+            PlannedTask(
+                id="2", title="T2", description="", task_type=TaskType.TEST,
+                priority=TaskPriority.HIGH, files_to_modify=["c.py"],
+            ),
+        ]
+
+        await planner._apply_impact_analysis(tasks)
+
+        assert tasks[0].breaking_changes == ["b changed", "a changed", "a again"]
+        assert tasks[0].impact_severity == "high"
+        assert tasks[1].breaking_changes == []
+        assert analyzer.calls == [["a.py", "b.py", "c.py"]]
+
+    @pytest.mark.asyncio
+    async def test_impact_skipped_without_files(self, tmp_path: Path) -> None:
+        """Should not call the analyzer when no task declares files."""
+        analyzer = StubImpactAnalyzer([])
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"), analyzer)
+        tasks = planner._decompose_task("Implement feature")
+
+        await planner._apply_impact_analysis(tasks)
+
+        assert analyzer.calls == []
+        assert all(task.impact_severity is None for task in tasks)
+
+    @pytest.mark.asyncio
+    async def test_run_applies_impact_to_plan(self, tmp_path: Path) -> None:
+        """Should record plan-level impact results from run()."""
+        analyzer = StubImpactAnalyzer([("a.py", "a changed")])
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"), analyzer)
+        planner._decompose_task = _decompose_with_files
+
+        state = await planner.run()
+
+        plan = planner.get_plan()
+        assert state.status == AgentStatus.COMPLETED
+        assert plan.overall_impact_severity == "high"
+        assert plan.risk_factors == ["a changed"]
+        assert state.artifacts["plan"]["impact_summary"] == "stub"
+
+    @pytest.mark.asyncio
+    async def test_run_survives_impact_failure(self, tmp_path: Path) -> None:
+        """Should complete the plan when impact analysis fails, recording a warning."""
+        planner = PlannerAgent(
+            AgentContext(repo_root=tmp_path, task_description="Test"), FailingImpactAnalyzer()
+        )
+        planner._decompose_task = _decompose_with_files
+
+        state = await planner.run()
+
+        assert state.status == AgentStatus.COMPLETED
+        assert planner.get_plan() is not None
+        assert [error.severity for error in state.errors] == [ErrorSeverity.WARNING]
+
+    @pytest.mark.asyncio
+    async def test_run_completes_when_impact_analysis_raises(self, tmp_path: Path) -> None:
+        """Should record an error escaping impact analysis as a warning, not fatal."""
+        planner = PlannerAgent(
+            AgentContext(repo_root=tmp_path, task_description="Test"), FailingImpactAnalyzer()
+        )
+        planner._decompose_task = _decompose_with_files
+
+        async def broken(tasks: list[PlannedTask]) -> None:
+            raise RuntimeError("analysis crashed")
+
+        planner._apply_impact_analysis = broken
+
+        state = await planner.run()
+
+        assert state.status == AgentStatus.COMPLETED
+        assert planner.get_plan() is not None
+        assert [error.severity for error in state.errors] == [ErrorSeverity.WARNING]
+        assert state.metrics.end_time is not None
+
+    @pytest.mark.asyncio
+    async def test_run_fails_when_decomposition_raises(self, tmp_path: Path) -> None:
+        """Should mark the run fatal when the plan cannot be built."""
+        planner = PlannerAgent(AgentContext(repo_root=tmp_path, task_description="Test"))
+
+        def broken(description: str) -> list[PlannedTask]:
+            raise ValueError("bad description")
+
+        planner._decompose_task = broken
+
+        state = await planner.run()
+
+        assert state.status == AgentStatus.FAILED
+        assert planner.get_plan() is None
+        assert state.metrics.end_time is not None
+
+    @pytest.mark.asyncio
+    async def test_run_sends_full_plan_once(self, tmp_path: Path) -> None:
+        """Should attach the full plan to the completion progress event."""
+        events: list[tuple] = []
+        context = AgentContext(
+            repo_root=tmp_path,
+            task_description="Add user authentication",
+            config=AgentConfig(require_impact_analysis=False),
+            on_progress=lambda *args: events.append(args),
+        )
+        planner = PlannerAgent(context)
+        await planner.run()
+
+        payloads = [data for *_, data in events if data]
+        assert payloads == [{"plan": planner.state.artifacts["plan"]}]
+
     @pytest.mark.asyncio
     async def test_run_creates_plan(self, tmp_path: Path) -> None:
         """Should create execution plan."""
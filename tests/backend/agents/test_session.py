@@ -4,20 +4,26 @@ Tests for agents.session module.
 Part of Claude God Code - Autonomous Excellence
 """
 
+import asyncio
+import json
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "apps" / "backend"))
 
+import agents.base as base_module
 from agents.base import AgentError, AgentMetrics, AgentPhase, ErrorSeverity
+import agents.session as session_module
 from agents.session import (
     ConversationMessage,
     SessionData,
     SessionOrchestrator,
     SessionStore,
+    post_session_processing,
 )
 
 
@@ -46,6 +52,33 @@ class TestConversationMessage:
         assert d["content"] == "Response"
         assert d["metadata"]["key"] == "value"
 
+    def test_to_dict_is_reused(self) -> None:
+        """Should build the dictionary once per message."""
+        msg = ConversationMessage(role="user", content="Hello")
+        assert msg.to_dict() is msg.to_dict()
+        assert msg == ConversationMessage(role="user", content="Hello", timestamp=msg.timestamp)
+
+    def test_timestamps_share_coarse_clock(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should reuse the clock reading until the resolution has passed."""
+        mono = [10**12]
+        monkeypatch.setattr(session_module.time, "monotonic_ns", lambda: mono[0])
+        monkeypatch.setattr(session_module, "_clock_now", None)
+
+        first = ConversationMessage(role="user", content="a")
+        mono[0] += session_module.MESSAGE_CLOCK_RESOLUTION_NS
+        second = ConversationMessage(role="user", content="b")
+        mono[0] += 1
+        third = ConversationMessage(role="user", content="c")
+
+        assert second.timestamp is first.timestamp
+        assert third.timestamp is not first.timestamp
+        assert third.timestamp >= first.timestamp
+
+    def test_uses_slots(self) -> None:
+        """Should use slots instead of a per-instance __dict__."""
+        msg = ConversationMessage(role="user", content="Hello")
+        assert not hasattr(msg, "__dict__")
+
     def test_from_dict(self) -> None:
         """Should create from dictionary."""
         data = {
@@ -123,6 +156,27 @@ class TestSessionData:
         assert session.task_description == "Test task"
 
 
+    def test_finished_duration_is_cached(self) -> None:
+        """Should reuse a finished session's duration until its timestamps change."""
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        session = SessionData(session_id="s", status="completed")
+        session.started_at = start
+        session.completed_at = start + timedelta(seconds=5)
+
+        assert session.get_duration_seconds() == 5.0
+        assert session._duration == (session.started_at, session.completed_at, 5.0)
+
+        session.completed_at = start + timedelta(seconds=8)
+        assert session.get_duration_seconds() == 8.0
+
+    def test_running_duration_is_not_cached(self) -> None:
+        """Should keep measuring a running session against the current time."""
+        session = SessionData(session_id="s", status="running")
+        session.started_at = datetime.now() - timedelta(seconds=2)
+
+        assert session.get_duration_seconds() >= 2.0
+        assert session._duration is None
+
 class TestSessionStore:
     """Tests for SessionStore class."""
 
@@ -180,6 +234,278 @@ class TestSessionStore:
         recent = store.get_recent_sessions(limit=1)
         assert len(recent) == 1
 
+    def test_messages_are_appended(self, tmp_path: Path) -> None:
+        """Should append only new messages to the log and keep a header count."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="log", task_description="")
+        session.add_message("user", "first")
+        store.save(session)
+        session.add_message("assistant", "second")
+        store.save(session)
+
+        session_dir = tmp_path / "sessions" / "log"
+        lines = (session_dir / "messages.jsonl").read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["content"] for line in lines] == ["first", "second"]
+        header = json.loads((session_dir / "header.json").read_text(encoding="utf-8"))
+        assert header["message_count"] == 2
+        assert "messages" not in header
+
+        reloaded = SessionStore(tmp_path / "sessions").load("log")
+        assert [m.content for m in reloaded.messages] == ["first", "second"]
+
+    def test_replaced_messages_rewrite_log(self, tmp_path: Path) -> None:
+        """Should rewrite the log when the message list shrinks."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="log", task_description="")
+        session.add_message("user", "first")
+        session.add_message("user", "second")
+        store.save(session)
+        session.messages = session.messages[1:]
+        store.save(session)
+
+        reloaded = SessionStore(tmp_path / "sessions").load("log")
+        assert [m.content for m in reloaded.messages] == ["second"]
+
+    def test_legacy_session_is_migrated(self, tmp_path: Path) -> None:
+        """Should load single-file sessions and migrate them on save."""
+        sessions_dir = tmp_path / "sessions"
+        sessions_dir.mkdir()
+        legacy = SessionData(session_id="old-format", task_description="Legacy")
+        legacy.add_message("user", "hello")
+        (sessions_dir / "old-format.json").write_text(json.dumps(legacy.to_dict()), encoding="utf-8")
+
+        store = SessionStore(sessions_dir)
+        assert store.list_sessions() == ["old-format"]
+        loaded = store.load("old-format")
+        assert [m.content for m in loaded.messages] == ["hello"]
+
+        store.save(loaded)
+        assert not (sessions_dir / "old-format.json").exists()
+        assert store.list_sessions() == ["old-format"]
+        reloaded = SessionStore(sessions_dir).load("old-format")
+        assert reloaded.task_description == "Legacy"
+        assert [m.content for m in reloaded.messages] == ["hello"]
+
+    def test_delete_removes_directory(self, tmp_path: Path) -> None:
+        """Should remove the session directory."""
+        store = SessionStore(tmp_path / "sessions")
+        store.save(SessionData(session_id="gone", task_description=""))
+        store.delete("gone")
+        assert not (tmp_path / "sessions" / "gone").exists()
+        assert store.list_sessions() == []
+
+
+    def test_load_header(self, tmp_path: Path) -> None:
+        """Should read header fields without the messages, for both layouts."""
+        sessions_dir = tmp_path / "sessions"
+        store = SessionStore(sessions_dir)
+        session = SessionData(session_id="new", status="running")
+        session.add_message("user", "hi")
+        store.save(session)
+        legacy = SessionData(session_id="legacy", status="completed")
+        legacy.add_message("user", "a")
+        legacy.add_message("user", "b")
+        (sessions_dir / "legacy.json").write_text(json.dumps(legacy.to_dict()), encoding="utf-8")
+
+        header = store.load_header("new")
+        assert header["status"] == "running"
+        assert header["message_count"] == 1
+        assert "messages" not in header
+        legacy_header = store.load_header("legacy")
+        assert legacy_header["message_count"] == 2
+        assert "messages" not in legacy_header
+        assert store.load_header("missing") is None
+
+    def test_iter_messages_skips_unfinished_line(self, tmp_path: Path) -> None:
+        """Should stream logged messages and ignore a torn trailing line."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="stream")
+        session.add_message("user", "one")
+        session.add_message("user", "two")
+        store.save(session)
+        with open(tmp_path / "sessions" / "stream" / "messages.jsonl", "ab") as f:
+            f.write(b'{"role": "user", "cont')
+
+        assert [m.content for m in store.iter_messages("stream")] == ["one", "two"]
+        assert list(store.iter_messages("missing")) == []
+
+    def test_recent_sessions_load_only_the_newest(self, tmp_path: Path) -> None:
+        """Should order sessions through the index and load only the ones returned."""
+        store = SessionStore(tmp_path / "sessions")
+        for day in (1, 3, 2):
+            store.save(SessionData(session_id=f"day-{day}", created_at=datetime(2024, 1, day)))
+        index = json.loads((tmp_path / "sessions" / "index.json").read_text(encoding="utf-8"))
+        assert sorted(index) == ["day-1", "day-2", "day-3"]
+
+        fresh = SessionStore(tmp_path / "sessions")
+        recent = fresh.get_recent_sessions(limit=2)
+        assert [s.session_id for s in recent] == ["day-3", "day-2"]
+        assert "day-1" not in fresh._cache
+
+    def test_recent_sessions_index_legacy_and_deleted(self, tmp_path: Path) -> None:
+        """Should add unindexed sessions and drop deleted ones from the index."""
+        sessions_dir = tmp_path / "sessions"
+        store = SessionStore(sessions_dir)
+        store.save(SessionData(session_id="kept", created_at=datetime(2024, 1, 1)))
+        store.save(SessionData(session_id="removed", created_at=datetime(2024, 1, 3)))
+        legacy = SessionData(session_id="legacy", created_at=datetime(2024, 1, 2))
+        (sessions_dir / "legacy.json").write_text(json.dumps(legacy.to_dict()), encoding="utf-8")
+        store.delete("removed")
+
+        recent = SessionStore(sessions_dir).get_recent_sessions()
+        assert [s.session_id for s in recent] == ["legacy", "kept"]
+        index = json.loads((sessions_dir / "index.json").read_text(encoding="utf-8"))
+        assert sorted(index) == ["kept", "legacy"]
+
+    def test_recent_sessions_skip_listing_when_unchanged(self, tmp_path: Path) -> None:
+        """Should reuse the synced index until a session is added or removed."""
+        sessions_dir = tmp_path / "sessions"
+        store = SessionStore(sessions_dir)
+        store.save(SessionData(session_id="first", created_at=datetime(2024, 1, 1)))
+        store.get_recent_sessions()
+
+        listings: list[int] = []
+        list_sessions = store.list_sessions
+        store.list_sessions = lambda: listings.append(1) or list_sessions()
+        store.get_recent_sessions()
+        assert listings == []
+
+        SessionStore(sessions_dir).save(SessionData(session_id="second", created_at=datetime(2024, 1, 2)))
+        recent = store.get_recent_sessions()
+        assert listings == [1]
+        assert [s.session_id for s in recent] == ["second", "first"]
+
+    def test_cache_is_bounded(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should evict the least recently used session past the cache size."""
+        monkeypatch.setattr(session_module, "SESSION_CACHE_SIZE", 2)
+        store = SessionStore(tmp_path / "sessions")
+        for name in ("a", "b"):
+            store.save(SessionData(session_id=name))
+        store.load("a")
+        store.save(SessionData(session_id="c"))
+
+        assert list(store._cache) == ["a", "c"]
+        assert store.load("b").session_id == "b"
+
+    def test_durable_save_fsyncs(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should fsync the log and header only for durable saves."""
+        synced: list[int] = []
+        monkeypatch.setattr(session_module.os, "fsync", synced.append)
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="durable")
+        session.add_message("user", "hi")
+
+        store.save(session)
+        assert synced == []
+
+        store.save(session, durable=True)
+        assert len(synced) == 2
+
+    def test_header_write_is_atomic(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should keep the previous header intact when a write is interrupted."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="atomic", status="running")
+        store.save(session)
+        assert list((tmp_path / "sessions" / "atomic").glob("*.tmp")) == []
+
+        def crash(src: str, dst: str) -> None:
+            raise OSError("power cut")
+
+        monkeypatch.setattr(session_module.os, "replace", crash)
+        session.status = "completed"
+        with pytest.raises(OSError):
+            store.save(session)
+        monkeypatch.undo()
+
+        assert SessionStore(tmp_path / "sessions").load("atomic").status == "running"
+
+    def test_failed_write_does_not_lose_messages(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should rewrite the log after a failed write instead of skipping its messages."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="retry", task_description="")
+        session.add_message("user", "a")
+        store.save(session)
+
+        def crash(path: Path, *args: object, **kwargs: object) -> object:
+            if Path(path).name == "messages.jsonl":
+                raise OSError("disk full")
+            return open(path, *args, **kwargs)
+
+        monkeypatch.setattr(session_module, "open", crash, raising=False)
+        session.add_message("user", "b")
+        with pytest.raises(OSError):
+            store.save(session)
+        monkeypatch.undo()
+
+        session.add_message("user", "c")
+        store.save(session)
+
+        reloaded = SessionStore(tmp_path / "sessions").load("retry")
+        assert [m.content for m in reloaded.messages] == ["a", "b", "c"]
+
+    def test_failed_first_write_keeps_index_entry(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should write the index entry again after the write carrying it failed."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="fresh", task_description="")
+
+        def crash(path: Path, *args: object, **kwargs: object) -> object:
+            if Path(path).name == "messages.jsonl":
+                raise OSError("disk full")
+            return open(path, *args, **kwargs)
+
+        monkeypatch.setattr(session_module, "open", crash, raising=False)
+        with pytest.raises(OSError):
+            store.save(session)
+        monkeypatch.undo()
+
+        store.save(session)
+        assert "fresh" in json.loads((tmp_path / "sessions" / "index.json").read_text(encoding="utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_asave_and_aload(self, tmp_path: Path) -> None:
+        """Should round-trip a session through the async methods."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="async-1", task_description="Async")
+        session.add_message("user", "hi")
+        await store.asave(session)
+        await store.close()
+
+        loaded = await SessionStore(tmp_path / "sessions").aload("async-1")
+        assert loaded.task_description == "Async"
+        assert [m.content for m in loaded.messages] == ["hi"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_asaves_keep_message_order(self, tmp_path: Path) -> None:
+        """Should land concurrent appends in the order they were made."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="ordered", task_description="")
+        saves = []
+        for i in range(20):
+            session.add_message("assistant", str(i))
+            saves.append(asyncio.ensure_future(store.asave(session)))
+            await asyncio.sleep(0)  # let the save queue its write
+        await asyncio.gather(*saves)
+
+        loaded = SessionStore(tmp_path / "sessions").load("ordered")
+        assert [m.content for m in loaded.messages] == [str(i) for i in range(20)]
+
+    def test_stdlib_json_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should read sessions written with orjson using the stdlib fallback."""
+        store = SessionStore(tmp_path / "sessions")
+        session = SessionData(session_id="compat", task_description="Compat")
+        session.add_message("user", "caf\u00e9", {"tokens": 3})
+        store.save(session)
+
+        monkeypatch.setattr(base_module, "ORJSON_AVAILABLE", False)
+        loaded = SessionStore(tmp_path / "sessions").load("compat")
+        assert loaded.to_dict() == session.to_dict()
+
+        loaded.add_message("assistant", "ok")
+        store.save(loaded)
+        monkeypatch.undo()
+        reloaded = SessionStore(tmp_path / "sessions").load("compat")
+        assert [m.content for m in reloaded.messages] == ["caf\u00e9", "ok"]
+
 
 class TestSessionOrchestrator:
     """Tests for SessionOrchestrator class."""
@@ -205,6 +531,23 @@ class TestSessionOrchestrator:
         assert retrieved is not None
         assert retrieved.session_id == created.session_id
 
+    def test_cleanup_stale_sessions(self, tmp_path: Path) -> None:
+        """Should fail only sessions started before the age limit."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        now = datetime.now()
+        ids = {}
+        for name, age in (("stale", timedelta(hours=25)), ("fresh", timedelta(hours=1)), ("unstarted", None)):
+            session = orchestrator.create_session(name)
+            session.started_at = now - age if age else None
+            orchestrator._active_sessions[session.session_id] = session
+            ids[name] = session.session_id
+
+        assert orchestrator.cleanup_stale_sessions(max_age_hours=24) == 1
+        assert set(orchestrator._active_sessions) == {ids["fresh"], ids["unstarted"]}
+        header = SessionStore(orchestrator.sessions_dir).load_header(ids["stale"])
+        assert header["status"] == "failed"
+        assert header["result"] == "Session timed out"
+
     def test_get_active_sessions(self, tmp_path: Path) -> None:
         """Should return active sessions."""
         orchestrator = SessionOrchestrator(tmp_path)
@@ -224,6 +567,34 @@ class TestSessionOrchestratorAsync:
         assert started.status == "running"
         assert started.started_at is not None
 
+    @pytest.mark.asyncio
+    async def test_start_session_releases_lock(self, tmp_path: Path) -> None:
+        """Should not keep a lock around once the session has started."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        session = orchestrator.create_session("Test task")
+        await orchestrator.start_session(session.session_id)
+        assert session.session_id not in orchestrator._locks
+
+    @pytest.mark.asyncio
+    async def test_start_session_with_phase(self, tmp_path: Path) -> None:
+        """Should start in the given phase with a single save."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        session = orchestrator.create_session("Test task")
+
+        with patch.object(orchestrator.store, "asave", wraps=orchestrator.store.asave) as asave:
+            started = await orchestrator.start_session_with_phase(
+                session.session_id, "planning", "Creating plan"
+            )
+
+        assert asave.call_count == 1
+        assert started.status == "running"
+        assert started.phase == "planning"
+        assert started.messages[-1].content == "Creating plan"
+
+        loaded = orchestrator.store.load(session.session_id)
+        assert loaded.phase == "planning"
+        assert loaded.messages[-1].metadata == {"phase": "planning"}
+
     @pytest.mark.asyncio
     async def test_start_session_invalid_status(self, tmp_path: Path) -> None:
         """Should reject starting completed session."""
@@ -306,6 +677,61 @@ class TestSessionOrchestratorAsync:
         assert failed.status == "failed"
         assert "Error occurred" in failed.result
 
+    @pytest.mark.asyncio
+    async def test_message_saves_are_coalesced(self, tmp_path: Path) -> None:
+        """Should defer message saves until flushed, then write the latest state."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        session = orchestrator.create_session("Test")
+        for i in range(5):
+            await orchestrator.add_agent_message(session.session_id, f"chunk {i}")
+
+        on_disk = SessionStore(orchestrator.sessions_dir).load(session.session_id)
+        assert len(on_disk.messages) == 1
+
+        await orchestrator.close()
+        on_disk = SessionStore(orchestrator.sessions_dir).load(session.session_id)
+        assert [m.content for m in on_disk.messages[1:]] == [f"chunk {i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_complete_session_is_durable(self, tmp_path: Path) -> None:
+        """Should write terminal state and earlier pending messages immediately."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        session = orchestrator.create_session("Test")
+        await orchestrator.start_session(session.session_id)
+        await orchestrator.add_agent_message(session.session_id, "Working")
+        await orchestrator.complete_session(session.session_id, "Done")
+
+        on_disk = SessionStore(orchestrator.sessions_dir).load(session.session_id)
+        assert on_disk.status == "completed"
+        assert any(m.content == "Working" for m in on_disk.messages)
+        assert not orchestrator.store._writer.has_pending()
+
+    @pytest.mark.asyncio
+    async def test_post_session_processing_reads_header_only(self, tmp_path: Path) -> None:
+        """Should summarize a finished session without parsing its messages."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        session = orchestrator.create_session("Test")
+        await orchestrator.start_session(session.session_id)
+        await orchestrator.add_agent_message(session.session_id, "Working")
+        await orchestrator.complete_session(session.session_id, "Done", artifacts={"plan": {}})
+
+        fresh = SessionOrchestrator(tmp_path)
+        fresh.store.iter_messages = None  # any message read would fail
+        results = await post_session_processing(fresh, session.session_id, tmp_path)
+
+        assert results["status"] == "completed"
+        assert results["message_count"] == 4
+        assert results["artifacts"] == ["plan"]
+        assert results["error_count"] == 0
+        assert results["duration_seconds"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_post_session_processing_missing(self, tmp_path: Path) -> None:
+        """Should report a missing session."""
+        orchestrator = SessionOrchestrator(tmp_path)
+        results = await post_session_processing(orchestrator, "missing", tmp_path)
+        assert "error" in results
+
     @pytest.mark.asyncio
     async def test_pause_and_resume_session(self, tmp_path: Path) -> None:
         """Should pause and resume session."""
@@ -4,19 +4,26 @@ Tests for cli.commands module.
 Part of Claude God Code - Autonomous Excellence
 """
 
+import asyncio
 import io
+import os
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent / "apps" / "backend"))
 
+import agents.base as base_module
 from cli.commands.start import StartCommand, StartOptions, StartResult
+import cli.commands.status as status_module
 from cli.commands.status import StatusCommand, StatusOptions, StatusResult
+import cli.commands.config as config_module
 from cli.commands.config import ConfigCommand, ConfigOptions, ConfigResult, ConfigManager, DEFAULT_CONFIG
 from cli.commands.qa import QACommand, QAOptions, QAResult
+from qa.loop import QAPhase
 from cli.formatter import TerminalFormatter, FormatterConfig
 
 
@@ -45,12 +52,12 @@ class TestStartCommand:
             mock_session = MagicMock()
             mock_session.session_id = "test-session-123"
             mock_orch.return_value.create_session.return_value = mock_session
-            mock_orch.return_value.start_session = AsyncMock(return_value=mock_session)
+            mock_orch.return_value.start_session_with_phase = AsyncMock(return_value=mock_session)
 
-            with patch('cli.commands.start.ProjectDiscovery') as mock_discovery:
+            with patch('spec.discovery.ProjectDiscovery') as mock_discovery:
                 mock_discovery.return_value.discover = AsyncMock(return_value=MagicMock())
 
-                with patch('cli.commands.start.ImpactAnalyzer') as mock_analyzer:
+                with patch('spec.impact.ImpactAnalyzer') as mock_analyzer:
                     mock_impact = MagicMock()
                     mock_impact.requires_migration_plan.return_value = False
                     mock_analyzer.return_value.analyze_impact = AsyncMock(return_value=mock_impact)
@@ -64,6 +71,200 @@ class TestStartCommand:
 
         assert isinstance(result, StartResult)
 
+    @pytest.mark.asyncio
+    async def test_execute_prepares_orchestrator_during_discovery(self, formatter, tmp_path: Path) -> None:
+        """Should set up the session store while project discovery is running."""
+        cmd = StartCommand(formatter)
+        events: list[str] = []
+
+        async def discover():
+            events.append("discover-start")
+            await asyncio.sleep(0.01)
+            events.append("discover-end")
+            return MagicMock()
+
+        def get_orchestrator(project_dir: Path) -> MagicMock:
+            events.append("orchestrator")
+            orchestrator = MagicMock()
+            orchestrator.create_session.return_value.session_id = "test-session-123"
+            orchestrator.start_session_with_phase = AsyncMock(
+                return_value=orchestrator.create_session.return_value
+            )
+            return orchestrator
+
+        with patch.object(cmd, '_get_orchestrator', side_effect=get_orchestrator), \
+                patch.object(formatter, 'format_impact_analysis'):
+            with patch('spec.discovery.ProjectDiscovery') as mock_discovery:
+                mock_discovery.return_value.discover = discover
+                with patch('spec.impact.ImpactAnalyzer') as mock_analyzer:
+                    mock_analyzer.return_value.analyze_impact = AsyncMock(
+                        return_value=MagicMock(requires_migration_plan=MagicMock(return_value=False))
+                    )
+                    result = await cmd.execute(StartOptions(
+                        task_description="Add feature",
+                        project_dir=tmp_path,
+                        isolated=False,
+                    ))
+
+        assert result.success is True
+        assert events == ["discover-start", "orchestrator", "discover-end"]
+
+    @pytest.mark.asyncio
+    async def test_execute_closes_orchestrator(self, formatter, tmp_path: Path) -> None:
+        """Should write pending saves and stop the session store thread before returning."""
+        from agents.session import SessionOrchestrator, SessionStore
+
+        orchestrator = SessionOrchestrator(tmp_path)
+        cmd = StartCommand(formatter, orchestrator=orchestrator)
+
+        with patch.object(formatter, 'format_impact_analysis'), \
+                patch('spec.discovery.ProjectDiscovery') as mock_discovery, \
+                patch('spec.impact.ImpactAnalyzer') as mock_analyzer:
+            mock_discovery.return_value.discover = AsyncMock(return_value=MagicMock())
+            mock_analyzer.return_value.analyze_impact = AsyncMock(
+                return_value=MagicMock(requires_migration_plan=MagicMock(return_value=False))
+            )
+            result = await cmd.execute(StartOptions(
+                task_description="Add feature",
+                project_dir=tmp_path,
+                isolated=False,
+            ))
+
+        assert result.success is True
+        assert orchestrator.store._executor is None
+        saved = SessionStore(orchestrator.sessions_dir).load(result.session_id)
+        assert saved.phase == "planning"
+
+    async def _run_isolated(
+        self, cmd: StartCommand, formatter, tmp_path: Path, setup_worktree, orchestrator,
+        worktree_error=None, remove_worktree=None,
+    ):
+        """Run an isolated start with discovery, impact and worktree patched."""
+        with patch.object(cmd, '_get_orchestrator', return_value=orchestrator), \
+                patch.object(formatter, 'format_impact_analysis'), \
+                patch('spec.discovery.ProjectDiscovery') as mock_discovery, \
+                patch('spec.impact.ImpactAnalyzer') as mock_analyzer, \
+                patch('core.worktree.WorktreeManager') as mock_worktree:
+            mock_discovery.return_value.discover = AsyncMock(return_value=MagicMock())
+            mock_analyzer.return_value.analyze_impact = AsyncMock(
+                return_value=MagicMock(requires_migration_plan=MagicMock(return_value=False))
+            )
+            mock_worktree.return_value.setup_worktree = setup_worktree
+            mock_worktree.side_effect = worktree_error
+            if remove_worktree is not None:
+                mock_worktree.return_value.remove_worktree = remove_worktree
+            return await cmd.execute(StartOptions(
+                task_description="Add feature",
+                project_dir=tmp_path,
+                isolated=True,
+            ))
+
+    @pytest.mark.asyncio
+    async def test_execute_sets_up_worktree_while_starting_session(self, formatter, tmp_path: Path) -> None:
+        """Should run the worktree setup concurrently with starting the session."""
+        cmd = StartCommand(formatter)
+        session = MagicMock(session_id="test-session-123")
+        orchestrator = MagicMock()
+        orchestrator.create_session.return_value = session
+        setup_started = asyncio.Event()
+        loop = asyncio.get_running_loop()
+
+        async def start_session_with_phase(*args):
+            await asyncio.wait_for(setup_started.wait(), timeout=5)
+            return session
+
+        def setup_worktree(name: str, branch: str) -> Path:
+            loop.call_soon_threadsafe(setup_started.set)
+            return tmp_path / "worktrees" / name
+
+        orchestrator.start_session_with_phase = start_session_with_phase
+        result = await self._run_isolated(cmd, formatter, tmp_path, setup_worktree, orchestrator)
+
+        assert result.success is True
+        assert "worktrees" in formatter.config.stream.getvalue()
+
+    @pytest.mark.asyncio
+    async def test_execute_fails_session_when_worktree_fails(self, formatter, tmp_path: Path) -> None:
+        """Should mark the started session failed when the worktree cannot be created."""
+        cmd = StartCommand(formatter)
+        session = MagicMock(session_id="test-session-123")
+        orchestrator = MagicMock()
+        orchestrator.create_session.return_value = session
+        orchestrator.start_session_with_phase = AsyncMock(return_value=session)
+        orchestrator.fail_session = AsyncMock()
+
+        def setup_worktree(name: str, branch: str) -> Path:
+            raise RuntimeError("branch exists")
+
+        remove_worktree = MagicMock()
+        result = await self._run_isolated(
+            cmd, formatter, tmp_path, setup_worktree, orchestrator, remove_worktree=remove_worktree
+        )
+
+        assert result.success is False
+        assert result.error == "branch exists"
+        orchestrator.fail_session.assert_awaited_once_with("test-session-123", "branch exists")
+        remove_worktree.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_removes_worktree_when_session_start_fails(self, formatter, tmp_path: Path) -> None:
+        """Should remove the new worktree and branch when the session cannot be started."""
+        cmd = StartCommand(formatter)
+        session = MagicMock(session_id="test-session-123")
+        orchestrator = MagicMock()
+        orchestrator.create_session.return_value = session
+        orchestrator.start_session_with_phase = AsyncMock(side_effect=RuntimeError("store unavailable"))
+        orchestrator.fail_session = AsyncMock()
+        remove_worktree = MagicMock()
+
+        def setup_worktree(name: str, branch: str) -> Path:
+            return tmp_path / "worktrees" / name
+
+        result = await self._run_isolated(
+            cmd, formatter, tmp_path, setup_worktree, orchestrator, remove_worktree=remove_worktree
+        )
+
+        assert result.success is False
+        assert result.error == "store unavailable"
+        remove_worktree.assert_called_once()
+        assert remove_worktree.call_args.kwargs == {"delete_branch": True}
+        orchestrator.fail_session.assert_awaited_once_with("test-session-123", "store unavailable")
+
+    @pytest.mark.asyncio
+    async def test_execute_keeps_worktree_error_when_fail_session_raises(self, formatter, tmp_path: Path) -> None:
+        """Should report the worktree error even if marking the session failed raises."""
+        cmd = StartCommand(formatter)
+        session = MagicMock(session_id="test-session-123")
+        orchestrator = MagicMock()
+        orchestrator.create_session.return_value = session
+        orchestrator.start_session_with_phase = AsyncMock(return_value=session)
+        orchestrator.fail_session = AsyncMock(side_effect=OSError("disk full"))
+
+        def setup_worktree(name: str, branch: str) -> Path:
+            raise RuntimeError("branch exists")
+
+        result = await self._run_isolated(cmd, formatter, tmp_path, setup_worktree, orchestrator)
+
+        assert result.success is False
+        assert result.error == "branch exists"
+
+    @pytest.mark.asyncio
+    async def test_execute_does_not_start_session_without_worktree_manager(self, formatter, tmp_path: Path) -> None:
+        """Should not create the start coroutine when the worktree manager cannot be built."""
+        cmd = StartCommand(formatter)
+        session = MagicMock(session_id="test-session-123")
+        orchestrator = MagicMock()
+        orchestrator.create_session.return_value = session
+        orchestrator.start_session_with_phase = AsyncMock(return_value=session)
+
+        result = await self._run_isolated(
+            cmd, formatter, tmp_path, MagicMock(), orchestrator, worktree_error=RuntimeError("not a git repository")
+        )
+
+        assert result.success is False
+        assert result.error == "not a git repository"
+        orchestrator.start_session_with_phase.assert_not_called()
+
 
 class TestStartOptions:
     """Tests for StartOptions dataclass."""
@@ -128,23 +329,110 @@ class TestStatusCommand:
         assert isinstance(result, StatusResult)
         assert result.success is True
 
-    def test_gather_spec_status_empty(self, formatter, tmp_path: Path) -> None:
+    @pytest.mark.asyncio
+    async def test_gather_spec_status_empty(self, formatter, tmp_path: Path) -> None:
         """Should return empty list when no specs."""
         cmd = StatusCommand(formatter)
-        specs = cmd._gather_spec_status(tmp_path)
+        specs = await cmd._gather_spec_status(tmp_path)
         assert specs == []
 
-    def test_gather_spec_status_with_specs(self, formatter, tmp_path: Path) -> None:
+    @pytest.mark.asyncio
+    async def test_gather_spec_status_with_specs(self, formatter, tmp_path: Path) -> None:
         """Should gather spec status."""
         cmd = StatusCommand(formatter)
 
         specs_dir = tmp_path / ".claude-god-code" / "specs"
         (specs_dir / "001-test").mkdir(parents=True)
 
-        specs = cmd._gather_spec_status(tmp_path)
+        specs = await cmd._gather_spec_status(tmp_path)
         assert len(specs) == 1
         assert specs[0]["name"] == "001-test"
 
+    @pytest.mark.asyncio
+    async def test_gather_spec_status_keeps_order(self, formatter, tmp_path: Path) -> None:
+        """Should pair each spec with its own signoff, in name order."""
+        cmd = StatusCommand(formatter)
+
+        specs_dir = tmp_path / ".claude-god-code" / "specs"
+        for name in ("002-b", "001-a", "003-c"):
+            (specs_dir / name).mkdir(parents=True)
+        (specs_dir / "002-b" / "implementation_plan.json").write_text(
+            '{"qa_signoff": {"status": "approved", "qa_session": 2}}'
+        )
+
+        specs = await cmd._gather_spec_status(tmp_path)
+        assert [s["name"] for s in specs] == ["001-a", "002-b", "003-c"]
+        assert [s["status"] for s in specs] == ["unknown", "approved", "unknown"]
+        assert specs[1]["qa_session"] == 2
+
+    def test_display_summary_lists_sessions_and_specs(self, formatter) -> None:
+        """Should render one bullet per session and spec."""
+        cmd = StatusCommand(formatter)
+        session = MagicMock(session_id="abcdef1234", status="running", task_description="Add login")
+        session.get_duration_seconds.return_value = 1.25
+        specs = [{"name": "001-login", "status": "rejected", "issues_count": 2}]
+
+        cmd._display_summary([session], [], specs)
+
+        output = formatter.config.stream.getvalue()
+        assert "abcdef12... [running] Add login... (1.2s)" in output
+        assert "001-login [rejected] (2 issues)" in output
+        assert "No recent sessions" in output
+
+    def test_find_spec_prefers_exact_then_prefix(self, formatter) -> None:
+        """Should match exact names before prefixes before substrings."""
+        cmd = StatusCommand(formatter)
+        specs = [{"name": "001-add-auth"}, {"name": "002-auth"}, {"name": "auth"}]
+        index = {spec["name"]: spec for spec in specs}
+
+        assert cmd._find_spec(index, specs, "auth") is specs[2]
+        assert cmd._find_spec(index, specs, "002") is specs[1]
+        assert cmd._find_spec(index, specs, "add") is specs[0]
+        assert cmd._find_spec(index, specs, "missing") is None
+
+    @pytest.mark.asyncio
+    async def test_gather_spec_status_skips_specs_without_plan(self, formatter, tmp_path: Path) -> None:
+        """Should only read signoffs for specs that have an implementation plan."""
+        cmd = StatusCommand(formatter)
+
+        specs_dir = tmp_path / ".claude-god-code" / "specs"
+        for name in ("001-a", "002-b"):
+            (specs_dir / name).mkdir(parents=True)
+        (specs_dir / "002-b" / "implementation_plan.json").write_text("{}")
+
+        with patch(
+            'cli.commands.status.get_qa_signoff_status',
+            wraps=status_module.get_qa_signoff_status,
+        ) as mock_signoff:
+            specs = await cmd._gather_spec_status(tmp_path)
+
+        mock_signoff.assert_called_once_with(specs_dir / "002-b")
+        assert [s["status"] for s in specs] == ["unknown", "unknown"]
+
+    @pytest.mark.asyncio
+    async def test_spec_detail_reuses_gathered_signoff(self, formatter, tmp_path: Path) -> None:
+        """Should show spec issues without reading the signoff again."""
+        cmd = StatusCommand(formatter)
+
+        specs_dir = tmp_path / ".claude-god-code" / "specs"
+        (specs_dir / "001-test").mkdir(parents=True)
+        (specs_dir / "001-test" / "implementation_plan.json").write_text(
+            '{"qa_signoff": {"status": "rejected", "issues_found": [{"title": "Broken build"}]}}'
+        )
+
+        with patch.object(cmd, '_get_orchestrator') as mock_orch:
+            mock_orch.return_value.get_active_sessions.return_value = []
+            mock_orch.return_value.store.get_recent_sessions.return_value = []
+            with patch(
+                'cli.commands.status.get_qa_signoff_status',
+                wraps=status_module.get_qa_signoff_status,
+            ) as mock_signoff:
+                result = await cmd.execute(StatusOptions(project_dir=tmp_path, spec_name="001"))
+
+        assert result.success is True
+        assert mock_signoff.call_count == 1
+        assert "Broken build" in formatter.config.stream.getvalue()
+
 
 class TestConfigManager:
     """Tests for ConfigManager class."""
@@ -171,6 +459,56 @@ class TestConfigManager:
         assert loaded["model"] == "test-model"
         assert loaded["verbose"] is True
 
+    def test_save_and_load_stdlib_fallback(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should round-trip config through the stdlib json fallback."""
+        monkeypatch.setattr(base_module, "ORJSON_AVAILABLE", False)
+        ConfigManager(tmp_path).save({"model": "test-model", "max_turns": 7})
+
+        monkeypatch.undo()
+        loaded = ConfigManager(tmp_path).load()
+        assert loaded["model"] == "test-model"
+        assert loaded["max_turns"] == 7
+
+    def test_save_is_atomic(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should keep the previous file when a save is interrupted."""
+        ConfigManager(tmp_path).save({"model": "first"})
+
+        def crash(src: str, dst: str) -> None:
+            raise OSError("power cut")
+
+        monkeypatch.setattr(config_module.os, "replace", crash)
+        with pytest.raises(OSError):
+            ConfigManager(tmp_path).save({"model": "second"})
+        monkeypatch.undo()
+
+        assert ConfigManager(tmp_path).load()["model"] == "first"
+
+    def test_load_reuses_cache_until_file_changes(self, tmp_path: Path) -> None:
+        """Should re-read the file only after its mtime changes."""
+        manager = ConfigManager(tmp_path)
+        manager.save({"model": "first"})
+        assert manager.load() is manager.load()
+
+        ConfigManager(tmp_path).save({"model": "second"})
+        stat = manager.config_file.stat()
+        os.utime(manager.config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert manager.load()["model"] == "second"
+
+    def test_convenience_functions_share_manager(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Should reuse one manager per config directory."""
+        monkeypatch.setattr(config_module, "get_config_dir", lambda: tmp_path)
+        monkeypatch.setattr(config_module, "_default_manager", None)
+
+        config_module.set_config_value("max_turns", 5)
+        manager = config_module._default_manager
+        assert config_module.get_config_value("max_turns") == 5
+        assert config_module._default_manager is manager
+
+        other_dir = tmp_path / "other"
+        monkeypatch.setattr(config_module, "get_config_dir", lambda: other_dir)
+        assert config_module.get_config_value("max_turns") == DEFAULT_CONFIG["max_turns"]
+        assert config_module._default_manager is not manager
+
     def test_get(self, tmp_path: Path) -> None:
         """Should get config value."""
         manager = ConfigManager(tmp_path)
@@ -255,6 +593,29 @@ class TestConfigCommand:
         assert result.success is True
         assert manager.get("verbose") == DEFAULT_CONFIG["verbose"]
 
+    @pytest.mark.asyncio
+    async def test_execute_set_coerces_to_key_type(self, formatter, tmp_path: Path) -> None:
+        """Should convert values to the type of the key's default."""
+        manager = ConfigManager(tmp_path)
+        cmd = ConfigCommand(formatter, manager)
+
+        await cmd.execute(ConfigOptions(project_dir=tmp_path, key="model", value="123"))
+        await cmd.execute(ConfigOptions(project_dir=tmp_path, key="max_turns", value="5"))
+        await cmd.execute(ConfigOptions(project_dir=tmp_path, key="auto_fix", value="TRUE"))
+        await cmd.execute(ConfigOptions(project_dir=tmp_path, key="custom", value="7"))
+
+        assert manager.get("model") == "123"
+        assert manager.get("max_turns") == 5
+        assert manager.get("auto_fix") is True
+        assert manager.get("custom") == 7
+
+    def test_coerce_value_falls_back(self, formatter) -> None:
+        """Should parse generically when a value does not fit the key's type."""
+        cmd = ConfigCommand(formatter)
+        assert cmd._coerce_value("yes", bool) == "yes"
+        assert cmd._coerce_value("2.5", int) == 2.5
+        assert cmd._coerce_value("3", float) == 3.0
+
     def test_parse_value_bool(self, formatter) -> None:
         """Should parse boolean values."""
         cmd = ConfigCommand(formatter)
@@ -276,6 +637,20 @@ class TestConfigCommand:
         cmd = ConfigCommand(formatter)
         assert cmd._parse_value("hello") == "hello"
 
+    def test_parse_value_edge_cases(self, formatter) -> None:
+        """Should match int()/float() on forms the fast paths do not cover."""
+        cmd = ConfigCommand(formatter)
+        assert cmd._parse_value("TRUE") is True
+        assert cmd._parse_value(" 12 ") == 12
+        assert cmd._parse_value("+3") == 3
+        assert cmd._parse_value("1_000") == 1000
+        assert cmd._parse_value(".5") == 0.5
+        assert cmd._parse_value("1e5") == 1e5
+        assert cmd._parse_value("-inf") == float("-inf")
+        assert cmd._parse_value("information") == "information"
+        assert cmd._parse_value("claude-sonnet") == "claude-sonnet"
+        assert cmd._parse_value("1.2.3") == "1.2.3"
+
 
 class TestQACommand:
     """Tests for QACommand class."""
@@ -311,6 +686,34 @@ class TestQACommand:
 
         assert result.success is True
 
+    @pytest.mark.asyncio
+    async def test_execute_batches_progress_logs(self, formatter, tmp_path: Path) -> None:
+        """Should write queued progress logs in order by the time execute returns."""
+        cmd = QACommand(formatter)
+        (tmp_path / ".claude-god-code" / "specs" / "001-test").mkdir(parents=True)
+
+        def make_loop(project_dir, spec_dir, config):
+            async def run():
+                for iteration in range(1, 4):
+                    config.on_phase_change(QAPhase.REVIEW, f"review {iteration}")
+                    config.on_iteration_complete(iteration, "rejected")
+                return MagicMock(is_approved=True, current_iteration=3)
+
+            loop = MagicMock()
+            loop.run = run
+            return loop
+
+        with patch('cli.commands.qa.QALoop', side_effect=make_loop), \
+                patch('cli.commands.qa.QALoopConfig', side_effect=SimpleNamespace), \
+                patch.object(formatter, 'stream_log_batch', wraps=formatter.stream_log_batch) as batch:
+            result = await cmd.execute(QAOptions(project_dir=tmp_path, spec_name="001"))
+
+        assert result.approved is True
+        assert batch.call_count == 1
+        output = formatter.config.stream.getvalue()
+        assert output.index("review 1") < output.index("Iteration 1 complete") < output.index("review 3")
+        assert cmd._log_queue is None
+
     def test_find_spec_dir_exact(self, formatter, tmp_path: Path) -> None:
         """Should find spec by exact name."""
         cmd = QACommand(formatter)
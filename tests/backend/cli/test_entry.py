@@ -5,6 +5,7 @@ Part of Claude God Code - Autonomous Excellence
 """
 
 import argparse
+import subprocess
 import sys
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -17,6 +18,7 @@ from cli.entry import (
     create_parser,
     CLIApplication,
     main,
+    HELP_TEXT,
     VERSION,
 )
 
@@ -234,6 +236,29 @@ class TestCLIApplicationAsync:
         result = await app.run()
         assert result == 0
 
+    @pytest.mark.asyncio
+    async def test_run_writes_scheduled_saves(self, basic_args, tmp_path: Path) -> None:
+        """Should have background session saves on disk once run() returns."""
+        from agents.session import SessionStore
+
+        basic_args.project_dir = tmp_path
+        app = CLIApplication(basic_args)
+        created = []
+
+        async def dispatch() -> int:
+            orchestrator = app._init_orchestrator()
+            session = orchestrator.create_session("Add feature")
+            await orchestrator.start_session(session.session_id)
+            await orchestrator.update_session_phase(session.session_id, "implementation", "Coding")
+            created.append(session.session_id)
+            return 0
+
+        app._dispatch = dispatch
+        assert await app.run() == 0
+
+        saved = SessionStore(app._orchestrator.sessions_dir).load(created[0])
+        assert saved.phase == "implementation"
+
     @pytest.mark.asyncio
     async def test_run_list_specs(self, basic_args, tmp_path: Path) -> None:
         """Should list specs."""
@@ -326,17 +351,65 @@ class TestFindSpecDir:
 class TestMainFunction:
     """Tests for main function."""
 
-    def test_main_help(self) -> None:
-        """Should show help and exit."""
+    def test_main_help(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should show help without building the parser."""
+        with patch("cli.entry.create_parser") as mock_parser:
+            assert main(["--help"]) == 0
+            assert main(["-h"]) == 0
+            assert main([]) == 0
+        mock_parser.assert_not_called()
+        assert "usage: claude-god-code" in capsys.readouterr().out
+
+    def test_main_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should show version without building the parser."""
+        with patch("cli.entry.create_parser") as mock_parser:
+            assert main(["--version"]) == 0
+            assert main(["-V"]) == 0
+        mock_parser.assert_not_called()
+        assert capsys.readouterr().out == f"claude-god-code {VERSION}\n" * 2
+
+    def test_version_after_other_options(self) -> None:
+        """Should still let argparse handle --version after other options."""
         with pytest.raises(SystemExit) as exc_info:
-            main(["--help"])
+            main(["--verbose", "--version"])
         assert exc_info.value.code == 0
 
-    def test_main_version(self) -> None:
-        """Should show version and exit."""
-        with pytest.raises(SystemExit) as exc_info:
-            main(["--version"])
-        assert exc_info.value.code == 0
+    def test_help_text_lists_every_option(self) -> None:
+        """Static help should mention every option the parser accepts."""
+        parser = create_parser()
+        for action in parser._actions:
+            for option in action.option_strings:
+                assert option in HELP_TEXT, option
+
+
+class TestLazyImports:
+    """Tests for deferred domain imports."""
+
+    def test_import_does_not_load_domain_modules(self) -> None:
+        """Should import the entry point without the spec, qa, agent or core layers."""
+        backend = Path(__file__).parent.parent.parent.parent / "apps" / "backend"
+        code = (
+            "import sys; import cli.entry; "
+            "print(sorted(m for m in sys.modules "
+            "if m.split('.')[0] in ('agents', 'core', 'qa', 'spec') or m == 'cli.formatter'))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=backend,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_package_attributes(self) -> None:
+        """Should still expose the formatter and commands from the cli package."""
+        import cli
+
+        assert cli.TerminalFormatter.__name__ == "TerminalFormatter"
+        assert cli.StatusCommand.__name__ == "StatusCommand"
+        with pytest.raises(AttributeError):
+            cli.NotAThing
 
 
 class TestVersion:
@@ -177,6 +177,17 @@ class TestTerminalFormatterOutput:
         assert "Item one" in output
         assert "*" in output
 
+    def test_bullets_output(self, formatter_with_buffer) -> None:
+        """Should output bullets matching bullet() line by line."""
+        formatter, buffer = formatter_with_buffer
+        formatter.bullets(["one", "two"])
+        formatter.bullets([])
+        expected = io.StringIO()
+        single = TerminalFormatter(FormatterConfig(use_colors=False, use_unicode=False, stream=expected))
+        single.bullet("one")
+        single.bullet("two")
+        assert buffer.getvalue() == expected.getvalue()
+
     def test_key_value_output(self, formatter_with_buffer) -> None:
         """Should output key-value pair."""
         formatter, buffer = formatter_with_buffer
@@ -186,6 +197,42 @@ class TestTerminalFormatterOutput:
         assert "Value" in output
 
 
+
+class TestBufferedOutput:
+    """Tests for buffered output."""
+
+    def test_buffered_writes_once_on_exit(self) -> None:
+        """Should hold output until the block ends, then write it in one call."""
+        stream = io.StringIO()
+        writes: list[str] = []
+        original_write = stream.write
+        stream.write = lambda text: writes.append(text) or original_write(text)
+        formatter = TerminalFormatter(FormatterConfig(use_colors=False, use_unicode=False, stream=stream))
+
+        with formatter.buffered():
+            formatter.section("Specs")
+            for name in ("one", "two", "three"):
+                formatter.bullet(name)
+            assert stream.getvalue() == ""
+
+        assert len(writes) == 1
+        assert "Specs" in stream.getvalue()
+        assert stream.getvalue().index("one") < stream.getvalue().index("three")
+
+    def test_nested_buffered_writes_at_outer_exit(self) -> None:
+        """Should only write when the outermost buffered block ends."""
+        buffer = io.StringIO()
+        formatter = TerminalFormatter(FormatterConfig(use_colors=False, use_unicode=False, stream=buffer))
+
+        with formatter.buffered():
+            with formatter.buffered():
+                formatter.info("inner")
+            assert buffer.getvalue() == ""
+
+        assert "inner" in buffer.getvalue()
+        formatter.info("after")
+        assert "after" in buffer.getvalue()
+
 class TestImpactAnalysisFormatting:
     """Tests for Impact Analysis formatting."""
 
@@ -407,6 +454,13 @@ class TestStreamLog:
         assert "[INFO]" in output
         assert "Processing file" in output
 
+    def test_stream_log_batch(self, formatter_with_buffer) -> None:
+        """Should stream every batched entry in order."""
+        formatter, buffer = formatter_with_buffer
+        formatter.stream_log_batch([("first", "info"), ("second", "error")])
+        output = buffer.getvalue()
+        assert output.index("[INFO] first") < output.index("[ERROR] second")
+
     def test_stream_log_error(self, formatter_with_buffer) -> None:
         """Should stream error log."""
         formatter, buffer = formatter_with_buffer
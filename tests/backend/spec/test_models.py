@@ -4,6 +4,7 @@ Tests for spec.models module.
 Part of Claude God Code - Autonomous Excellence
 """
 
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -28,8 +29,10 @@ from spec.models import (
     ServiceInfo,
     WorkflowType,
     create_spec_dir,
+    find_spec_dir,
     generate_spec_name,
     get_specs_dir,
+    list_spec_dirs,
 )
 
 
@@ -253,6 +256,67 @@ class TestCreateSpecDir:
         spec_dir = create_spec_dir(specs_dir)
         assert spec_dir.name.startswith("002-")
 
+    def test_recreates_removed_specs_dir(self, tmp_path: Path) -> None:
+        """Should still create a spec after the specs dir was removed."""
+        specs_dir = tmp_path / "specs"
+        first = create_spec_dir(specs_dir)
+        first.rmdir()
+        specs_dir.rmdir()
+
+        spec_dir = create_spec_dir(specs_dir)
+        assert spec_dir.is_dir()
+        assert spec_dir.name.startswith("001-")
+
+
+class TestFindSpecDir:
+    """Tests for find_spec_dir and list_spec_dirs functions."""
+
+    def test_missing_specs_dir(self, tmp_path: Path) -> None:
+        """Should return nothing when the specs directory does not exist."""
+        specs_dir = tmp_path / "specs"
+        assert find_spec_dir(specs_dir, "001") is None
+        assert list_spec_dirs(specs_dir) == []
+
+    def test_finds_by_name_and_number(self, tmp_path: Path) -> None:
+        """Should find specs by exact name or by number prefix."""
+        specs_dir = tmp_path / "specs"
+        spec_dir = specs_dir / "001-auth"
+        spec_dir.mkdir(parents=True)
+        (specs_dir / "notes.txt").write_text("not a spec")
+
+        assert find_spec_dir(specs_dir, "001-auth") == spec_dir
+        assert find_spec_dir(specs_dir, "001") == spec_dir
+        assert find_spec_dir(specs_dir, "notes") is None
+        assert list_spec_dirs(specs_dir) == [spec_dir]
+
+    def test_prefers_exact_then_prefix_then_substring(self, tmp_path: Path) -> None:
+        """Should resolve exact names before dash prefixes before substrings."""
+        specs_dir = tmp_path / "specs"
+        for name in ("001-add", "001-add-auth", "002-fix-login"):
+            (specs_dir / name).mkdir(parents=True)
+
+        assert find_spec_dir(specs_dir, "001-add") == specs_dir / "001-add"
+        assert find_spec_dir(specs_dir, "001") == specs_dir / "001-add"
+        assert find_spec_dir(specs_dir, "002-fix") == specs_dir / "002-fix-login"
+        assert find_spec_dir(specs_dir, "login") == specs_dir / "002-fix-login"
+        assert find_spec_dir(specs_dir, "missing") is None
+
+    def test_cache_invalidated_by_new_spec(self, tmp_path: Path) -> None:
+        """Should see specs added after a lookup was cached."""
+        specs_dir = tmp_path / "specs"
+        first = specs_dir / "001-first"
+        first.mkdir(parents=True)
+        assert find_spec_dir(specs_dir, "002") is None
+        assert list_spec_dirs(specs_dir) == [first]
+
+        second = specs_dir / "002-second"
+        second.mkdir()
+        stat = specs_dir.stat()
+        os.utime(specs_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert find_spec_dir(specs_dir, "002") == second
+        assert list_spec_dirs(specs_dir) == [first, second]
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])